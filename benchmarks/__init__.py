@@ -0,0 +1,4 @@
+"""Performance benchmarks for the medical calculators package.
+
+Each module is runnable on its own, e.g. ``python -m benchmarks.bench_range_rule``.
+"""
@@ -0,0 +1,66 @@
+"""Benchmark Calculator.calculate against Calculator.calculate_batch for the BMI examples.
+
+Reports rows/sec for the per-row and vectorized batch paths. Input rows are built
+up front and excluded from the timings.
+
+Usage:
+    python -m benchmarks.bench_calculate_batch [--rows 1000 100000 1000000]
+"""
+import argparse
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits, BMI_CALCULATOR_WITH_UNITS
+from mc4llm.models.base import ureg
+
+
+def make_simple_inputs(weights: np.ndarray, heights: np.ndarray) -> List[BMIInput]:
+    return [BMIInput(weight=w, height=h) for w, h in zip(weights.tolist(), heights.tolist())]
+
+
+def make_unit_inputs(weights: np.ndarray, heights: np.ndarray) -> List[BMIInputWithUnits]:
+    # Rows are constructed without re-running unit conversion; only the calculators are timed.
+    kilogram = ureg.Unit("kilogram")
+    meter = ureg.Unit("meter")
+    return [
+        BMIInputWithUnits.model_construct(weight=ureg.Quantity(w, kilogram), height=ureg.Quantity(h, meter))
+        for w, h in zip(weights.tolist(), heights.tolist())
+    ]
+
+
+def rows_per_second(fn: Callable[[], object], rows: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return rows / (time.perf_counter() - start)
+
+
+def run(row_counts: List[int]) -> None:
+    rng = np.random.default_rng(0)
+    cases = [
+        ("simple", SIMPLE_WHO_BMI_CALCULATOR, make_simple_inputs),
+        ("with_units", BMI_CALCULATOR_WITH_UNITS, make_unit_inputs),
+    ]
+    print(f"{'calculator':>12} {'rows':>10} {'scalar rows/s':>15} {'batch rows/s':>15} {'speed-up':>10}")
+    for rows in row_counts:
+        weights = rng.uniform(40, 150, size=rows)
+        heights = rng.uniform(1.4, 2.1, size=rows)
+        for label, calculator, make_inputs in cases:
+            inputs = make_inputs(weights, heights)
+            scalar = rows_per_second(lambda: [calculator.calculate(row) for row in inputs], rows)
+            batch = rows_per_second(lambda: calculator.calculate_batch(inputs), rows)
+            print(f"{label:>12} {rows:>10} {scalar:>15,.0f} {batch:>15,.0f} {batch / scalar:>9.1f}x")
+            del inputs
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
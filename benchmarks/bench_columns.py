@@ -0,0 +1,69 @@
+"""Benchmark re-scoring a cohort from CSV against memory-mapped column files.
+
+Writes the same cohort once as CSV and once with ``ColumnarBatch.save``, then
+times a re-run of the simple BMI calculator from each: parsing the CSV into
+columns versus memory-mapping the saved columns, followed by the same
+``calculate_results`` call and a save of the results.
+
+Usage:
+    python -m benchmarks.bench_columns [--rows 1000000]
+"""
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from mc4llm.example_calculators.bmi.simple_bmi import SIMPLE_WHO_BMI_CALCULATOR, BMIInput
+from mc4llm.models import ColumnarBatch
+
+
+def from_csv(path: Path) -> ColumnarBatch:
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        next(reader)
+        weight, height = [], []
+        for row in reader:
+            weight.append(float(row[0]))
+            height.append(float(row[1]))
+    return BMIInput.columnar(weight=np.array(weight), height=np.array(height))
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def run(rows: int) -> None:
+    rng = np.random.default_rng(0)
+    cohort = BMIInput.columnar(weight=rng.uniform(40, 150, rows), height=rng.uniform(1.4, 2.1, rows))
+    calculator = SIMPLE_WHO_BMI_CALCULATOR
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        np.savetxt(
+            root / "cohort.csv", np.column_stack([cohort["weight"], cohort["height"]]),
+            delimiter=",", header="weight,height", comments="", fmt="%.17g"
+        )
+        cohort.save(root / "cohort")
+
+        print(f"{'source':<8} {'load s':>8} {'score s':>8} {'save s':>8} {'total s':>8}")
+        for name, load in (("csv", lambda: from_csv(root / "cohort.csv")), ("columns", lambda: ColumnarBatch.load(root / "cohort", BMIInput))):
+            batch, load_time = timed(load)
+            results, score_time = timed(lambda: calculator.calculate_results(batch))
+            _, save_time = timed(lambda: results.save(root / f"scores-{name}"))
+            total = load_time + score_time + save_time
+            print(f"{name:<8} {load_time:>8.3f} {score_time:>8.3f} {save_time:>8.3f} {total:>8.3f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
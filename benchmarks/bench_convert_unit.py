@@ -0,0 +1,78 @@
+"""Benchmark cached convert_unit plans against per-call pint conversion.
+
+Validates BMIInputWithUnits with mixed pound/kilogram and inch/centimetre
+traffic, and compares it to an otherwise identical model whose validators call
+``ureg.Quantity(value, unit).to(target)`` on every field.
+
+Usage:
+    python -m benchmarks.bench_convert_unit [--rows 20000]
+"""
+import argparse
+import random
+import timeit
+
+from pint import Quantity
+from pydantic import validator
+
+from mc4llm.models.base import IOModel, ureg, conversion_cache_info, clear_conversion_cache
+from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits
+
+
+def _uncached(target_unit: str, field_name: str):
+    """The original per-call pint conversion, kept as the reference implementation."""
+    @validator(field_name, pre=True, allow_reuse=True)
+    def wrapper(cls, v):
+        value, unit = v
+        return ureg.Quantity(value, unit).to(target_unit)
+    return wrapper
+
+
+class UncachedBMIInput(IOModel):
+    weight: Quantity
+    height: Quantity
+
+    convert_weight = _uncached("kilogram", "weight")
+    convert_height = _uncached("meter", "height")
+
+
+def run(rows: int, repeat: int) -> None:
+    rng = random.Random(0)
+    traffic = [
+        (
+            (rng.uniform(90, 330), "pound") if rng.random() < 0.5 else (rng.uniform(40, 150), "kilogram"),
+            (rng.uniform(55, 80), "inch") if rng.random() < 0.5 else (rng.uniform(140, 205), "centimeter"),
+        )
+        for _ in range(rows)
+    ]
+
+    for (weight, height) in traffic[:100]:
+        cached = BMIInputWithUnits(weight=weight, height=height)
+        reference = UncachedBMIInput(weight=weight, height=height)
+        assert abs(cached.weight.magnitude - reference.weight.magnitude) <= 1e-9 * reference.weight.magnitude
+        assert abs(cached.height.magnitude - reference.height.magnitude) <= 1e-9 * reference.height.magnitude
+
+    clear_conversion_cache()
+    uncached = min(timeit.repeat(
+        lambda: [UncachedBMIInput(weight=w, height=h) for w, h in traffic], number=1, repeat=repeat
+    ))
+    cached = min(timeit.repeat(
+        lambda: [BMIInputWithUnits(weight=w, height=h) for w, h in traffic], number=1, repeat=repeat
+    ))
+    info = conversion_cache_info()
+
+    print(f"rows: {rows}")
+    print(f"uncached: {uncached / rows * 1e6:8.2f} us/row")
+    print(f"cached:   {cached / rows * 1e6:8.2f} us/row  ({uncached / cached:.1f}x faster)")
+    print(f"cache:    hits={info.hits} misses={info.misses} size={info.currsize}/{info.maxsize}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
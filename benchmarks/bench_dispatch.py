@@ -0,0 +1,64 @@
+"""Benchmark tool-call dispatch from raw JSON against the dict round-trip.
+
+The baseline decodes each call's arguments with json.loads, builds the input
+model, calls calculate, then model_dump and json.dumps the output. The fast
+path is ``dispatch_tool_calls``. Reports tool calls/sec for LLM responses
+with different numbers of calls.
+
+Usage:
+    python -m benchmarks.bench_dispatch [--calls 1 8 64] [--responses 2000]
+"""
+import argparse
+import json
+import time
+from typing import List
+
+import numpy as np
+
+from mc4llm.registry import ToolCall, default_registry, dispatch_tool_calls
+
+
+def make_calls(count: int, rng: np.random.Generator) -> List[ToolCall]:
+    return [
+        ToolCall(f"call_{i}", "simple_who_bmi", json.dumps({"weight": w, "height": h}))
+        for i, (w, h) in enumerate(zip(rng.uniform(40, 150, count).tolist(), rng.uniform(1.4, 2.1, count).tolist()))
+    ]
+
+
+def round_trip(calls: List[ToolCall]) -> List[str]:
+    registry = default_registry()
+    results = []
+    for call in calls:
+        calculator = registry.get(call.name)
+        output = calculator.calculate(calculator.input_model(**json.loads(call.arguments)))
+        results.append(json.dumps(output.model_dump()))
+    return results
+
+
+def run(call_counts: List[int], responses: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"{'calls':>6} {'round-trip calls/s':>19} {'dispatch calls/s':>17} {'speed-up':>9}")
+    for count in call_counts:
+        batches = [make_calls(count, rng) for _ in range(responses)]
+        dispatch_tool_calls(batches[0])
+        start = time.perf_counter()
+        for calls in batches:
+            round_trip(calls)
+        slow = count * responses / (time.perf_counter() - start)
+        start = time.perf_counter()
+        for calls in batches:
+            dispatch_tool_calls(calls)
+        fast = count * responses / (time.perf_counter() - start)
+        print(f"{count:>6} {slow:>19,.0f} {fast:>17,.0f} {fast / slow:>8.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--responses", type=int, default=2_000)
+    args = parser.parse_args()
+    run(args.calls, args.responses)
+
+
+if __name__ == "__main__":
+    main()
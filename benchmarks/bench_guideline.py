@@ -0,0 +1,56 @@
+"""Benchmark building and querying guidelines as they grow.
+
+Reports the time to add N formulas and N rules to a guideline (duplicate name
+checks included) and the cost of a get_formula/get_rule lookup.
+
+Usage:
+    python -m benchmarks.bench_guideline [--sizes 10 100 1000 10000]
+"""
+import argparse
+import random
+import time
+import timeit
+from typing import List
+
+from mc4llm.guideline import BaseGuideline
+from mc4llm.formula import BaseFormula
+from mc4llm.rule import RangeRule
+
+
+class ConstantFormula(BaseFormula):
+    def calculate(self) -> float:
+        return 1.0
+
+
+def run(sizes: List[int], lookups: int) -> None:
+    rng = random.Random(0)
+    print(f"{'entries':>8} {'build ms':>10} {'get_formula ns':>15} {'get_rule ns':>12}")
+    for size in sizes:
+        formulas = [ConstantFormula(name=f"formula_{i}") for i in range(size)]
+        rules = [RangeRule(thresholds={"in": (0, 1)}, name=f"rule_{i}") for i in range(size)]
+
+        start = time.perf_counter()
+        guideline = BaseGuideline(rules=rules, formulas=formulas)
+        build = time.perf_counter() - start
+
+        formula_names = [f"formula_{rng.randrange(size)}" for _ in range(lookups)]
+        rule_names = [f"rule_{rng.randrange(size)}" for _ in range(lookups)]
+        get_formula = min(timeit.repeat(
+            lambda: [guideline.get_formula(name) for name in formula_names], number=1, repeat=3
+        ))
+        get_rule = min(timeit.repeat(
+            lambda: [guideline.get_rule(name) for name in rule_names], number=1, repeat=3
+        ))
+        print(f"{size:>8} {build * 1e3:>10.2f} {get_formula / lookups * 1e9:>15.1f} {get_rule / lookups * 1e9:>12.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000, 10_000])
+    parser.add_argument("--lookups", type=int, default=10_000)
+    args = parser.parse_args()
+    run(args.sizes, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark the overhead of per-stage latency instrumentation.
+
+Times the end-to-end path of the unit-converting BMI calculator (validate the
+input with unit conversion, calculate, build the output) before instrumentation
+was ever switched on, after it was switched on and off again, and with a no-op
+and a histogram sink installed.
+
+Usage:
+    python -m benchmarks.bench_instrumentation [--calls 20000] [--repeats 5]
+"""
+import argparse
+import time
+
+from mc4llm.instrumentation import HistogramSink, instrument
+from mc4llm.example_calculators.bmi.bmi_with_units import BMI_CALCULATOR_WITH_UNITS, BMIInputWithUnits
+
+
+def end_to_end() -> None:
+    data = BMIInputWithUnits(weight=(150, "pound"), height=(170, "centimeter"))
+    BMI_CALCULATOR_WITH_UNITS.calculate(data)
+
+
+def time_per_call(calls: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        for _ in range(calls):
+            end_to_end()
+        best = min(best, (time.perf_counter_ns() - start) / calls)
+    return best
+
+
+def run(calls: int, repeats: int) -> None:
+    end_to_end()
+    never = time_per_call(calls, repeats)
+    with instrument(lambda stage, name, elapsed_ns: None):
+        noop = time_per_call(calls, repeats)
+    off = time_per_call(calls, repeats)
+    histogram = HistogramSink()
+    with instrument(histogram):
+        recorded = time_per_call(calls, repeats)
+
+    print(f"{'instrumentation':<22} {'ns/call':>9} {'overhead':>9}")
+    for label, ns in [
+        ("never enabled", never), ("switched off", off), ("no-op sink", noop), ("histogram sink", recorded)
+    ]:
+        print(f"{label:<22} {ns:>9,.0f} {ns / never - 1:>+9.1%}")
+
+    print(f"\n{'stage':<18} {'name':<36} {'calls':>8} {'p50 ns':>9} {'p99 ns':>9}")
+    for (stage, name), row in histogram.summary().items():
+        print(f"{stage:<18} {name:<36} {row['count']:>8} {row['p50_ns']:>9,} {row['p99_ns']:>9,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.calls, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark the ways a calculator can build its output models.
+
+For each example calculator, times building one output with the model's
+``__init__`` (what the calculators did before ``build_output``), with
+``build_output`` through pydantic-core validation (the default) and with
+``build_output`` on trusted outputs (``model_construct``). It then times
+``calculate`` on pre-validated inputs and ``calculate_batch`` with outputs
+validated and trusted.
+
+Usage:
+    python -m benchmarks.bench_outputs [--calls 20000] [--rows 100000] [--repeats 5]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from mc4llm.example_calculators.bmi.simple_bmi import SIMPLE_WHO_BMI_CALCULATOR, BMIInput
+from mc4llm.example_calculators.bmi.bmi_with_units import BMI_CALCULATOR_WITH_UNITS, BMIInputWithUnits
+
+
+def best_of(fn, count: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        fn()
+        best = min(best, time.perf_counter_ns() - start)
+    return best / count
+
+
+def run(calls: int, rows: int, repeats: int) -> None:
+    rng = np.random.default_rng(0)
+    weights = rng.uniform(40, 150, rows).tolist()
+    heights = rng.uniform(1.4, 2.1, rows).tolist()
+    cases = [
+        ("simple_bmi", SIMPLE_WHO_BMI_CALCULATOR, BMIInput.columnar(weight=weights, height=heights),
+         BMIInput(weight=70, height=1.75)),
+        ("bmi_with_units", BMI_CALCULATOR_WITH_UNITS, BMIInputWithUnits.columnar(weight=weights, height=heights),
+         BMIInputWithUnits(weight=(150, "pound"), height=(170, "centimeter"))),
+    ]
+    print(f"{'calculator':<16} {'path':<16} {'__init__':>10} {'validated':>10} {'trusted':>10}")
+    for name, calculator, batch, row in cases:
+        model = calculator.output_model
+
+        def init():
+            for _ in range(calls):
+                model(bmi=22.9, category="Normal weight")
+
+        def build():
+            for _ in range(calls):
+                calculator.build_output(bmi=22.9, category="Normal weight")
+
+        def single():
+            for _ in range(calls):
+                calculator.calculate(row)
+
+        def many():
+            calculator.calculate_batch(batch)
+
+        for path, fn, count in [("build_output", build, calls), ("calculate", single, calls),
+                                ("calculate_batch", many, rows)]:
+            timings = {}
+            for trusted in (False, True):
+                calculator.trust_outputs = trusted
+                timings[trusted] = best_of(fn, count, repeats)
+            del calculator.trust_outputs
+            before = f"{best_of(init, calls, repeats):>7,.0f} ns" if path == "build_output" else f"{'':>10}"
+            print(f"{name:<16} {path:<16} {before} {timings[False]:>7,.0f} ns {timings[True]:>7,.0f} ns")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.calls, args.rows, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
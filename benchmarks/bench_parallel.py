@@ -0,0 +1,55 @@
+"""Benchmark multi-process batch scoring against single-process calculate_columns.
+
+Reports rows/sec of ``parallel_calculate_columns`` at several worker counts.
+Columns are built up front; pool start-up and the shared-memory copies are
+included in the timings, since every call pays them.
+
+Usage:
+    python -m benchmarks.bench_parallel [--rows 1000000 10000000] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import time
+from typing import Callable, List
+
+import numpy as np
+
+from mc4llm.calculator.parallel import parallel_calculate_columns
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+
+
+def rows_per_second(fn: Callable[[], object], rows: int) -> float:
+    start = time.perf_counter()
+    fn()
+    return rows / (time.perf_counter() - start)
+
+
+def run(row_counts: List[int], worker_counts: List[int], chunk_size: int) -> None:
+    rng = np.random.default_rng(0)
+    print(f"CPUs available: {os.cpu_count()}")
+    print(f"{'rows':>10} {'workers':>8} {'rows/s':>15} {'vs serial':>10}")
+    for rows in row_counts:
+        batch = BMIInput.columnar(weight=rng.uniform(40, 150, size=rows), height=rng.uniform(1.4, 2.1, size=rows))
+        serial = rows_per_second(lambda: SIMPLE_WHO_BMI_CALCULATOR.calculate_columns(batch), rows)
+        print(f"{rows:>10} {'serial':>8} {serial:>15,.0f} {1:>9.1f}x")
+        for workers in worker_counts:
+            parallel = rows_per_second(
+                lambda: parallel_calculate_columns(
+                    SIMPLE_WHO_BMI_CALCULATOR, batch, workers=workers, chunk_size=chunk_size
+                ),
+                rows
+            )
+            print(f"{rows:>10} {workers:>8} {parallel:>15,.0f} {parallel / serial:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.rows, args.workers, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark RangeRule.categorize against a linear scan as the number of bands grows.
+
+Usage:
+    python -m benchmarks.bench_range_rule [--bands 4 16 64 256 1024] [--values 20000]
+"""
+import argparse
+import random
+import timeit
+from typing import Dict, List, Tuple
+
+from mc4llm.rule import RangeRule
+
+
+def make_thresholds(bands: int) -> Dict[str, Tuple[float, float]]:
+    """Build contiguous bands over [0, bands) with an open-ended last band."""
+    thresholds = {f"band_{i}": (float(i), float(i + 1)) for i in range(bands - 1)}
+    thresholds[f"band_{bands - 1}"] = (float(bands - 1), float("inf"))
+    return thresholds
+
+
+def linear_categorize(thresholds: Dict[str, Tuple[float, float]], default_category: str, value: float) -> str:
+    """The original dictionary scan, kept as the reference implementation."""
+    for category, (min_val, max_val) in thresholds.items():
+        if min_val <= value < max_val:
+            return category
+    return default_category
+
+
+def run(band_counts: List[int], n_values: int, repeat: int) -> None:
+    rng = random.Random(0)
+    print(f"{'bands':>8} {'linear ns/call':>16} {'bisect ns/call':>16} {'speed-up':>10}")
+    for bands in band_counts:
+        thresholds = make_thresholds(bands)
+        rule = RangeRule(thresholds=thresholds, name="bench")
+        values = [rng.uniform(-1, bands + 1) for _ in range(n_values)]
+
+        for value in values:
+            assert rule.categorize(value) == linear_categorize(thresholds, rule.default_category, value)
+
+        linear = min(timeit.repeat(
+            lambda: [linear_categorize(thresholds, "Unknown", v) for v in values],
+            number=1, repeat=repeat
+        ))
+        compiled = min(timeit.repeat(
+            lambda: [rule.categorize(v) for v in values],
+            number=1, repeat=repeat
+        ))
+        print(f"{bands:>8} {linear / n_values * 1e9:>16.1f} {compiled / n_values * 1e9:>16.1f} {linear / compiled:>9.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--bands", type=int, nargs="+", default=[4, 16, 64, 256, 1024])
+    parser.add_argument("--values", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    run(args.bands, args.values, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
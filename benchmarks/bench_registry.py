@@ -0,0 +1,60 @@
+"""Benchmark building and querying a calculator registry as the catalog grows.
+
+Registers synthetic manifests of increasing size and reports the time to load
+the manifest, list the catalog and look up one calculator spec. No calculator
+is imported.
+
+Usage:
+    python -m benchmarks.bench_registry [--sizes 10 1000 10000]
+"""
+import argparse
+import time
+from typing import List
+
+from mc4llm.registry import CalculatorRegistry
+
+
+def make_manifest(size: int) -> dict:
+    return {"calculators": [
+        {
+            "id": f"calculator_{i}",
+            "version": "1.0.0",
+            "target": f"vendor.calculators.c{i}:CALCULATOR",
+            "title": f"Calculator {i}",
+            "description": "Synthetic catalog entry",
+        }
+        for i in range(size)
+    ]}
+
+
+def run(sizes: List[int], lookups: int) -> None:
+    print(f"{'size':>8} {'load ms':>10} {'list ms':>10} {'lookup us':>10}")
+    for size in sizes:
+        manifest = make_manifest(size)
+        registry = CalculatorRegistry()
+        start = time.perf_counter()
+        registry.load_manifest(manifest)
+        load = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        registry.specs()
+        listing = time.perf_counter() - start
+        
+        target = f"calculator_{size // 2}"
+        start = time.perf_counter()
+        for _ in range(lookups):
+            registry.spec(target)
+        lookup = (time.perf_counter() - start) / lookups
+        print(f"{size:>8} {load * 1e3:>10.2f} {listing * 1e3:>10.2f} {lookup * 1e6:>10.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 10_000])
+    parser.add_argument("--lookups", type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.sizes, args.lookups)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark result batches against lists of output models.
+
+Scores a cohort with the simple BMI calculator and compares ``calculate_batch``,
+which returns one pydantic object per row, with ``calculate_results``, which
+keeps the results as NumPy columns. Reports wall time and the peak memory
+traced while the results are built.
+
+Usage:
+    python -m benchmarks.bench_results [--rows 1000000]
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+
+import numpy as np
+
+from mc4llm.example_calculators.bmi.simple_bmi import SIMPLE_WHO_BMI_CALCULATOR, BMIInput
+
+
+def measure(fn):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def run(rows: int) -> None:
+    rng = np.random.default_rng(0)
+    batch = BMIInput.columnar(weight=rng.uniform(40, 150, rows), height=rng.uniform(1.4, 2.1, rows))
+    calculator = SIMPLE_WHO_BMI_CALCULATOR
+
+    _, list_time, list_peak = measure(lambda: calculator.calculate_batch(batch))
+    results, batch_time, batch_peak = measure(lambda: calculator.calculate_results(batch))
+
+    print(f"{'rows':>9} {'output':<14} {'seconds':>8} {'peak MiB':>9}")
+    print(f"{rows:>9} {'list':<14} {list_time:>8.3f} {list_peak / 2**20:>9.1f}")
+    print(f"{rows:>9} {'ResultBatch':<14} {batch_time:>8.3f} {batch_peak / 2**20:>9.1f}")
+    print(f"\nResultBatch columns hold {results.nbytes / 2**20:.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark building an LLM tool list from pydantic versus the cached strict schemas.
+
+Registers the built-in calculators under many ids to mimic a large catalog and
+times one full tool list per request, both regenerating the schemas with
+pydantic and serving the cached, pre-serialized definitions.
+
+Usage:
+    python -m benchmarks.bench_schema [--catalog 10 100 1000] [--requests 20]
+"""
+import argparse
+import json
+import time
+from typing import List
+
+from mc4llm.registry import BUILTIN_MANIFEST, CalculatorRegistry, CalculatorSpec
+
+
+def make_registry(size: int) -> CalculatorRegistry:
+    with open(BUILTIN_MANIFEST, encoding="utf-8") as f:
+        builtin = json.load(f)["calculators"]
+    registry = CalculatorRegistry()
+    for i in range(size):
+        entry = dict(builtin[i % len(builtin)], id=f"calculator_{i}")
+        registry.register(CalculatorSpec.from_dict(entry))
+    return registry
+
+
+def regenerate(registry: CalculatorRegistry) -> bytes:
+    tools = []
+    for spec in registry.specs():
+        calculator = registry.get(spec.id)
+        tools.append({"type": "function", "function": {
+            "name": spec.id, "description": spec.description,
+            "parameters": calculator.input_model.model_json_schema(),
+        }})
+        calculator.output_model.model_json_schema()
+    return json.dumps(tools).encode()
+
+
+def run(sizes: List[int], requests: int) -> None:
+    print(f"{'catalog':>8} {'pydantic ms':>12} {'cached ms':>10} {'speed-up':>9}")
+    for size in sizes:
+        registry = make_registry(size)
+        registry.tools_bytes()
+        start = time.perf_counter()
+        for _ in range(requests):
+            regenerate(registry)
+        slow = (time.perf_counter() - start) / requests
+        start = time.perf_counter()
+        for _ in range(requests):
+            registry.tools_bytes()
+        fast = (time.perf_counter() - start) / requests
+        print(f"{size:>8} {slow * 1e3:>12.2f} {fast * 1e3:>10.3f} {slow / fast:>8.0f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--catalog", type=int, nargs="+", default=[10, 100, 1_000])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+    run(args.catalog, args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""Benchmark request rate and latency of the calculator registry server.
+
+Starts a local server in a subprocess (or targets --host/--port of a running
+one) and drives it from keep-alive connections for a fixed duration per
+scenario. Everything runs on localhost, so it can be used offline in CI.
+
+Usage:
+    python -m benchmarks.bench_server [--connections 1 16 64] [--duration 5] [--batch-size 100]
+"""
+import argparse
+import asyncio
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+INPUT = {"weight": 70.0, "height": 1.75}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def encode(method: str, path: str, payload: object = None) -> bytes:
+    body = b"" if payload is None else json.dumps(payload).encode()
+    return f"{method} {path} HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body
+
+
+async def read_response(reader: asyncio.StreamReader) -> int:
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+    await reader.readexactly(length)
+    return int(head.split(b" ", 2)[1])
+
+
+async def wait_ready(host: str, port: int, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(encode("GET", "/health"))
+            await read_response(reader)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def client(host: str, port: int, request: bytes, deadline: float, latencies: List[float], errors: List[int]) -> None:
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            writer.write(request)
+            status = await read_response(reader)
+            if status == 200:
+                latencies.append(time.perf_counter() - start)
+            else:
+                errors.append(status)
+    finally:
+        writer.close()
+
+
+async def scenario(host: str, port: int, request: bytes, connections: int, duration: float) -> Tuple[int, List[float], List[int]]:
+    latencies: List[float] = []
+    errors: List[int] = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(client(host, port, request, deadline, latencies, errors) for _ in range(connections)))
+    return len(latencies), latencies, errors
+
+
+def percentile(values: List[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else (values or [0.0])[0]
+
+
+async def run(host: str, port: int, connection_counts: List[int], duration: float, batch_size: int) -> None:
+    await wait_ready(host, port)
+    requests = [
+        ("calculate", encode("POST", "/calculators/simple_who_bmi/calculate", INPUT), 1),
+        (f"batch[{batch_size}]", encode("POST", "/calculators/simple_who_bmi/batch", [INPUT] * batch_size), batch_size),
+    ]
+    print(f"{'endpoint':>12} {'conns':>6} {'req/s':>10} {'rows/s':>12} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for label, request, rows in requests:
+        for connections in connection_counts:
+            count, latencies, errors = await scenario(host, port, request, connections, duration)
+            rate = count / duration
+            print(
+                f"{label:>12} {connections:>6} {rate:>10,.0f} {rate * rows:>12,.0f} "
+                f"{percentile(latencies, 50) * 1e3:>8.2f} {percentile(latencies, 99) * 1e3:>8.2f} {len(errors):>7}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None, help="Port of a running server; default starts one")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+    
+    process: Optional[subprocess.Popen] = None
+    port = args.port
+    if port is None:
+        port = free_port()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "mc4llm.server", "--host", args.host, "--port", str(port), "--max-pending", "1024"]
+        )
+    try:
+        asyncio.run(run(args.host, port, args.connections, args.duration, args.batch_size))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
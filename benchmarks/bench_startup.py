@@ -0,0 +1,69 @@
+"""Benchmark cold-start time of the package and of the shared unit registry.
+
+Each measurement runs in a fresh interpreter and reports the median over
+several runs:
+  - ``import mc4llm`` alone (the registry is not built),
+  - ``import mc4llm`` plus building the registry from pint's definitions,
+  - ``import mc4llm`` plus loading the registry from a pre-built disk cache.
+  
+Usage:
+    python -m benchmarks.bench_startup [--runs 7]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+_PROBE = """
+import json, time
+start = time.perf_counter()
+import mc4llm
+imported = time.perf_counter()
+if {build}:
+    from mc4llm.models.base import get_registry
+    get_registry()
+done = time.perf_counter()
+print(json.dumps({{"import": imported - start, "total": done - start}}))
+"""
+
+
+def measure(build: bool, env: Dict[str, str], runs: int) -> Dict[str, float]:
+    samples: List[Dict[str, float]] = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", _PROBE.format(build=build)],
+            capture_output=True, text=True, check=True, env={**os.environ, **env}
+        )
+        samples.append(json.loads(result.stdout))
+    return {key: statistics.median(sample[key] for sample in samples) for key in samples[0]}
+
+
+def run(runs: int) -> None:
+    with tempfile.TemporaryDirectory() as cache_folder:
+        from mc4llm.models.base import snapshot_registry
+        snapshot_registry(cache_folder)
+
+        cases = [
+            ("import only", False, {}),
+            ("import + registry", True, {}),
+            ("import + cached registry", True, {"MC4LLM_UNIT_CACHE": cache_folder}),
+        ]
+        print(f"{'case':>26} {'import ms':>10} {'total ms':>10}")
+        for label, build, env in cases:
+            timings = measure(build, env, runs)
+            print(f"{label:>26} {timings['import'] * 1e3:>10.1f} {timings['total'] * 1e3:>10.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+    run(args.runs)
+
+
+if __name__ == "__main__":
+    main()
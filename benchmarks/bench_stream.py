@@ -0,0 +1,83 @@
+"""Benchmark streaming calculation against a row-by-row loop.
+
+Scores a generator of raw dict rows with the simple BMI calculator, once with
+``validate + calculate`` per row and then with ``calculate_stream`` at several
+micro-batch sizes, yielding output models or one ``ResultBatch`` per batch. Every 100th row is invalid and goes to the error stream.
+Reports throughput and the peak memory traced while streaming.
+
+Usage:
+    python -m benchmarks.bench_stream [--rows 200000]
+"""
+import argparse
+import time
+import tracemalloc
+
+from mc4llm.example_calculators.bmi.simple_bmi import SIMPLE_WHO_BMI_CALCULATOR, BMIInput
+
+
+def source(rows: int):
+    for i in range(rows):
+        if i % 100 == 99:
+            yield {"weight": "unknown", "height": 1.75}
+        else:
+            yield {"weight": 40 + i % 110, "height": 1.5 + (i % 60) / 100}
+
+
+def row_by_row(rows: int) -> int:
+    count = 0
+    for data in source(rows):
+        try:
+            SIMPLE_WHO_BMI_CALCULATOR.calculate(BMIInput.model_validate(data))
+        except ValueError:
+            continue
+        count += 1
+    return count
+
+
+def streamed(rows: int, batch_size: int) -> int:
+    errors = []
+    count = 0
+    for _ in SIMPLE_WHO_BMI_CALCULATOR.calculate_stream(source(rows), batch_size=batch_size, on_error=errors.append):
+        count += 1
+    return count
+
+
+def streamed_batches(rows: int, batch_size: int) -> int:
+    errors = []
+    stream = SIMPLE_WHO_BMI_CALCULATOR.calculate_stream(
+        source(rows), batch_size=batch_size, on_error=errors.append, batches=True
+    )
+    return sum(len(batch) for batch in stream)
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return count, elapsed, peak
+
+
+def run(rows: int) -> None:
+    print(f"{'mode':<18} {'results':>9} {'rows/s':>10} {'peak KiB':>9}")
+    count, elapsed, peak = measure(row_by_row, rows)
+    print(f"{'row by row':<18} {count:>9} {rows / elapsed:>10,.0f} {peak / 1024:>9,.0f}")
+    for batch_size in (64, 256, 4096):
+        count, elapsed, peak = measure(streamed, rows, batch_size)
+        print(f"{f'stream({batch_size})':<18} {count:>9} {rows / elapsed:>10,.0f} {peak / 1024:>9,.0f}")
+    for batch_size in (256, 4096):
+        count, elapsed, peak = measure(streamed_batches, rows, batch_size)
+        print(f"{f'batches({batch_size})':<18} {count:>9} {rows / elapsed:>10,.0f} {peak / 1024:>9,.0f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
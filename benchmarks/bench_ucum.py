@@ -0,0 +1,51 @@
+"""Benchmark UCUM parsing throughput, cold and from the compiled-unit cache.
+
+Parses a stream of lab unit codes with the realistic repetition of a
+high-volume feed: a small set of distinct codes, each seen many times. Cold parses clear
+the expression cache before every call (unit atoms stay compiled).
+
+Usage:
+    python -m benchmarks.bench_ucum [--rows 100000]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from mc4llm.models import clear_ucum_cache, parse_ucum
+
+CODES = [
+    "mg/dL", "mmol/L", "g/dL", "10*3/uL", "10*9/L", "%", "U/L", "[IU]/L", "meq/L", "mm[Hg]",
+    "kg/m2", "[lb_av]", "[in_i]", "Cel", "[degF]", "/min", "mL/min/{1.73_m2}", "ug/L", "ng/mL", "fL",
+]
+
+
+def run(rows: int) -> None:
+    rng = np.random.default_rng(0)
+    stream = [CODES[i] for i in rng.integers(0, len(CODES), size=rows).tolist()]
+    
+    start = time.perf_counter()
+    for code in stream:
+        clear_ucum_cache()
+        parse_ucum(code)
+    cold = rows / (time.perf_counter() - start)
+    
+    clear_ucum_cache()
+    start = time.perf_counter()
+    for code in stream:
+        parse_ucum(code)
+    cached = rows / (time.perf_counter() - start)
+    
+    print(f"{'codes':>8} {'cold parses/s':>14} {'cached parses/s':>16} {'speed-up':>9}")
+    print(f"{rows:>8} {cold:>14,.0f} {cached:>16,.0f} {cached / cold:>8.0f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+    run(args.rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+"""Microbenchmark suite for the hot paths of a tool call, with baseline comparison.
+
+Every case times one operation with setup excluded and reports per-call times
+in nanoseconds. Results are written as JSON; comparing them against a stored
+baseline flags cases that slowed down by more than a threshold, and
+exits with status 1 so CI can fail on regressions. Comparisons use the
+fastest repetition by default, which is the least sensitive to interference
+from other processes. Runs fully offline.
+
+Usage:
+    python -m benchmarks.suite [--filter REGEX] [--output results.json]
+    python -m benchmarks.suite --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --baseline benchmarks/baseline.json [--threshold 0.10] [--statistic median]
+    python -m benchmarks.suite --list
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import statistics
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# name -> factory returning the zero-argument callable to time; setup runs in the factory.
+CASES: Dict[str, Callable[[], Callable[[], Any]]] = {}
+
+RESULTS_FORMAT = 1
+
+
+def case(name: str) -> Callable[[Callable[[], Callable[[], Any]]], Callable[[], Callable[[], Any]]]:
+    """Register a benchmark case under a dotted name."""
+    def register(factory: Callable[[], Callable[[], Any]]) -> Callable[[], Callable[[], Any]]:
+        if name in CASES:
+            raise ValueError(f"Benchmark case '{name}' is already registered")
+        CASES[name] = factory
+        return factory
+    return register
+
+
+@case("models.validate.bmi_input")
+def _validate_bmi_input():
+    from mc4llm.example_calculators.bmi.simple_bmi import BMIInput
+    return lambda: BMIInput(weight=70.0, height=1.75)
+
+
+@case("models.validate.bmi_input_json")
+def _validate_bmi_input_json():
+    from mc4llm.example_calculators.bmi.simple_bmi import BMIInput
+    payload = b'{"weight": 70.0, "height": 1.75}'
+    return lambda: BMIInput.model_validate_json(payload)
+
+
+@case("models.validate.bmi_input_with_units")
+def _validate_bmi_input_with_units():
+    from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits
+    return lambda: BMIInputWithUnits(weight=(154.0, "pound"), height=(69.0, "inch"))
+
+
+@case("units.convert_unit.pound_to_kilogram")
+def _convert_unit():
+    from mc4llm.models.base import _convert_value
+    _convert_value(154.0, "pound", "kilogram")
+    return lambda: _convert_value(154.0, "pound", "kilogram")
+
+
+@case("units.convert_unit.ucum")
+def _convert_unit_ucum():
+    from mc4llm.models.base import _convert_value
+    _convert_value(154.0, "[lb_av]", "kilogram")
+    return lambda: _convert_value(154.0, "[lb_av]", "kilogram")
+
+
+@case("units.convert_unit_array.10k_mixed")
+def _convert_unit_array():
+    import numpy as np
+    from mc4llm.models import convert_unit_array
+    values = np.random.default_rng(0).uniform(40, 150, 10_000)
+    units = np.array(["pound", "kilogram", "[lb_av]", "gram"] * 2_500)
+    return lambda: convert_unit_array(values, units, "kilogram")
+
+
+@case("units.parse_ucum.cached")
+def _parse_ucum():
+    from mc4llm.models import parse_ucum
+    parse_ucum("mg/dL")
+    return lambda: parse_ucum("mg/dL")
+
+
+@case("formula.standard_bmi")
+def _standard_bmi():
+    from mc4llm.example_calculators.bmi.simple_bmi import StandardBMIFormula
+    formula = StandardBMIFormula(name="standard")
+    return lambda: formula.calculate(70.0, 1.75)
+
+
+@case("formula.standard_bmi_with_units")
+def _standard_bmi_with_units():
+    from mc4llm.example_calculators.bmi.bmi_with_units import StandardBMIFormula
+    from mc4llm.models.base import get_registry
+    formula = StandardBMIFormula(name="standard")
+    weight, height = get_registry().Quantity(70.0, "kilogram"), get_registry().Quantity(1.75, "meter")
+    return lambda: formula.calculate(weight, height)
+
+
+@case("rule.range.categorize")
+def _categorize():
+    from mc4llm.example_calculators.bmi.simple_bmi import who_bmi_range_rule
+    return lambda: who_bmi_range_rule.categorize(22.86)
+
+
+@case("rule.range.categorize_many.10k")
+def _categorize_many():
+    import numpy as np
+    from mc4llm.example_calculators.bmi.simple_bmi import who_bmi_range_rule
+    values = np.random.default_rng(0).uniform(10, 45, 10_000)
+    return lambda: who_bmi_range_rule.categorize_many(values, return_codes=True)
+
+
+@case("guideline.get_rule")
+def _get_rule():
+    from mc4llm.example_calculators.bmi.simple_bmi import WHO_BMI_GUIDELINE
+    return lambda: WHO_BMI_GUIDELINE.get_rule("bmi")
+
+
+@case("guideline.get_formula")
+def _get_formula():
+    from mc4llm.example_calculators.bmi.simple_bmi import WHO_BMI_GUIDELINE
+    return lambda: WHO_BMI_GUIDELINE.get_formula("standard")
+
+
+@case("guideline.plan_call")
+def _plan_call():
+    from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+    plan, data = SIMPLE_WHO_BMI_CALCULATOR.plan, BMIInput(weight=70.0, height=1.75)
+    return lambda: plan(data)
+
+
+@case("calculator.simple.calculate")
+def _simple_calculate():
+    from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+    data = BMIInput(weight=70.0, height=1.75)
+    return lambda: SIMPLE_WHO_BMI_CALCULATOR.calculate(data)
+
+
+@case("calculator.simple.end_to_end")
+def _simple_end_to_end():
+    from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+    return lambda: SIMPLE_WHO_BMI_CALCULATOR.calculate(BMIInput(weight=70.0, height=1.75)).model_dump()
+
+
+@case("calculator.with_units.calculate")
+def _units_calculate():
+    from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits, BMI_CALCULATOR_WITH_UNITS
+    data = BMIInputWithUnits(weight=(154.0, "pound"), height=(69.0, "inch"))
+    return lambda: BMI_CALCULATOR_WITH_UNITS.calculate(data)
+
+
+@case("calculator.with_units.end_to_end")
+def _units_end_to_end():
+    from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits, BMI_CALCULATOR_WITH_UNITS
+    return lambda: BMI_CALCULATOR_WITH_UNITS.calculate(
+        BMIInputWithUnits(weight=(154.0, "pound"), height=(69.0, "inch"))
+    ).model_dump()
+
+
+@case("calculator.simple.calculate_columns.10k")
+def _simple_columns():
+    import numpy as np
+    from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+    rng = np.random.default_rng(0)
+    batch = BMIInput.columnar(weight=rng.uniform(40, 150, 10_000), height=rng.uniform(1.4, 2.1, 10_000))
+    return lambda: SIMPLE_WHO_BMI_CALCULATOR.calculate_columns(batch)
+
+
+@case("registry.dispatch_tool_call")
+def _dispatch():
+    from mc4llm.registry import ToolCall, dispatch_tool_calls
+    calls = [ToolCall("call_1", "simple_who_bmi", b'{"weight": 70.0, "height": 1.75}')]
+    return lambda: dispatch_tool_calls(calls)
+
+
+@case("registry.tools_bytes")
+def _tools_bytes():
+    from mc4llm.registry import default_registry
+    registry = default_registry()
+    registry.tools_bytes()
+    return registry.tools_bytes
+
+
+def measure(fn: Callable[[], Any], repeats: int = 5, min_time: float = 0.2) -> Dict[str, Any]:
+    """
+    Time a callable the way timeit does: calibrate a loop count, then repeat.
+    
+    Args:
+        fn: The operation to time
+        repeats: Number of timed repetitions
+        min_time: Target duration of one repetition, in seconds
+        
+    Returns:
+        Dict[str, Any]: Per-call min/median/mean/stdev in nanoseconds, plus the loop and repeat counts
+    """
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 10 or loops >= 1 << 24:
+            break
+        loops *= 10
+    loops = max(1, int(loops * (min_time / max(elapsed, 1e-9))))
+
+    per_call = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        per_call.append((time.perf_counter() - start) / loops * 1e9)
+    return {
+        "min_ns": min(per_call),
+        "median_ns": statistics.median(per_call),
+        "mean_ns": statistics.fmean(per_call),
+        "stdev_ns": statistics.stdev(per_call) if repeats > 1 else 0.0,
+        "loops": loops,
+        "repeats": repeats,
+    }
+
+
+def run(pattern: Optional[str] = None, repeats: int = 5, min_time: float = 0.2, verbose: bool = True) -> Dict[str, Any]:
+    """
+    Run the registered cases whose name matches a regular expression.
+    
+    Args:
+        pattern: Regular expression searched in case names; None runs every case
+        repeats: Number of timed repetitions per case
+        min_time: Target duration of one repetition, in seconds
+        verbose: Print each case as it finishes
+        
+    Returns:
+        Dict[str, Any]: The machine-readable results document
+    """
+    selected = [name for name in CASES if pattern is None or re.search(pattern, name)]
+    results = {}
+    for name in selected:
+        results[name] = measure(CASES[name](), repeats=repeats, min_time=min_time)
+        if verbose:
+            print(f"{name:<45} {format_ns(results[name]['min_ns']):>12} {format_ns(results[name]['median_ns']):>12}", flush=True)
+    return {
+        "format": RESULTS_FORMAT,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = 0.10, statistic: str = "min"
+) -> List[Tuple[str, float, float, float, str]]:
+    """
+    Compare the times of the cases present in both documents.
+    
+    Args:
+        current: Results document of this run
+        baseline: Stored results document
+        threshold: Relative slow-down that counts as a regression, e.g. 0.10
+            for 10%; the same speed-up counts as an improvement
+        statistic: Per-call statistic to compare: "min", "median" or "mean"
+        
+    Returns:
+        List of (case, baseline ns, current ns, ratio, status) rows, where status
+        is "regression", "improvement" or "ok"
+    """
+    rows = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        key = f"{statistic}_ns"
+        ratio = result[key] / previous[key]
+        if ratio > 1 + threshold:
+            status = "regression"
+        elif ratio < 1 / (1 + threshold):
+            status = "improvement"
+        else:
+            status = "ok"
+        rows.append((name, previous[key], result[key], ratio, status))
+    return rows
+
+
+def format_ns(value: float) -> str:
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if value >= scale:
+            return f"{value / scale:.2f} {unit}"
+    return f"{value:.0f} ns"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default=None, help="Regular expression selecting cases by name")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.2, help="Seconds per repetition")
+    parser.add_argument("--output", default=None, help="Write the results JSON to this path")
+    parser.add_argument("--save-baseline", default=None, help="Write the results JSON as a new baseline")
+    parser.add_argument("--baseline", default=None, help="Compare against this results JSON")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Regression threshold, e.g. 0.10 for 10%%")
+    parser.add_argument("--statistic", choices=["min", "median", "mean"], default="min")
+    parser.add_argument("--list", action="store_true", help="List the cases and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(CASES))
+        return 0
+    document = run(args.filter, repeats=args.repeats, min_time=args.min_time)
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(document, f, indent=2)
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(document, baseline, args.threshold, args.statistic)
+    print(f"\n{'case':<45} {'baseline':>12} {'current':>12} {'ratio':>7}  status")
+    for name, before, after, ratio, status in rows:
+        print(f"{name:<45} {format_ns(before):>12} {format_ns(after):>12} {ratio:>6.2f}x  {status}")
+    regressions = [row for row in rows if row[4] == "regression"]
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than the baseline by more than {args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,20 @@
 Medical Calculators Package
 
 A collection of medical calculators with standardized interfaces.
+
+Submodules and exports are imported on first attribute access, so a bare
+``import mc4llm`` does not load pint, numpy or any calculator.
 """
 
+from typing import TYPE_CHECKING
+
+from mc4llm._lazy import lazy_exports
 
-from mc4llm.calculator import Calculator
-from mc4llm.formula import BaseFormula
-from mc4llm.guideline import BaseGuideline
-from mc4llm.example_calculators.bmi import SIMPLE_WHO_BMI_CALCULATOR
+if TYPE_CHECKING:
+    from mc4llm.calculator import Calculator
+    from mc4llm.formula import BaseFormula
+    from mc4llm.guideline import BaseGuideline
+    from mc4llm.example_calculators.bmi import SIMPLE_WHO_BMI_CALCULATOR
 
 __all__ = [
     'Calculator',
@@ -16,3 +23,14 @@ __all__ = [
     'BaseGuideline',
     'SIMPLE_WHO_BMI_CALCULATOR'
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attributes={
+        'Calculator': 'mc4llm.calculator',
+        'BaseFormula': 'mc4llm.formula',
+        'BaseGuideline': 'mc4llm.guideline',
+        'SIMPLE_WHO_BMI_CALCULATOR': 'mc4llm.example_calculators.bmi',
+    },
+    submodules=['calculator', 'cli', 'example_calculators', 'formula', 'guideline', 'instrumentation', 'models', 'registry', 'rule', 'server']
+)
@@ -0,0 +1,36 @@
+"""Helpers for packages that load their submodules and exports on first access."""
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+def lazy_exports(
+    package: str, attributes: Dict[str, str], submodules: Iterable[str] = ()
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Build the module-level ``__getattr__`` and ``__dir__`` of a lazily loaded package.
+    
+    Args:
+        package: The package's ``__name__``
+        attributes: Exported name to the absolute name of the module defining it
+        submodules: Names of submodules that are imported when accessed as attributes
+        
+    Returns:
+        The ``(__getattr__, __dir__)`` pair to assign in the package namespace
+    """
+    namespace = import_module(package).__dict__
+    submodules = frozenset(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            value = getattr(import_module(attributes[name]), name)
+        elif name in submodules:
+            value = import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        # Cache on the package so later lookups skip __getattr__ entirely.
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(attributes) | submodules)
+
+    return __getattr__, __dir__
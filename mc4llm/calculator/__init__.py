@@ -1,3 +1,6 @@
 from mc4llm.calculator.base import Calculator
+from mc4llm.calculator.cache import CacheStats, ResultCache
+from mc4llm.calculator.loader import load_calculator
+from mc4llm.calculator.stream import RowError, stream_calculate
 
-__all__ = ["Calculator"] 
\ No newline at end of file
+__all__ = ["Calculator", "CacheStats", "ResultCache", "RowError", "load_calculator", "stream_calculate"]
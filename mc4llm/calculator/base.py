@@ -1,15 +1,57 @@
-from typing import Generic, TypeVar
+import asyncio
+import os
+import weakref
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from typing import (
+    Any, AsyncIterator, Callable, ClassVar, Generic, Iterable, Iterator, List, Optional, Sequence, TypeVar, Union,
+    TYPE_CHECKING
+)
 from abc import ABC, abstractmethod
 
-from mc4llm.models import IOModel
-from mc4llm.guideline import BaseGuideline
+from mc4llm import instrumentation
+from mc4llm.models import IOModel, ColumnarBatch, ResultBatch, field_units
+from mc4llm.guideline import BaseGuideline, GuidelinePlan
+from mc4llm.calculator.cache import CacheStats, ResultCache
+
+if TYPE_CHECKING:
+    from mc4llm.calculator.stream import RowError
 
 InputT = TypeVar('InputT', bound=IOModel)
 OutputT = TypeVar('OutputT', bound=IOModel)
 
+# Instrumented methods of calculator subclasses.
+_TIMED_METHODS = ("calculate", "calculate_batch", "calculate_columns")
+
+# Live calculators, whose compiled plans are dropped when instrumentation is
+# switched on or off so they rebind to the (un)instrumented formula and rule.
+_calculators: "weakref.WeakSet[Calculator]" = weakref.WeakSet()
+
+def _drop_plans() -> None:
+    for calculator in list(_calculators):
+        calculator._plan = None
+
+instrumentation.on_change(_drop_plans)
+
 class Calculator(Generic[InputT, OutputT], ABC):
     """Base class for all medical calculators."""
     
+    # Names of the guideline formula and rule the calculator runs, compiled into ``plan``.
+    formula_name: ClassVar[Optional[str]] = None
+    rule_name: ClassVar[Optional[str]] = None
+    
+    # Build outputs with ``model_construct`` instead of validating them. With pydantic 2
+    # this only pays off for output models with expensive validators: plain fields are
+    # validated by pydantic-core faster than model_construct runs. MC4LLM_TRUST_OUTPUTS=1
+    # sets the default for all calculators.
+    trust_outputs: bool = os.environ.get("MC4LLM_TRUST_OUTPUTS", "").lower() not in ("", "0", "false")
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for method in _TIMED_METHODS:
+            if method in cls.__dict__:
+                instrumentation.probe(cls, method, method, instrumentation.owner_name(method))
+    
     def __init__(
         self,
         input_model: type[InputT],
@@ -27,6 +69,105 @@ class Calculator(Generic[InputT, OutputT], ABC):
         self.input_model = input_model
         self.output_model = output_model
         self.guideline = guideline
+        self._plan: Optional[GuidelinePlan] = None
+        self._cache: Optional[ResultCache] = None
+        self._executor: Optional[Executor] = None
+        self._max_concurrency: Optional[int] = None
+        self._async_chunk_size = 10_000
+        self._offload_single = False
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        instrumentation.mark_output_model(output_model)
+        _calculators.add(self)
+    
+    def __getstate__(self) -> dict:
+        # Caches, compiled plans and async settings are per process and rebuilt on demand.
+        state = self.__dict__.copy()
+        state.pop("calculate", None)
+        state.update(
+            _plan=None, _cache=None, _executor=None, _semaphores=None
+        )
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._semaphores = weakref.WeakKeyDictionary()
+        instrumentation.mark_output_model(self.output_model)
+        _calculators.add(self)
+    
+    @property
+    def plan(self) -> GuidelinePlan:
+        """
+        The compiled execution plan of ``formula_name`` and ``rule_name``.
+        
+        Compiled on first access and recompiled whenever the guideline changes.
+        """
+        plan = self._plan
+        if plan is None or plan.version != self.guideline.version or plan.guideline is not self.guideline:
+            plan = self._plan = self.compile()
+        return plan
+    
+    def compile(self) -> GuidelinePlan:
+        """
+        Compile the calculator's guideline formula and rule into an execution plan.
+        
+        Returns:
+            GuidelinePlan: The plan binding the input model to the formula
+            
+        Raises:
+            ValueError: If the calculator declares no ``formula_name``, or the
+                guideline cannot resolve or bind it
+        """
+        if self.formula_name is None:
+            raise ValueError(f"{type(self).__name__} does not declare a formula_name to compile")
+        return self.guideline.compile(self.input_model, formula=self.formula_name, rule=self.rule_name)
+    
+    def build_output(self, **values: Any) -> OutputT:
+        """
+        Build the output model from values the calculator computed.
+        
+        The values are validated by the output model's core validator directly,
+        without the overhead of ``BaseModel.__init__``, or, if ``trust_outputs``
+        is set, stored as they are with ``model_construct``.
+        
+        Args:
+            **values: Output field name to value
+            
+        Returns:
+            OutputT: The output model instance
+            
+        Raises:
+            pydantic.ValidationError: If a value is invalid and outputs are not trusted
+        """
+        if self.trust_outputs:
+            return self.output_model.model_construct(**values)
+        return self.output_model.__pydantic_validator__.validate_python(values)
+    
+    def build_outputs(self, outputs: ColumnarBatch) -> List[OutputT]:
+        """
+        Build one output model per row of a batch the calculator computed.
+        
+        Rows are validated like in ``build_output``; trusted rows are materialized
+        with ``ColumnarBatch.rows``.
+        
+        Args:
+            outputs: A batch of the output model
+            
+        Returns:
+            List[OutputT]: One output model instance per row
+            
+        Raises:
+            pydantic.ValidationError: If a value is invalid and outputs are not trusted
+        """
+        if self.trust_outputs:
+            return outputs.to_rows()
+        validate = self.output_model.__pydantic_validator__.validate_python
+        names = list(outputs.columns)
+        if field_units(self.output_model):
+            # Quantity columns are rebuilt by rows() before validation.
+            return [validate(dict(row)) for row in outputs.rows()]
+        return [validate(dict(zip(names, row))) for row in zip(*(outputs[name].tolist() for name in names))]
     
     @abstractmethod
     def calculate(self, data: InputT) -> OutputT:
@@ -42,4 +183,303 @@ class Calculator(Generic[InputT, OutputT], ABC):
         Raises:
             ValueError: If input data is invalid
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def enable_cache(
+        self, maxsize: int = 128, ttl: Optional[float] = None, precision: Optional[int] = 12
+    ) -> ResultCache:
+        """
+        Memoize ``calculate`` results for this calculator instance.
+        
+        Results are keyed on the validated input, after unit normalization, so
+        (150, "pound") and the same weight given in kilograms share an entry.
+        Floats are compared to ``precision`` significant digits; lower it to also
+        merge inputs that were rounded differently by the caller. Cached results
+        are shared between callers and must not be mutated. The cache is cleared
+        automatically when the guideline changes.
+        
+        Args:
+            maxsize: Maximum number of results kept (LRU eviction)
+            ttl: Seconds a result stays valid, or None for no expiry
+            precision: Significant digits of floats in the cache key, or None for exact keys
+            
+        Returns:
+            ResultCache: The cache, whose ``stats`` hold hit/miss/eviction counters
+        """
+        cache = ResultCache(maxsize=maxsize, ttl=ttl, precision=precision)
+        cls = type(self)
+        
+        def calculate(data: InputT) -> OutputT:
+            cache.sync(self.guideline)
+            key = cache.key(data)
+            found, result = cache.get(key)
+            if not found:
+                # Looked up on each miss so instrumentation switched on later is picked up.
+                result = cls.calculate(self, data)
+                cache.put(key, result)
+            return result
+        
+        calculate.__doc__ = cls.calculate.__doc__
+        # The instance attribute shadows the class's calculate until disable_cache.
+        self.calculate = calculate
+        self._cache = cache
+        return cache
+    
+    def disable_cache(self) -> None:
+        """Stop memoizing ``calculate`` and drop the cached results."""
+        self.__dict__.pop("calculate", None)
+        self._cache = None
+    
+    @property
+    def cache(self) -> Optional[ResultCache]:
+        """The result cache, or None if memoization is disabled."""
+        return self._cache
+    
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Hit/miss/eviction counters of the result cache, or None if memoization is disabled."""
+        return self._cache.stats if self._cache is not None else None
+
+    def calculate_batch(self, data: Union[Sequence[InputT], ColumnarBatch]) -> List[OutputT]:
+        """
+        Perform the calculation for a batch of inputs.
+        
+        The default implementation calls ``calculate`` once per row. Calculators
+        whose formulas and rules work on whole arrays should override it with a
+        vectorized path that reads the columns from ``as_columns``.
+        
+        Args:
+            data: The input rows, or a columnar batch of the input model
+            
+        Returns:
+            List[OutputT]: One result per input row, in the same order
+            
+        Raises:
+            ValueError: If input data is invalid
+        """
+        rows = data.rows() if isinstance(data, ColumnarBatch) else data
+        return [self.calculate(row) for row in rows]
+
+    def calculate_columns(self, data: Union[Sequence[InputT], ColumnarBatch]) -> ColumnarBatch:
+        """
+        Perform the calculation for a batch of inputs and return the results column-wise.
+        
+        The default implementation collects the rows of ``calculate_batch`` into a
+        ``ResultBatch``. Vectorized calculators should override it to build the
+        output columns directly, e.g. with categorical outputs as a ``CategoricalArray``.
+        
+        Args:
+            data: The input rows, or a columnar batch of the input model
+            
+        Returns:
+            ColumnarBatch: A batch of the output model, one row per input row
+            
+        Raises:
+            ValueError: If input data is invalid
+        """
+        return ResultBatch.from_rows(self.output_model, self.calculate_batch(data))
+
+    def calculate_results(self, data: Union[Sequence[InputT], ColumnarBatch]) -> ResultBatch:
+        """
+        Perform the calculation for a batch of inputs and return a compact result batch.
+        
+        Unlike ``calculate_batch``, no output model instance is built until a row
+        is accessed: numeric outputs stay NumPy columns and categorical outputs
+        small integer codes into a label table.
+        
+        Args:
+            data: The input rows, or a columnar batch of the input model
+            
+        Returns:
+            ResultBatch: The results of ``calculate_columns``, one row per input row
+            
+        Raises:
+            ValueError: If input data is invalid
+        """
+        return ResultBatch.from_batch(self.calculate_columns(data))
+
+    def as_columns(self, data: Union[Sequence[InputT], ColumnarBatch]) -> ColumnarBatch:
+        """
+        Get batch input in columnar form.
+        
+        Args:
+            data: The input rows, or a columnar batch of the input model
+            
+        Returns:
+            ColumnarBatch: The input columns; a columnar batch is returned as is
+            
+        Raises:
+            TypeError: If a columnar batch belongs to a different model
+        """
+        if isinstance(data, ColumnarBatch):
+            if data.model is not self.input_model:
+                raise TypeError(
+                    f"Expected a batch of {self.input_model.__name__}, got a batch of {data.model.__name__}"
+                )
+            return data
+        return ColumnarBatch.from_rows(self.input_model, data)
+
+    def calculate_parallel(
+        self,
+        data: Union[Sequence[InputT], ColumnarBatch],
+        workers: Optional[int] = None,
+        chunk_size: int = 100_000,
+        start_method: Optional[str] = None
+    ) -> ResultBatch:
+        """
+        Perform the calculation for a large batch on a pool of worker processes.
+        
+        See ``mc4llm.calculator.parallel.parallel_calculate_columns``; the
+        calculator is pickled to each worker once, without its result cache.
+        
+        Args:
+            data: The input rows, or a columnar batch of the input model
+            workers: Number of worker processes; defaults to the number of CPUs
+            chunk_size: Rows per task
+            start_method: multiprocessing start method, or None for the platform default
+            
+        Returns:
+            ResultBatch: A batch of the output model, one row per input row
+            
+        Raises:
+            ValueError: If input data is invalid
+        """
+        from mc4llm.calculator.parallel import parallel_calculate_columns
+        return parallel_calculate_columns(
+            self, data, workers=workers, chunk_size=chunk_size, start_method=start_method
+        )
+
+    def calculate_stream(
+        self,
+        rows: Iterable[Any],
+        batch_size: int = 256,
+        on_error: Optional[Callable[["RowError"], Any]] = None,
+        with_index: bool = False,
+        batches: bool = False
+    ) -> Iterator[Any]:
+        """
+        Calculate results lazily for an iterable of raw inputs, with bounded memory.
+        
+        See ``mc4llm.calculator.stream.stream_calculate``; rows are validated and
+        scored in micro-batches of ``batch_size`` and invalid rows are passed to
+        ``on_error`` instead of ending the stream.
+        
+        Args:
+            rows: Input model instances, mappings of their fields or JSON text
+            batch_size: Rows per micro-batch, which bounds the rows held in memory
+            on_error: Called with a ``RowError`` for every rejected row; if None,
+                the first error is raised
+            with_index: Also yield the position of each result in ``rows``
+            batches: Yield one ``ResultBatch`` per micro-batch instead of one
+                output model per row
+                
+        Returns:
+            Iterator: The output of every accepted row (or result batches), in input order
+            
+        Raises:
+            ValueError: When iteration starts, if batch_size is not positive
+        """
+        from mc4llm.calculator.stream import stream_calculate
+        return stream_calculate(
+            self, rows, batch_size=batch_size, on_error=on_error, with_index=with_index, batches=batches
+        )
+
+    def configure_async(
+        self,
+        executor: Optional[Executor] = None,
+        max_concurrency: Optional[int] = None,
+        chunk_size: int = 10_000,
+        offload_single: bool = False
+    ) -> None:
+        """
+        Configure how ``acalculate`` and ``acalculate_batch`` use the event loop.
+        
+        Args:
+            executor: Executor that runs CPU-heavy work; None uses the loop's default
+                thread pool. Process pools require a picklable calculator.
+            max_concurrency: Maximum number of calls in flight per event loop, or None
+                for no limit; further calls wait for a free slot
+            chunk_size: Rows per executor job in ``acalculate_batch``; cancellation
+                takes effect between chunks
+            offload_single: Also run single ``acalculate`` calls in the executor
+                instead of inline on the loop
+                
+        Raises:
+            ValueError: If max_concurrency or chunk_size is not positive
+        """
+        if max_concurrency is not None and max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self._async_chunk_size = chunk_size
+        self._offload_single = offload_single
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    @asynccontextmanager
+    async def _async_slot(self) -> AsyncIterator[None]:
+        """Hold one of the ``max_concurrency`` slots of the running loop."""
+        if self._max_concurrency is None:
+            yield
+            return
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        async with semaphore:
+            yield
+
+    async def acalculate(self, data: InputT) -> OutputT:
+        """
+        Coroutine version of ``calculate``.
+        
+        Single calculations are cheap, so by default they run inline on the loop;
+        see ``configure_async`` to offload them to an executor.
+        
+        Args:
+            data: The input data
+            
+        Returns:
+            OutputT: The calculation result
+            
+        Raises:
+            ValueError: If input data is invalid
+        """
+        async with self._async_slot():
+            if not self._offload_single:
+                return self.calculate(data)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, self.calculate, data)
+
+    async def acalculate_batch(self, data: Union[Sequence[InputT], ColumnarBatch]) -> List[OutputT]:
+        """
+        Coroutine version of ``calculate_batch`` that keeps the event loop free.
+        
+        The batch is split into chunks of the configured size, each run by
+        ``calculate_batch`` in the executor. If the awaiting task is cancelled,
+        chunks that have not started are never run.
+        
+        Args:
+            data: The input rows, or a columnar batch of the input model
+            
+        Returns:
+            List[OutputT]: One result per input row, in the same order
+            
+        Raises:
+            ValueError: If input data is invalid
+        """
+        async with self._async_slot():
+            loop = asyncio.get_running_loop()
+            chunk_size = self._async_chunk_size
+            results: List[OutputT] = []
+            for start in range(0, len(data), chunk_size):
+                if isinstance(data, ColumnarBatch):
+                    chunk = data.slice(start, start + chunk_size)
+                else:
+                    chunk = data[start:start + chunk_size]
+                results.extend(await loop.run_in_executor(self._executor, self.calculate_batch, chunk))
+            return results
+
+for _method in ("build_output", "build_outputs"):
+    instrumentation.probe(Calculator, _method, "output", instrumentation.owner_name(_method))
@@ -0,0 +1,169 @@
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+import numpy as np
+from pint import Quantity
+from pydantic import BaseModel
+
+@dataclass
+class CacheStats:
+    """Counters of a ResultCache."""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+def _canonical_float(value: float, precision: Optional[int]) -> float:
+    """Round a float to ``precision`` significant digits so conversion noise does not split keys."""
+    if precision is None or value == 0 or not math.isfinite(value):
+        return value
+    return round(value, precision - 1 - math.floor(math.log10(abs(value))))
+
+def canonical_key(value: Any, precision: Optional[int] = 12) -> Hashable:
+    """
+    Build a hashable, canonical form of a validated input.
+    
+    Models are keyed by type and field values, Quantities by their magnitude and
+    units (validated inputs already hold canonical units), and floats are rounded
+    to ``precision`` significant digits.
+    
+    Args:
+        value: The validated input model, or one of its field values
+        precision: Significant digits kept for floats; None keeps them exact
+        
+    Returns:
+        Hashable: A key that is equal for inputs that should share a result
+        
+    Raises:
+        TypeError: If a value cannot be made hashable
+    """
+    if isinstance(value, BaseModel):
+        return (type(value),) + tuple(
+            canonical_key(getattr(value, name), precision) for name in type(value).model_fields
+        )
+    if isinstance(value, float):
+        return _canonical_float(value, precision)
+    if isinstance(value, Quantity):
+        return (canonical_key(value.magnitude, precision), str(value.units))
+    if isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    if isinstance(value, (list, tuple)):
+        return tuple(canonical_key(item, precision) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, canonical_key(item, precision)) for key, item in value.items()))
+    hash(value)
+    return value
+
+class ResultCache:
+    """Size-bounded LRU cache of calculator results with an optional time-to-live.
+    
+    The cache is tied to the guideline state it was filled from: ``sync`` drops
+    every entry when the calculator's guideline (or its version) changes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: Optional[float] = None,
+        precision: Optional[int] = 12,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an empty cache.
+        
+        Args:
+            maxsize: Maximum number of results kept; least recently used ones are evicted
+            ttl: Seconds a result stays valid, or None to keep results until evicted
+            precision: Significant digits of floats in the keys, see ``canonical_key``
+            clock: Time source used for the TTL
+            
+        Raises:
+            ValueError: If maxsize or ttl is not positive
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.precision = precision
+        self.stats = CacheStats()
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._guideline: Any = None
+        self._version: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key(self, data: Any) -> Hashable:
+        """Get the cache key of a validated input."""
+        return canonical_key(data, self.precision)
+
+    def sync(self, guideline: Any) -> None:
+        """
+        Drop all entries if the guideline differs from the one the cache was filled from.
+        
+        Args:
+            guideline: The calculator's current guideline
+        """
+        version = guideline.version
+        if guideline is not self._guideline or version != self._version:
+            with self._lock:
+                if self._guideline is not None and self._entries:
+                    self._entries.clear()
+                    self.stats.invalidations += 1
+                self._guideline = guideline
+                self._version = version
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a result.
+        
+        Args:
+            key: The input's cache key
+            
+        Returns:
+            Whether the result was found, and the result (None if not found)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return False, None
+            value, expires_at = entry
+            if expires_at is not None and self._clock() >= expires_at:
+                del self._entries[key]
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return True, value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a result, evicting the least recently used one when full.
+        
+        Args:
+            key: The input's cache key
+            value: The calculator result
+        """
+        expires_at = self._clock() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries; the counters are kept."""
+        with self._lock:
+            self._entries.clear()
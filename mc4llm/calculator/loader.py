@@ -0,0 +1,47 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from mc4llm.calculator.base import Calculator
+
+def load_calculator(reference: Union[str, "Calculator"]) -> "Calculator":
+    """
+    Resolve a calculator from a registry id or an importable path.
+    
+    Args:
+        reference: A calculator instance (returned as is), the id of a calculator
+            in the default registry such as "simple_who_bmi" (its highest
+            version is used), or the path of a module-level calculator, written
+            either as "package.module:NAME" or "package.module.NAME"
+            
+    Returns:
+        Calculator: The calculator instance
+        
+    Raises:
+        ValueError: If the id is not registered, or the path cannot be imported
+            or does not name an attribute
+        TypeError: If the reference does not point to a Calculator instance
+    """
+    from mc4llm.calculator.base import Calculator
+    
+    if isinstance(reference, Calculator):
+        return reference
+    if not isinstance(reference, str):
+        raise TypeError("Calculator reference must be a Calculator instance or a string")
+    
+    if ":" not in reference and "." not in reference:
+        from mc4llm.registry import default_registry
+        return default_registry().get(reference)
+    
+    module_name, separator, attribute = reference.partition(":")
+    if not separator:
+        module_name, _, attribute = reference.rpartition(".")
+    if not module_name or not attribute:
+        raise ValueError(f"Calculator reference '{reference}' must look like 'package.module:NAME'")
+    try:
+        calculator = getattr(import_module(module_name), attribute)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(f"Cannot load calculator '{reference}': {error}") from error
+    if not isinstance(calculator, Calculator):
+        raise TypeError(f"'{reference}' is a {type(calculator).__name__}, not a Calculator")
+    return calculator
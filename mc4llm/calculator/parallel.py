@@ -0,0 +1,176 @@
+"""Multi-core batch scoring over shared memory.
+
+Input columns are copied once into ``multiprocessing.shared_memory`` blocks and
+every worker process writes its rows of the result straight into shared output
+arrays, so only row ranges (and small label tables) cross process boundaries.
+Each worker loads the calculator once, when the pool starts.
+"""
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+import numpy as np
+
+from mc4llm.calculator.loader import load_calculator
+from mc4llm.models import CategoricalArray, ColumnarBatch, ResultBatch, column_schema
+
+if TYPE_CHECKING:
+    from mc4llm.calculator.base import Calculator
+
+# Shared array description passed to workers: (block name, dtype, shape, labels).
+# Labels are only set for categorical columns, whose block holds the codes.
+_ArraySpec = Tuple[str, str, Tuple[int, ...], Optional[Tuple[str, ...]]]
+
+# Per-process state set up by _init_worker.
+_worker: Dict[str, Any] = {}
+
+def _create_shared(array: np.ndarray, blocks: List[SharedMemory]) -> Tuple[SharedMemory, np.ndarray]:
+    """Allocate a shared block shaped like ``array`` and copy the array into it."""
+    block = SharedMemory(create=True, size=max(array.nbytes, 1))
+    blocks.append(block)
+    shared = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    shared[...] = array
+    return block, shared
+
+def _attach(spec: _ArraySpec, blocks: List[SharedMemory]) -> Union[np.ndarray, CategoricalArray]:
+    """Map a shared array described by ``spec`` into this process."""
+    name, dtype, shape, labels = spec
+    block = SharedMemory(name=name)
+    blocks.append(block)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    return CategoricalArray(array, labels) if labels is not None else array
+
+def _init_worker(
+    reference: Union[str, "Calculator"],
+    input_specs: Dict[str, _ArraySpec],
+    output_specs: Dict[str, _ArraySpec]
+) -> None:
+    blocks: List[SharedMemory] = []
+    outputs = {name: _attach(spec, blocks) for name, spec in output_specs.items()}
+    _worker.update(
+        calculator=load_calculator(reference),
+        inputs={name: _attach(spec, blocks) for name, spec in input_specs.items()},
+        outputs={name: getattr(column, "codes", column) for name, column in outputs.items()},
+        categorical={name for name, spec in output_specs.items() if spec[3] is not None},
+        blocks=blocks,
+    )
+
+def _run_chunk(start: int, stop: int) -> Dict[str, Tuple[str, ...]]:
+    """Score rows [start, stop) and write them to the shared outputs; returns the chunk's label tables."""
+    calculator = _worker["calculator"]
+    batch = ColumnarBatch(
+        calculator.input_model,
+        {name: column[start:stop] for name, column in _worker["inputs"].items()},
+        validate=False
+    )
+    result = calculator.calculate_columns(batch)
+    labels: Dict[str, Tuple[str, ...]] = {}
+    for name, output in _worker["outputs"].items():
+        column = result[name]
+        if name in _worker["categorical"]:
+            if not isinstance(column, CategoricalArray):
+                column = CategoricalArray.from_values(column)
+            output[start:stop] = column.codes
+            labels[name] = column.labels
+        elif isinstance(column, CategoricalArray):
+            output[start:stop] = column.to_numpy()
+        else:
+            output[start:stop] = column
+    return labels
+
+def _merge_labels(codes: np.ndarray, chunks: Sequence[Tuple[int, int, Tuple[str, ...]]]) -> Tuple[str, ...]:
+    """Remap per-chunk codes in place onto one label table, in order of first appearance."""
+    table: Dict[str, int] = {}
+    for start, stop, labels in chunks:
+        mapping = np.array([table.setdefault(label, len(table)) for label in labels], dtype=codes.dtype)
+        if not np.array_equal(mapping, np.arange(len(labels))):
+            codes[start:stop] = mapping[codes[start:stop]]
+    return tuple(table)
+
+def parallel_calculate_columns(
+    calculator: Union[str, "Calculator"],
+    data: Any,
+    workers: Optional[int] = None,
+    chunk_size: int = 100_000,
+    start_method: Optional[str] = None
+) -> ResultBatch:
+    """
+    Score a batch on a pool of worker processes sharing the input and output columns.
+    
+    Workers run the calculator's ``calculate_columns`` on row ranges. Numeric
+    outputs are written to shared float/int/bool arrays and string outputs to
+    shared int32 code arrays; per-chunk label tables are merged at the end.
+    
+    Args:
+        calculator: A calculator, a registry id such as "simple_who_bmi", or the
+            importable path of one such as "mc4llm.example_calculators.bmi.SIMPLE_WHO_BMI_CALCULATOR".
+            Instances are sent to each worker once; ids and paths are resolved by
+            each worker.
+        data: The input rows, or a columnar batch of the calculator's input model
+        workers: Number of worker processes; defaults to the number of CPUs
+        chunk_size: Rows per task
+        start_method: multiprocessing start method ("fork", "spawn", "forkserver");
+            defaults to the platform default
+            
+    Returns:
+        ResultBatch: The results as a batch of the output model
+        
+    Raises:
+        ValueError: If workers or chunk_size is not positive, or input data is invalid
+    """
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be positive")
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    resolved = load_calculator(calculator)
+    batch = resolved.as_columns(data)
+    rows = len(batch)
+    workers = workers or os.cpu_count() or 1
+    
+    blocks: List[SharedMemory] = []
+    outputs: Dict[str, np.ndarray] = {}
+    try:
+        input_specs: Dict[str, _ArraySpec] = {}
+        for name, column in batch.columns.items():
+            labels = column.labels if isinstance(column, CategoricalArray) else None
+            array = column.codes if isinstance(column, CategoricalArray) else np.ascontiguousarray(column)
+            block, _ = _create_shared(array, blocks)
+            input_specs[name] = (block.name, array.dtype.str, array.shape, labels)
+        
+        output_specs: Dict[str, _ArraySpec] = {}
+        for name, spec in column_schema(resolved.output_model).items():
+            categorical = spec.dtype.kind == "U"
+            dtype = np.dtype(np.int32) if categorical else spec.dtype
+            block, outputs[name] = _create_shared(np.zeros(rows, dtype=dtype), blocks)
+            output_specs[name] = (block.name, dtype.str, (rows,), () if categorical else None)
+        
+        context = multiprocessing.get_context(start_method)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(calculator, input_specs, output_specs)
+        ) as pool:
+            bounds = [(start, min(start + chunk_size, rows)) for start in range(0, rows, chunk_size)]
+            futures = [pool.submit(_run_chunk, start, stop) for start, stop in bounds]
+            chunk_labels = [future.result() for future in futures]
+        
+        columns: Dict[str, Any] = {}
+        for name, shared in outputs.items():
+            values = shared.copy()
+            if output_specs[name][3] is not None:
+                labels = _merge_labels(
+                    values, [(start, stop, chunk[name]) for (start, stop), chunk in zip(bounds, chunk_labels)]
+                )
+                columns[name] = CategoricalArray(values, labels)
+            else:
+                columns[name] = values
+        return ResultBatch(resolved.output_model, columns, validate=False)
+    finally:
+        # Views must be released before their blocks can be closed.
+        outputs.clear()
+        for block in blocks:
+            block.close()
+            block.unlink()
@@ -0,0 +1,159 @@
+"""Streaming calculation over iterables of raw inputs with bounded memory.
+
+Rows are pulled from the source in micro-batches: each batch is validated,
+scored with the calculator's batch path and yielded before the next one is
+read, so at most ``batch_size`` rows are held at any time. Rows that fail
+validation or calculation are reported to an error callback instead of ending
+the stream.
+
+Micro-batches of plain mappings for models without custom validators are
+validated column-wise by ``ColumnarBatch``; if that fails, or for any other
+input, the rows are validated one by one so each invalid row is reported on
+its own.
+"""
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, NamedTuple, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+from pint.errors import PintError
+from pydantic import BaseModel
+
+from mc4llm.models import ColumnarBatch, ResultBatch, column_schema
+
+if TYPE_CHECKING:
+    from mc4llm.calculator.base import Calculator
+
+class RowError(NamedTuple):
+    """An input row rejected by ``stream_calculate``."""
+    # Position of the row in the input stream
+    index: int
+    # The raw row as it was read
+    data: Any
+    error: Exception
+    # "validation" or "calculation"
+    stage: str
+
+def _row_validator(model: type) -> Callable[[Any], BaseModel]:
+    """Build the function turning one raw row (model instance, mapping or JSON text) into an input model."""
+    validator = model.__pydantic_validator__
+    validate_python = validator.validate_python
+    validate_json = validator.validate_json
+    
+    def validate(data: Any) -> BaseModel:
+        if isinstance(data, (str, bytes, bytearray)):
+            return validate_json(data)
+        if isinstance(data, model):
+            return data
+        return validate_python(data)
+    return validate
+
+def _column_fields(model: type) -> Optional[Tuple[str, ...]]:
+    """Return the model's field names if its rows can be validated column-wise, else None."""
+    decorators = model.__pydantic_decorators__
+    if decorators.validators or decorators.field_validators or decorators.model_validators or decorators.root_validators:
+        return None
+    try:
+        return tuple(column_schema(model))
+    except TypeError:
+        return None
+
+def _to_columns(model: type, fields: Tuple[str, ...], chunk: List[Any]) -> Optional[ColumnarBatch]:
+    """Validate a chunk of mappings as one columnar batch, or return None if it needs row-wise validation."""
+    if not all(isinstance(data, Mapping) for data in chunk):
+        return None
+    try:
+        return ColumnarBatch(model, {name: [data[name] for data in chunk] for name in fields})
+    except (KeyError, ValueError, TypeError):
+        return None
+
+def _report(on_error: Optional[Callable[[RowError], Any]], row_error: RowError) -> None:
+    if on_error is None:
+        raise row_error.error
+    on_error(row_error)
+
+def stream_calculate(
+    calculator: "Calculator",
+    rows: Iterable[Any],
+    batch_size: int = 256,
+    on_error: Optional[Callable[[RowError], Any]] = None,
+    with_index: bool = False,
+    batches: bool = False
+) -> Iterator[Any]:
+    """
+    Calculate results for a stream of raw inputs, one micro-batch at a time.
+    
+    Rows may be instances of the input model, mappings of its fields, or JSON
+    text (str or bytes). Each micro-batch is scored with ``calculate_batch``, or
+    ``calculate_results`` when yielding batches; if that fails, its rows are
+    retried one by one so only the failing rows are rejected. Results are
+    yielded in input order, skipping rejected rows.
+    
+    Args:
+        calculator: The calculator to run
+        rows: Any iterable of raw inputs; it is consumed lazily
+        batch_size: Rows per micro-batch, which bounds the rows held in memory
+        on_error: Called with a ``RowError`` for every rejected row, with stage
+            "validation" or "calculation"; if None, the first error is raised
+        with_index: Yield ``(index, result)`` pairs, where index is the row's
+            position in ``rows``, instead of bare results
+        batches: Yield one ``ResultBatch`` per micro-batch instead of one output
+            model per row; with ``with_index``, index is an int64 array of the
+            positions of its rows
+            
+    Yields:
+        The output model of every accepted row, or a ``ResultBatch`` per
+        micro-batch, optionally paired with their positions in ``rows``
+        
+    Raises:
+        ValueError: If batch_size is not positive
+        Exception: Without ``on_error``, the error of the first rejected row
+    """
+    if batch_size <= 0:
+        raise ValueError("batch_size must be positive")
+    model = calculator.input_model
+    validate = _row_validator(model)
+    fields = _column_fields(model)
+    source = iter(rows)
+    offset = 0
+    while True:
+        chunk = list(islice(source, batch_size))
+        if not chunk:
+            return
+        columns = _to_columns(model, fields, chunk) if fields is not None else None
+        if columns is not None:
+            indices = list(range(offset, offset + len(chunk)))
+            inputs: Any = columns
+        else:
+            indices = []
+            inputs = []
+            for index, data in enumerate(chunk, offset):
+                try:
+                    inputs.append(validate(data))
+                except (ValueError, TypeError, PintError) as error:
+                    _report(on_error, RowError(index, data, error, "validation"))
+                    continue
+                indices.append(index)
+        
+        if indices:
+            try:
+                outputs = calculator.calculate_results(inputs) if batches else calculator.calculate_batch(inputs)
+            except Exception:
+                # Retry the failed batch row by row to isolate the failing rows.
+                rows_in = columns.rows() if columns is not None else inputs
+                retried = []
+                kept = []
+                for index, row in zip(indices, rows_in):
+                    try:
+                        retried.append(calculator.calculate(row))
+                    except Exception as error:
+                        _report(on_error, RowError(index, chunk[index - offset], error, "calculation"))
+                        continue
+                    kept.append(index)
+                indices = kept
+                outputs = ResultBatch.from_rows(calculator.output_model, retried) if batches else retried
+            
+            if not batches:
+                yield from zip(indices, outputs) if with_index else outputs
+            elif indices:
+                yield (np.array(indices, dtype=np.int64), outputs) if with_index else outputs
+        offset += len(chunk)
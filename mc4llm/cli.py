@@ -0,0 +1,418 @@
+"""Bulk scoring of CSV and JSONL files: ``mc4llm-score CALCULATOR INPUT [-o OUTPUT]``.
+
+The input is parsed as a stream and scored in chunks of rows, in this process
+or on a pool of worker processes, and the results of each chunk are written
+as soon as it completes. At most a few chunks are held in memory at a time,
+whatever the size of the file. Rows that fail validation or calculation are
+counted and optionally written to an error file instead of stopping the run.
+
+An input directory saved with ``ColumnarBatch.save`` is memory-mapped and
+scored as a whole, and its results are saved to the output directory in the
+same format, so re-scoring a cohort skips parsing altogether.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mc4llm.calculator.base import Calculator
+
+FORMATS = ("csv", "jsonl")
+
+_EXTENSIONS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+# Scored chunk: (rendered outputs, number of outputs, rejected rows as JSON-compatible dicts).
+_ChunkResult = Tuple[str, int, List[Dict[str, Any]]]
+
+# Per-process state set up by _init_worker.
+_worker: Dict[str, Any] = {}
+
+@dataclass
+class ScoreReport:
+    """Counters of a bulk scoring run."""
+    rows: int = 0
+    scored: int = 0
+    errors: int = 0
+    seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+def resolve_calculator(
+    reference: Union[str, "Calculator"],
+    version: Optional[str] = None,
+    manifests: Sequence[str] = ()
+) -> "Calculator":
+    """
+    Resolve a calculator from a registry id or an importable path.
+    
+    Args:
+        reference: A calculator instance, a registry id such as "simple_who_bmi",
+            or an import path such as "package.module:NAME"
+        version: Registry version, or None for the highest registered version
+        manifests: Extra calculator manifests loaded into the default registry
+        
+    Returns:
+        Calculator: The calculator instance
+        
+    Raises:
+        ValueError: If the calculator is not registered or cannot be imported
+        TypeError: If the reference does not point to a Calculator instance
+    """
+    from mc4llm.calculator import load_calculator
+    from mc4llm.registry import default_registry
+
+    if not isinstance(reference, str) or ":" in reference or "." in reference:
+        return load_calculator(reference)
+    registry = default_registry()
+    for manifest in manifests:
+        registry.load_manifest(manifest, replace=True)
+    return registry.get(reference, version)
+
+def detect_format(path: str, format: Optional[str] = None) -> str:
+    """
+    Get the file format of a path from its extension, unless given explicitly.
+    
+    Args:
+        path: File path, or "-" for standard input/output
+        format: "csv" or "jsonl", or None to use the extension
+        
+    Returns:
+        str: "csv" or "jsonl"
+        
+    Raises:
+        ValueError: If the format is unknown or cannot be told from the path
+    """
+    if format is None:
+        format = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+        if format is None:
+            raise ValueError(f"Cannot tell the format of '{path}'; pass one of: {', '.join(FORMATS)}")
+    if format not in FORMATS:
+        raise ValueError(f"Unknown format '{format}'; expected one of: {', '.join(FORMATS)}")
+    return format
+
+def _magnitude(value: str) -> Union[float, str]:
+    """Parse the value cell of a Quantity, leaving text that is not a number for validation to reject."""
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+def read_rows(stream: IO, format: str) -> Iterator[Any]:
+    """
+    Parse input rows lazily.
+    
+    JSONL lines are yielded as raw bytes and blank lines are skipped. CSV rows
+    are yielded as dicts without their empty cells, so those fields take their
+    defaults; a header like "weight.value" nests the cell under "weight", which
+    is how Quantity fields are given as value and unit columns. Value cells are
+    parsed as numbers.
+    
+    Args:
+        stream: Binary stream for JSONL, text stream opened with ``newline=""`` for CSV
+        format: "csv" or "jsonl"
+        
+    Yields:
+        One raw row per input record
+    """
+    if format == "jsonl":
+        for line in stream:
+            if line.strip():
+                yield line
+        return
+    reader = csv.reader(stream)
+    header = next(reader, None)
+    if header is None:
+        return
+    paths = [tuple(name.split(".")) for name in header]
+    nested = any(len(path) > 1 for path in paths)
+    for record in reader:
+        if not nested:
+            yield {name: value for name, value in zip(header, record) if value}
+            continue
+        row: Dict[str, Any] = {}
+        for path, value in zip(paths, record):
+            if value:
+                target = row
+                for key in path[:-1]:
+                    target = target.setdefault(key, {})
+                target[path[-1]] = _magnitude(value) if path[-1] == "value" else value
+        yield row
+
+def _csv_value(value: Any) -> Any:
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+def _render(outputs: Iterable[Any], format: str) -> Tuple[str, int]:
+    """Serialize output models as CSV records or JSONL lines; returns the text and the row count."""
+    count = 0
+    if format == "jsonl":
+        lines = []
+        for output in outputs:
+            lines.append(output.model_dump_json())
+            count += 1
+        return "".join(line + "\n" for line in lines), count
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for output in outputs:
+        writer.writerow([_csv_value(value) for value in output.model_dump(mode="json").values()])
+        count += 1
+    return buffer.getvalue(), count
+
+def score_chunk(calculator: "Calculator", offset: int, rows: List[Any], output_format: str) -> _ChunkResult:
+    """
+    Score one chunk of raw rows and render its results.
+    
+    Args:
+        calculator: The calculator to run
+        offset: Position of the chunk's first row in the input
+        rows: Raw rows as yielded by ``read_rows``
+        output_format: "csv" or "jsonl"
+        
+    Returns:
+        Tuple: The rendered outputs, their count, and one dict per rejected row
+        with its position ("row"), "stage" and "error" message
+    """
+    from mc4llm.calculator import stream_calculate
+
+    rejected = []
+    text, count = _render(stream_calculate(calculator, rows, on_error=rejected.append), output_format)
+    errors = [
+        {"row": offset + error.index, "stage": error.stage, "error": str(error.error)}
+        for error in rejected
+    ]
+    return text, count, errors
+
+def _init_worker(reference: Union[str, "Calculator"], version: Optional[str], manifests: Sequence[str], output_format: str) -> None:
+    _worker.update(calculator=resolve_calculator(reference, version, manifests), output_format=output_format)
+
+def _score_in_worker(offset: int, rows: List[Any]) -> _ChunkResult:
+    return score_chunk(_worker["calculator"], offset, rows, _worker["output_format"])
+
+def _chunks(rows: Iterable[Any], chunk_size: int) -> Iterator[Tuple[int, List[Any]]]:
+    source = iter(rows)
+    offset = 0
+    while True:
+        chunk = list(islice(source, chunk_size))
+        if not chunk:
+            return
+        yield offset, chunk
+        offset += len(chunk)
+
+def score_stream(
+    calculator: Union[str, "Calculator"],
+    source: IO,
+    output: IO,
+    input_format: str,
+    output_format: str = "jsonl",
+    chunk_size: int = 10_000,
+    workers: int = 1,
+    errors: Optional[IO] = None,
+    version: Optional[str] = None,
+    manifests: Sequence[str] = ()
+) -> ScoreReport:
+    """
+    Score every row of an input stream and write the results incrementally.
+    
+    Results are written in input order, one per accepted row; CSV output starts
+    with a header of the output model's fields. With several workers, chunks are
+    scored in parallel and at most two per worker are in flight.
+    
+    Args:
+        calculator: A calculator, registry id or import path; see ``resolve_calculator``
+        source: Input stream, as expected by ``read_rows``
+        output: Text stream the results are written to
+        input_format: "csv" or "jsonl"
+        output_format: "csv" or "jsonl"
+        chunk_size: Rows scored per task
+        workers: Number of processes scoring chunks; 1 scores in this process
+        errors: Text stream receiving one JSON line per rejected row, if given
+        version: Registry version of the calculator
+        manifests: Extra calculator manifests for registry ids
+        
+    Returns:
+        ScoreReport: Row, result and error counts and the elapsed time
+        
+    Raises:
+        ValueError: If chunk_size or workers is not positive, or the calculator cannot be resolved
+    """
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if workers <= 0:
+        raise ValueError("workers must be positive")
+    for format in (input_format, output_format):
+        if format not in FORMATS:
+            raise ValueError(f"Unknown format '{format}'; expected one of: {', '.join(FORMATS)}")
+    resolved = resolve_calculator(calculator, version, manifests)
+
+    report = ScoreReport()
+    start = time.perf_counter()
+    if output_format == "csv":
+        csv.writer(output).writerow(resolved.output_model.model_fields)
+
+    def write(rows: int, result: _ChunkResult) -> None:
+        text, count, rejected = result
+        output.write(text)
+        if errors is not None:
+            errors.writelines(json.dumps(error) + "\n" for error in rejected)
+        report.rows += rows
+        report.scored += count
+        report.errors += len(rejected)
+
+    chunks = _chunks(read_rows(source, input_format), chunk_size)
+    if workers == 1:
+        for offset, rows in chunks:
+            write(len(rows), score_chunk(resolved, offset, rows, output_format))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(calculator, version, tuple(manifests), output_format)
+        ) as pool:
+            pending: Deque[Tuple[int, Future]] = deque()
+            for offset, rows in chunks:
+                pending.append((len(rows), pool.submit(_score_in_worker, offset, rows)))
+                if len(pending) >= 2 * workers:
+                    count, future = pending.popleft()
+                    write(count, future.result())
+            while pending:
+                count, future = pending.popleft()
+                write(count, future.result())
+    report.seconds = time.perf_counter() - start
+    return report
+
+def score_columns(
+    calculator: Union[str, "Calculator"],
+    source: str,
+    output: str,
+    workers: int = 1,
+    chunk_size: int = 100_000,
+    version: Optional[str] = None,
+    manifests: Sequence[str] = ()
+) -> ScoreReport:
+    """
+    Score a column directory written by ``ColumnarBatch.save`` into another one.
+    
+    Args:
+        calculator: A calculator, registry id or import path; see ``resolve_calculator``
+        source: Directory of a saved batch of the calculator's input model
+        output: Directory the result batch is saved to
+        workers: Number of processes; more than 1 uses ``calculate_parallel``
+        chunk_size: Rows per task when scoring on several processes
+        version: Registry version of the calculator
+        manifests: Extra calculator manifests for registry ids
+        
+    Returns:
+        ScoreReport: Row and result counts and the elapsed time
+        
+    Raises:
+        ValueError: If the directory does not hold a valid batch of the input model,
+            or the output directory is the source directory
+    """
+    from mc4llm.models import ColumnarBatch
+
+    if os.path.isdir(output) and os.path.samefile(source, output):
+        raise ValueError(f"Scores cannot be saved into the input directory '{source}'")
+    resolved = resolve_calculator(calculator, version, manifests)
+    start = time.perf_counter()
+    batch = ColumnarBatch.load(source, resolved.input_model)
+    if workers == 1:
+        results = resolved.calculate_results(batch)
+    else:
+        results = resolved.calculate_parallel(batch, workers=workers, chunk_size=chunk_size)
+    results.save(output)
+    return ScoreReport(rows=len(batch), scored=len(results), seconds=time.perf_counter() - start)
+
+def _open(path: str, mode: str, format: str) -> IO:
+    """Open a file or a standard stream: binary for JSONL input, text with universal newlines off for CSV."""
+    binary = format == "jsonl" and "r" in mode
+    if path == "-":
+        stream = sys.stdin if "r" in mode else sys.stdout
+        return stream.buffer if binary else stream
+    if binary:
+        return open(path, mode + "b")
+    return open(path, mode, newline="" if format == "csv" else None, encoding="utf-8")
+
+def _print_report(report: ScoreReport) -> None:
+    print(
+        f"{report.rows} rows, {report.scored} scored, {report.errors} errors "
+        f"in {report.seconds:.2f}s ({report.rows_per_second:,.0f} rows/s)",
+        file=sys.stderr
+    )
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="mc4llm-score",
+        description="Score a CSV or JSONL file with a calculator, streaming rows in chunks."
+    )
+    parser.add_argument("calculator", help="Registry id (e.g. simple_who_bmi) or import path (package.module:NAME)")
+    parser.add_argument("input", help="Input CSV or JSONL file, - for standard input, or a column directory")
+    parser.add_argument("-o", "--output", default="-", help="Output file, or directory for column input (default: standard output)")
+    parser.add_argument("--input-format", choices=FORMATS, help="Input format (default: from the extension)")
+    parser.add_argument("--output-format", choices=FORMATS, help="Output format (default: from the extension, else jsonl)")
+    parser.add_argument("--errors", help="Write one JSON line per rejected row to this file")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Rows per scoring task")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes (default: 1, score in-process)")
+    parser.add_argument("--version", dest="calculator_version", help="Calculator version for registry ids")
+    parser.add_argument("--manifest", action="append", default=[], help="Extra calculator manifest (repeatable)")
+    args = parser.parse_args(argv)
+
+    columns = os.path.isdir(args.input)
+    if columns and args.output == "-":
+        parser.error("Scoring a column directory needs an output directory (-o)")
+    try:
+        input_format = "columns" if columns else detect_format(args.input, args.input_format)
+        if columns:
+            output_format = "columns"
+        elif args.output_format is None and args.output == "-":
+            output_format = "jsonl"
+        else:
+            output_format = detect_format(args.output, args.output_format)
+        calculator = resolve_calculator(args.calculator, args.calculator_version, args.manifest)
+    except (ValueError, TypeError) as error:
+        parser.error(str(error))
+    if args.chunk_size <= 0 or args.workers <= 0:
+        parser.error("--chunk-size and --workers must be positive")
+    # Workers import the calculator themselves from its reference.
+    reference = calculator if args.workers == 1 else args.calculator
+    
+    if columns:
+        try:
+            report = score_columns(
+                reference, args.input, args.output, workers=args.workers, chunk_size=args.chunk_size,
+                version=args.calculator_version, manifests=args.manifest
+            )
+        except ValueError as error:
+            parser.error(str(error))
+        _print_report(report)
+        return 0
+
+    source = _open(args.input, "r", input_format)
+    output = _open(args.output, "w", output_format)
+    errors = open(args.errors, "w", encoding="utf-8") if args.errors else None
+    try:
+        report = score_stream(
+            reference, source, output, input_format, output_format,
+            chunk_size=args.chunk_size, workers=args.workers, errors=errors,
+            version=args.calculator_version, manifests=args.manifest
+        )
+    finally:
+        for stream in (source, output, errors):
+            if stream is sys.stdout:
+                stream.flush()
+            elif stream is not None and stream not in (sys.stdin, sys.stdin.buffer):
+                stream.close()
+    _print_report(report)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,10 +3,11 @@
 """Medical calculator modules.
 
 Collection of various medical calculators and their associated functionality.
+Calculator modules are imported on first attribute access.
 """
 
-from . import bmi
+from mc4llm._lazy import lazy_exports
 
 __all__ = ["bmi"]
 
-# Empty file to make the directory a Python package
+__getattr__, __dir__ = lazy_exports(__name__, attributes={}, submodules=__all__)
@@ -1,9 +1,15 @@
 """BMI Calculator Module
 
 Provides functionality for calculating Body Mass Index (BMI).
+The calculator and its models are imported on first attribute access.
 """
 
-from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput,SIMPLE_WHO_BMI_CALCULATOR
+from typing import TYPE_CHECKING
+
+from mc4llm._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput, SIMPLE_WHO_BMI_CALCULATOR
 
 
 __all__ = [
@@ -11,3 +17,9 @@ __all__ = [
     "BMIInput",
     "BMIOutput"
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attributes={name: "mc4llm.example_calculators.bmi.simple_bmi" for name in __all__},
+    submodules=["simple_bmi", "bmi_with_units"]
+)
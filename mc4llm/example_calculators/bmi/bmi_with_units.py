@@ -1,7 +1,11 @@
+from typing import List, Sequence, Union
+
+import numpy as np
 from pydantic import Field
 from pint import Quantity
 
 from mc4llm.models.base import IOModel, convert_unit
+from mc4llm.models.columnar import CategoricalArray, ColumnarBatch, ResultBatch
 from mc4llm.guideline import BaseGuideline
 from mc4llm.rule import RangeRule
 from mc4llm.formula import BaseFormula
@@ -71,18 +75,41 @@ WHO_BMI_GUIDELINE.rules.add(who_bmi_range_rule)
 class BMICalculatorWithUnits(Calculator[BMIInputWithUnits, BMIOutputWithUnits]):
     """BMI calculator implementation with unit conversion."""
     
+    formula_name = "standard"
+    rule_name = "bmi"
+    
     def calculate(self, data: BMIInputWithUnits) -> BMIOutputWithUnits:
         """Calculate BMI using the guideline's formula."""
-        # Calculate BMI using guideline's standard formula
-        formula = self.guideline.get_formula("standard")
-        bmi_value = formula.calculate(**data.model_dump())
-        
-        # Get category from guideline's BMI rule
-        bmi_rule = self.guideline.get_rule("bmi")
-        category = bmi_rule.categorize(bmi_value)
+        # The compiled plan runs the guideline's standard formula on the input
+        # fields and categorizes the result with its BMI rule
+        bmi_value, category = self.plan(data)
         
         # Create output
-        return BMIOutputWithUnits(bmi=bmi_value, category=category)
+        return self.build_output(bmi=bmi_value, category=category)
+
+    def calculate_columns(self, data: Union[Sequence[BMIInputWithUnits], ColumnarBatch]) -> ColumnarBatch:
+        """Calculate BMI for many inputs by running the formula and rule over whole arrays."""
+        plan = self.plan
+        
+        # Columns hold kilograms and meters, so each field becomes one Quantity array.
+        columns = self.as_columns(data)
+        # Raise on a zero height like the scalar path instead of returning inf or nan.
+        with np.errstate(divide="raise", invalid="raise"):
+            try:
+                bmi_values = plan.formula.calculate(weight=columns.quantity("weight"), height=columns.quantity("height"))
+            except FloatingPointError as error:
+                raise ZeroDivisionError("float division by zero") from error
+        codes, labels = plan.rule.categorize_many(bmi_values, return_codes=True)
+        
+        return ResultBatch(
+            self.output_model,
+            {"bmi": bmi_values, "category": CategoricalArray(codes, labels)},
+            validate=False
+        )
+
+    def calculate_batch(self, data: Union[Sequence[BMIInputWithUnits], ColumnarBatch]) -> List[BMIOutputWithUnits]:
+        """Calculate BMI for many inputs with the vectorized column path."""
+        return self.build_outputs(self.calculate_columns(data))
 
 
 # Creating an instance of the Calculator
@@ -1,5 +1,9 @@
-from pydantic import Field, BaseModel
+from typing import List, Sequence, Union
 
+import numpy as np
+from pydantic import Field
+
+from mc4llm.models import IOModel, CategoricalArray, ColumnarBatch, ResultBatch
 from mc4llm.guideline import BaseGuideline
 from mc4llm.rule import RangeRule
 from mc4llm.formula import BaseFormula
@@ -7,11 +11,11 @@ from mc4llm.calculator import Calculator
 
 
 # Define the input and output models for the calculator
-class BMIInput(BaseModel):
+class BMIInput(IOModel):
     weight: float = Field(..., description="Weight in kilograms")
     height: float = Field(..., description="Height in meters")
 
-class BMIOutput(BaseModel):
+class BMIOutput(IOModel):
     bmi: float = Field(..., description="Body Mass Index")
     category: str = Field(..., description="BMI category")
     
@@ -49,19 +53,40 @@ WHO_BMI_GUIDELINE.rules.add(who_bmi_range_rule)
 class BMICalculator(Calculator[BMIInput, BMIOutput]):
     """BMI calculator implementation."""
     
+    formula_name = "standard"
+    rule_name = "bmi"
+    
     def calculate(self, data: BMIInput) -> BMIOutput:
         """Calculate BMI using the guideline's formula."""
+        # The compiled plan runs the guideline's standard formula on the input
+        # fields and categorizes the result with its BMI rule
+        bmi_value, category = self.plan(data)
+        
+        # Create output
+        return self.build_output(bmi=bmi_value, category=category)
 
-        # Calculate BMI using guideline's standard formula
-        formula = self.guideline.get_formula("standard")
-        bmi_value = formula.calculate(**data.model_dump())
+    def calculate_columns(self, data: Union[Sequence[BMIInput], ColumnarBatch]) -> ColumnarBatch:
+        """Calculate BMI for many inputs by running the formula and rule over whole arrays."""
+        plan = self.plan
         
-        # Get category from guideline's BMI rule
-        bmi_rule = self.guideline.get_rule("bmi")
-        category = bmi_rule.categorize(bmi_value)
+        columns = self.as_columns(data)
+        # Raise on a zero height like the scalar path instead of returning inf or nan.
+        with np.errstate(divide="raise", invalid="raise"):
+            try:
+                bmi_values = plan.formula.calculate(weight=columns["weight"], height=columns["height"])
+            except FloatingPointError as error:
+                raise ZeroDivisionError("float division by zero") from error
+        codes, labels = plan.rule.categorize_many(bmi_values, return_codes=True)
         
-        # Create output
-        return BMIOutput(bmi=bmi_value, category=category)
+        return ResultBatch(
+            self.output_model,
+            {"bmi": bmi_values, "category": CategoricalArray(codes, labels)},
+            validate=False
+        )
+
+    def calculate_batch(self, data: Union[Sequence[BMIInput], ColumnarBatch]) -> List[BMIOutput]:
+        """Calculate BMI for many inputs with the vectorized column path."""
+        return self.build_outputs(self.calculate_columns(data))
 
 #Creating a instance of the Calculator
 SIMPLE_WHO_BMI_CALCULATOR = BMICalculator(
@@ -1,6 +1,9 @@
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, TypeVar, Generic
 
+from mc4llm import instrumentation
+
 # Define generic type variables for input and output
 InputType = TypeVar('InputType')
 OutputType = TypeVar('OutputType')
@@ -12,9 +15,62 @@ class BaseFormula(Generic[InputType, OutputType], ABC):
         InputType: The type of input parameters the formula accepts
         OutputType: The type of output the formula produces
     """
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "calculate" in cls.__dict__:
+            instrumentation.probe(cls, "calculate", "formula", instrumentation.component_name())
+    
     def __init__(self, name: Optional[str] = None):
         self.name = name or "default"
     
+    @property
+    def name(self) -> str:
+        """Name of the formula, unique within each guideline holding it."""
+        return self._name
+    
+    @name.setter
+    def name(self, name: str) -> None:
+        # Keep the name index of every owning guideline in step with the new name.
+        guidelines = list(self._owners())
+        for guideline in guidelines:
+            guideline.formulas._check_rename(self, name)
+        self._modify()
+        self._name = name
+        for guideline in guidelines:
+            guideline.formulas._reindex()
+    
+    def _owners(self) -> "weakref.WeakSet":
+        """
+        Get the guidelines holding this formula, kept up to date by their collections.
+        
+        Created on first use, so subclasses that do not call ``__init__`` are tracked too.
+        """
+        return self.__dict__.setdefault("_guidelines", weakref.WeakSet())
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_guidelines"] = list(self._owners())
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        guidelines = state.pop("_guidelines", ())
+        self.__dict__.update(state)
+        self._guidelines = weakref.WeakSet(guidelines)
+    
+    def _modify(self) -> None:
+        """
+        Called by subclasses before a change that alters results: invalidates the
+        compiled plans and cached results of every guideline holding this formula.
+        
+        Raises:
+            TypeError: If one of those guidelines is frozen
+        """
+        guidelines = list(self._owners())
+        if any(guideline.frozen for guideline in guidelines):
+            raise TypeError("Formula belongs to a frozen guideline and cannot be modified")
+        for guideline in guidelines:
+            guideline._modify()
+    
     @abstractmethod
     def calculate(self, params: InputType) -> OutputType:
         """
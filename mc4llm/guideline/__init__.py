@@ -1,3 +1,4 @@
 from mc4llm.guideline.base import BaseGuideline
+from mc4llm.guideline.plan import GuidelinePlan
 
-__all__ = ['BaseGuideline'] 
\ No newline at end of file
+__all__ = ['BaseGuideline', 'GuidelinePlan'] 
\ No newline at end of file
@@ -1,15 +1,35 @@
-from typing import List, Union, Dict, Optional, Sequence, overload, Iterator
+from typing import List, Union, Dict, Optional, Sequence, overload, Iterable, Iterator
 from collections.abc import MutableSequence
+from pydantic import BaseModel
 from mc4llm.rule.base import BaseRule
 from mc4llm.formula.base import BaseFormula
+from mc4llm.guideline.plan import GuidelinePlan
 
 class RuleCollection(MutableSequence[BaseRule]):
     """Collection class for managing rules in a guideline."""
     
     def __init__(self, parent: 'BaseGuideline'):
         self._rules: List[BaseRule] = []
+        # Position of each rule by name, kept in sync with the list for O(1) lookups
+        self._index: Dict[str, int] = {}
         self._parent = parent
     
+    def _reindex(self) -> None:
+        self._index = {rule.name: i for i, rule in enumerate(self._rules)}
+    
+    def _check_rename(self, rule: BaseRule, name: str) -> None:
+        """Raise ValueError if another rule of the collection already has the name a rule is renamed to."""
+        i = self._index.get(name)
+        if i is not None and self._rules[i] is not rule:
+            raise ValueError(f"Rule with name '{name}' already exists")
+    
+    def _track(self, removed: Iterable[BaseRule], added: Iterable[BaseRule]) -> None:
+        """Record which guideline each rule belongs to, so rules can invalidate it when they change."""
+        for rule in removed:
+            rule._owners().discard(self._parent)
+        for rule in added:
+            rule._owners().add(self._parent)
+    
     def __getitem__(self, i: int) -> BaseRule:
         return self._rules[i]
     
@@ -19,22 +39,54 @@ class RuleCollection(MutableSequence[BaseRule]):
     def __iter__(self) -> Iterator[BaseRule]:
         return iter(self._rules)
     
-    def __setitem__(self, i: int, rule: BaseRule) -> None:
+    def __setitem__(self, i: Union[int, slice], rule: Union[BaseRule, Iterable[BaseRule]]) -> None:
+        if isinstance(i, slice):
+            rules = list(rule)
+            for item in rules:
+                if not isinstance(item, BaseRule):
+                    raise TypeError("Rule must be an instance of BaseRule")
+            updated = self._rules.copy()
+            updated[i] = rules
+            seen = set()
+            for item in updated:
+                if item.name in seen:
+                    raise ValueError(f"Rule with name '{item.name}' already exists")
+                seen.add(item.name)
+            self._parent._modify()
+            self._track(self._rules, updated)
+            self._rules = updated
+            self._reindex()
+            return
         if not isinstance(rule, BaseRule):
             raise TypeError("Rule must be an instance of BaseRule")
-        if any(r.name == rule.name for j, r in enumerate(self._rules) if j != i):
+        i = range(len(self._rules))[i]
+        if self._index.get(rule.name, i) != i:
             raise ValueError(f"Rule with name '{rule.name}' already exists")
+        self._parent._modify()
+        self._track([self._rules[i]], [rule])
+        del self._index[self._rules[i].name]
         self._rules[i] = rule
+        self._index[rule.name] = i
     
-    def __delitem__(self, i: int) -> None:
+    def __delitem__(self, i: Union[int, slice]) -> None:
+        self._parent._modify()
+        self._track(self._rules[i] if isinstance(i, slice) else [self._rules[i]], ())
         del self._rules[i]
+        self._reindex()
     
     def insert(self, index: int, rule: BaseRule) -> None:
         if not isinstance(rule, BaseRule):
             raise TypeError("Rule must be an instance of BaseRule")
-        if any(r.name == rule.name for r in self._rules):
+        if rule.name in self._index:
             raise ValueError(f"Rule with name '{rule.name}' already exists")
+        self._parent._modify()
+        self._track((), [rule])
+        appending = index >= len(self._rules)
         self._rules.insert(index, rule)
+        if appending:
+            self._index[rule.name] = len(self._rules) - 1
+        else:
+            self._reindex()
     
     @overload
     def add(self, rule: BaseRule) -> None: ...
@@ -77,10 +129,10 @@ class RuleCollection(MutableSequence[BaseRule]):
         """
         if not isinstance(name, str):
             raise TypeError("Rule name must be a string")
-        for rule in self._rules:
-            if rule.name == name:
-                return rule
-        raise ValueError(f"Rule '{name}' not found")
+        i = self._index.get(name)
+        if i is None:
+            raise ValueError(f"Rule '{name}' not found")
+        return self._rules[i]
     
     def names(self) -> List[str]:
         """Get names of all rules in the collection."""
@@ -91,8 +143,26 @@ class FormulaCollection(MutableSequence[BaseFormula]):
     
     def __init__(self, parent: 'BaseGuideline'):
         self._formulas: List[BaseFormula] = []
+        # Position of each formula by name, kept in sync with the list for O(1) lookups
+        self._index: Dict[str, int] = {}
         self._parent = parent
     
+    def _reindex(self) -> None:
+        self._index = {formula.name: i for i, formula in enumerate(self._formulas)}
+    
+    def _check_rename(self, formula: BaseFormula, name: str) -> None:
+        """Raise ValueError if another formula of the collection already has the name a formula is renamed to."""
+        i = self._index.get(name)
+        if i is not None and self._formulas[i] is not formula:
+            raise ValueError(f"Formula with name '{name}' already exists")
+    
+    def _track(self, removed: Iterable[BaseFormula], added: Iterable[BaseFormula]) -> None:
+        """Record which guideline each formula belongs to, so formulas can invalidate it when they change."""
+        for formula in removed:
+            formula._owners().discard(self._parent)
+        for formula in added:
+            formula._owners().add(self._parent)
+    
     def __getitem__(self, i: int) -> BaseFormula:
         return self._formulas[i]
     
@@ -102,22 +172,54 @@ class FormulaCollection(MutableSequence[BaseFormula]):
     def __iter__(self) -> Iterator[BaseFormula]:
         return iter(self._formulas)
     
-    def __setitem__(self, i: int, formula: BaseFormula) -> None:
+    def __setitem__(self, i: Union[int, slice], formula: Union[BaseFormula, Iterable[BaseFormula]]) -> None:
+        if isinstance(i, slice):
+            formulas = list(formula)
+            for item in formulas:
+                if not isinstance(item, BaseFormula):
+                    raise TypeError("Formula must be an instance of BaseFormula")
+            updated = self._formulas.copy()
+            updated[i] = formulas
+            seen = set()
+            for item in updated:
+                if item.name in seen:
+                    raise ValueError(f"Formula with name '{item.name}' already exists")
+                seen.add(item.name)
+            self._parent._modify()
+            self._track(self._formulas, updated)
+            self._formulas = updated
+            self._reindex()
+            return
         if not isinstance(formula, BaseFormula):
             raise TypeError("Formula must be an instance of BaseFormula")
-        if any(f.name == formula.name for j, f in enumerate(self._formulas) if j != i):
+        i = range(len(self._formulas))[i]
+        if self._index.get(formula.name, i) != i:
             raise ValueError(f"Formula with name '{formula.name}' already exists")
+        self._parent._modify()
+        self._track([self._formulas[i]], [formula])
+        del self._index[self._formulas[i].name]
         self._formulas[i] = formula
+        self._index[formula.name] = i
     
-    def __delitem__(self, i: int) -> None:
+    def __delitem__(self, i: Union[int, slice]) -> None:
+        self._parent._modify()
+        self._track(self._formulas[i] if isinstance(i, slice) else [self._formulas[i]], ())
         del self._formulas[i]
+        self._reindex()
     
     def insert(self, index: int, formula: BaseFormula) -> None:
         if not isinstance(formula, BaseFormula):
             raise TypeError("Formula must be an instance of BaseFormula")
-        if any(f.name == formula.name for f in self._formulas):
+        if formula.name in self._index:
             raise ValueError(f"Formula with name '{formula.name}' already exists")
+        self._parent._modify()
+        self._track((), [formula])
+        appending = index >= len(self._formulas)
         self._formulas.insert(index, formula)
+        if appending:
+            self._index[formula.name] = len(self._formulas) - 1
+        else:
+            self._reindex()
     
     @overload
     def add(self, formula: BaseFormula) -> None: ...
@@ -160,10 +262,10 @@ class FormulaCollection(MutableSequence[BaseFormula]):
         """
         if not isinstance(name, str):
             raise TypeError("Formula name must be a string")
-        for formula in self._formulas:
-            if formula.name == name:
-                return formula
-        raise ValueError(f"Formula '{name}' not found")
+        i = self._index.get(name)
+        if i is None:
+            raise ValueError(f"Formula '{name}' not found")
+        return self._formulas[i]
     
     def names(self) -> List[str]:
         """Get names of all formulas in the collection."""
@@ -237,6 +339,8 @@ class BaseGuideline:
         self._rules = RuleCollection(self)
         self._formulas = FormulaCollection(self)
         self._description = description
+        self._version = 0
+        self._frozen = False
         
         if rules is not None:
             self._rules.add(rules)
@@ -258,6 +362,52 @@ class BaseGuideline:
         """Get the guideline description."""
         return self._description
     
+    @property
+    def version(self) -> int:
+        """Counter incremented on every change to the rule or formula collections, or to one of their rules or formulas."""
+        return self._version
+    
+    @property
+    def frozen(self) -> bool:
+        """Whether the rule and formula collections reject changes."""
+        return self._frozen
+    
+    def freeze(self) -> "BaseGuideline":
+        """
+        Make the rule and formula collections read-only.
+        
+        Compiled plans of a frozen guideline can never become stale.
+        
+        Returns:
+            BaseGuideline: The guideline itself, for chaining
+        """
+        self._frozen = True
+        return self
+    
+    def _modify(self) -> None:
+        """Called by the collections before every change: rejects it or invalidates compiled plans."""
+        if self._frozen:
+            raise TypeError("Guideline is frozen and cannot be modified")
+        self._version += 1
+    
+    def compile(self, input_model: type[BaseModel], formula: str, rule: Optional[str] = None) -> GuidelinePlan:
+        """
+        Compile an execution plan for one formula and, optionally, one rule.
+        
+        Args:
+            input_model: The model whose fields are bound to the formula's parameters
+            formula: Name of the formula to run
+            rule: Name of the classification rule to apply to the formula's result
+            
+        Returns:
+            GuidelinePlan: The immutable plan, valid until the guideline changes
+            
+        Raises:
+            ValueError: If the formula or rule doesn't exist, or a formula parameter
+                has no matching input field
+        """
+        return GuidelinePlan(self, input_model, formula, rule)
+    
     def get_rule(self, name: str) -> BaseRule:
         """
         Get a specific rule by name.
@@ -272,13 +422,7 @@ class BaseGuideline:
             ValueError: If the rule name doesn't exist
             TypeError: If name is not a string
         """
-        if not isinstance(name, str):
-            raise TypeError("Rule name must be a string")
-            
-        for rule in self.rules:
-            if rule.name == name:
-                return rule
-        raise ValueError(f"Rule '{name}' not found")
+        return self.rules.get(name)
     
     def get_formula(self, name: str) -> BaseFormula:
         """
@@ -294,13 +438,7 @@ class BaseGuideline:
             ValueError: If the formula name doesn't exist
             TypeError: If name is not a string
         """
-        if not isinstance(name, str):
-            raise TypeError("Formula name must be a string")
-            
-        for formula in self.formulas:
-            if formula.name == name:
-                return formula
-        raise ValueError(f"Formula '{name}' not found")
+        return self.formulas.get(name)
     
     def get_available_rules(self) -> List[str]:
         """Get names of all available rules."""
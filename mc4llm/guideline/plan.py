@@ -0,0 +1,163 @@
+import inspect
+from operator import attrgetter
+from typing import Any, Callable, Optional, Tuple, Type, TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from mc4llm.formula.base import BaseFormula
+
+if TYPE_CHECKING:
+    from mc4llm.guideline.base import BaseGuideline
+
+class GuidelinePlan:
+    """Immutable execution plan of one formula (and optionally one rule) of a guideline.
+    
+    The formula and rule are resolved once, and the input model's fields are bound
+    to the formula's parameters by signature, so running the plan does no name
+    lookups and builds no intermediate dicts unless the formula takes keyword-only
+    or ``**kwargs`` parameters.
+    
+    A plan records the guideline version it was compiled from; any later change
+    to the guideline's collections makes it stale (see ``is_current``).
+    """
+    __slots__ = (
+        "guideline", "version", "input_model", "formula", "rule",
+        "positional_fields", "keyword_fields", "_evaluate", "_categorize"
+    )
+
+    def __init__(
+        self,
+        guideline: "BaseGuideline",
+        input_model: Type[BaseModel],
+        formula: str,
+        rule: Optional[str] = None
+    ):
+        """
+        Compile a plan.
+        
+        Args:
+            guideline: The guideline to resolve the formula and rule from
+            input_model: The model whose fields are passed to the formula
+            formula: Name of the formula to run
+            rule: Name of the classification rule applied to the formula's result (optional)
+            
+        Raises:
+            ValueError: If the formula or rule doesn't exist, or a required formula
+                parameter has no matching input field
+            TypeError: If the rule is not a classification rule
+        """
+        resolved_formula = guideline.get_formula(formula)
+        resolved_rule = guideline.get_rule(rule) if rule is not None else None
+        if resolved_rule is not None and not hasattr(resolved_rule, "categorize"):
+            raise TypeError(f"Rule '{rule}' is not a classification rule")
+        positional, keywords = self._bind(resolved_formula, input_model)
+
+        set_attr = object.__setattr__
+        set_attr(self, "guideline", guideline)
+        set_attr(self, "version", guideline.version)
+        set_attr(self, "input_model", input_model)
+        set_attr(self, "formula", resolved_formula)
+        set_attr(self, "rule", resolved_rule)
+        set_attr(self, "positional_fields", positional)
+        set_attr(self, "keyword_fields", keywords)
+        set_attr(self, "_evaluate", self._make_evaluate(resolved_formula.calculate, positional, keywords))
+        set_attr(self, "_categorize", resolved_rule.categorize if resolved_rule is not None else None)
+
+    @staticmethod
+    def _bind(formula: BaseFormula, input_model: Type[BaseModel]) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """
+        Match the formula's parameters to input fields.
+        
+        Returns:
+            The fields passed positionally and the fields passed by keyword
+        """
+        fields = list(input_model.model_fields)
+        positional = []
+        keywords = []
+        accepts_kwargs = False
+        # Parameters are passed positionally until one is skipped or keyword-only.
+        by_position = True
+        for parameter in inspect.signature(formula.calculate).parameters.values():
+            if parameter.kind is parameter.VAR_KEYWORD:
+                accepts_kwargs = True
+                continue
+            if parameter.kind is parameter.VAR_POSITIONAL:
+                continue
+            if parameter.name not in fields:
+                if parameter.default is parameter.empty:
+                    raise ValueError(
+                        f"Formula '{formula.name}' parameter '{parameter.name}' has no matching field "
+                        f"in {input_model.__name__}"
+                    )
+                by_position = False
+                continue
+            if by_position and parameter.kind is not parameter.KEYWORD_ONLY:
+                positional.append(parameter.name)
+            else:
+                by_position = False
+                keywords.append(parameter.name)
+        if accepts_kwargs:
+            keywords.extend(name for name in fields if name not in positional and name not in keywords)
+        return tuple(positional), tuple(keywords)
+
+    @staticmethod
+    def _make_evaluate(
+        calculate: Callable[..., Any], positional: Tuple[str, ...], keywords: Tuple[str, ...]
+    ) -> Callable[[Any], Any]:
+        """Build the closure that calls the formula with the bound input fields."""
+        if keywords:
+            def evaluate(data: Any) -> Any:
+                return calculate(
+                    *[getattr(data, name) for name in positional],
+                    **{name: getattr(data, name) for name in keywords}
+                )
+            return evaluate
+        if not positional:
+            return lambda data: calculate()
+        if len(positional) == 1:
+            get_arg = attrgetter(positional[0])
+            return lambda data: calculate(get_arg(data))
+        get_args = attrgetter(*positional)
+        return lambda data: calculate(*get_args(data))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("GuidelinePlan is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("GuidelinePlan is immutable")
+
+    def __repr__(self) -> str:
+        rule = f", rule={self.rule.name!r}" if self.rule is not None else ""
+        return f"GuidelinePlan(formula={self.formula.name!r}{rule}, version={self.version})"
+
+    @property
+    def is_current(self) -> bool:
+        """Whether the guideline is unchanged since the plan was compiled."""
+        return self.version == self.guideline.version
+
+    def evaluate(self, data: Any) -> Any:
+        """
+        Run the formula on one input.
+        
+        Args:
+            data: An instance of the input model (or any object with its fields as attributes)
+            
+        Returns:
+            The formula's result
+        """
+        return self._evaluate(data)
+
+    def __call__(self, data: Any) -> Tuple[Any, Optional[str]]:
+        """
+        Run the formula on one input and categorize the result.
+        
+        Args:
+            data: An instance of the input model (or any object with its fields as attributes)
+            
+        Returns:
+            The formula's result and its category, or None if the plan has no rule
+        """
+        value = self._evaluate(data)
+        if self._categorize is None:
+            return value, None
+        return value, self._categorize(value)
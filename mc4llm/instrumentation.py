@@ -0,0 +1,297 @@
+"""Per-stage latency instrumentation of calculators, formulas, rules and models.
+
+A sink is any callable ``sink(stage, name, elapsed_ns)`` that receives one call
+per timed stage:
+    
+    ==============  ===============================================  =======================
+    stage           what is timed                                    name
+    ==============  ===============================================  =======================
+    validate        ``model_validate``/``model_validate_json``, and  ``Model.method``
+                    construction of calculator input models
+    convert         pint unit conversion of one value or column      target unit
+    formula         ``BaseFormula.calculate``                        formula name
+    rule            ``categorize`` and ``categorize_many``           ``rule.method``
+    output          ``Calculator.build_output``/``build_outputs``,    ``Calculator.method`` or
+                    and construction of calculator output models     ``Model.__init__``
+    calculate       ``calculate``, ``calculate_batch`` and           ``Calculator.method``
+                    ``calculate_columns``
+    ==============  ===============================================  =======================
+    
+Timings are inclusive: a ``calculate`` covers the formula, rule and output
+stages it runs, and ``validate`` covers the conversions of its fields.
+
+Instrumentation patches timing wrappers onto the instrumented methods when a
+sink is installed and restores the originals when it is removed, so while no
+sink is installed the code paths are exactly the uninstrumented ones. For an
+OpenTelemetry-style backend, pass a callback that records into its histogram::
+    
+    latency = meter.create_histogram("mc4llm.stage.duration", unit="s")
+    set_sink(lambda stage, name, ns: latency.record(ns / 1e9, {"stage": stage, "name": name}))
+"""
+import functools
+import inspect
+import logging
+import threading
+import weakref
+from contextlib import contextmanager
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# sink(stage, name, elapsed_ns)
+Sink = Callable[[str, str, int], None]
+
+_MISSING = object()
+
+_sink: Optional[Sink] = None
+_lock = threading.RLock()
+# Patch points by owner (class or module): attribute -> (stage, namer).
+_probes: "weakref.WeakKeyDictionary[Any, Dict[str, Tuple[Union[str, Callable[[tuple], str]], Callable[[tuple], str]]]]" = (
+    weakref.WeakKeyDictionary()
+)
+# Original attribute values while the probes are installed, by (owner, attribute).
+_originals: Dict[Tuple[int, str], Tuple[Any, Any]] = {}
+_listeners: List[Callable[[], None]] = []
+# Models built by calculators as results; their construction is the "output" stage.
+_output_models: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+def _timed(
+    func: Callable[..., Any],
+    stage: Union[str, Callable[[tuple], str]],
+    namer: Callable[[tuple], str]
+) -> Callable[..., Any]:
+    """Wrap a function so each call reports its duration to the installed sink."""
+    if isinstance(stage, str):
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sink = _sink
+                if sink is not None:
+                    sink(stage, namer(args), perf_counter_ns() - start)
+    else:
+        stage_of = stage
+
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                sink = _sink
+                if sink is not None:
+                    sink(stage_of(args), namer(args), perf_counter_ns() - start)
+    # Also copies function attributes such as pydantic's __pydantic_base_init__ marker.
+    functools.update_wrapper(timed, func)
+    timed.__mc4llm_timed__ = True
+    return timed
+
+def _install(owner: Any, attribute: str) -> None:
+    stage, namer = _probes[owner][attribute]
+    key = (id(owner), attribute)
+    if key in _originals:
+        return
+    own = owner.__dict__.get(attribute, _MISSING)
+    raw = inspect.getattr_static(owner, attribute)
+    if isinstance(raw, (classmethod, staticmethod)):
+        patched = type(raw)(_timed(raw.__func__, stage, namer))
+    else:
+        patched = _timed(raw, stage, namer)
+    _originals[key] = (owner, own)
+    setattr(owner, attribute, patched)
+
+def _uninstall(owner: Any, attribute: str) -> None:
+    entry = _originals.pop((id(owner), attribute), None)
+    if entry is None:
+        return
+    _, own = entry
+    if own is _MISSING:
+        delattr(owner, attribute)
+    else:
+        setattr(owner, attribute, own)
+
+def probe(
+    owner: Any,
+    attribute: str,
+    stage: Union[str, Callable[[tuple], str]],
+    name: Optional[Callable[[tuple], str]] = None
+) -> None:
+    """
+    Register a function or method to be timed while a sink is installed.
+    
+    The base classes register the methods of their subclasses automatically;
+    use this for additional stages of your own.
+    
+    Args:
+        owner: The class or module holding the function
+        attribute: Name of the function, method or classmethod on ``owner``
+        stage: The stage reported to the sink, or a function of the call's
+            positional arguments returning it
+        name: Function of the call's positional arguments returning the reported
+            name; defaults to the qualified name of the function
+    """
+    if name is None:
+        qualname = f"{getattr(owner, '__name__', owner)}.{attribute}"
+        name = lambda args: qualname
+    with _lock:
+        _probes.setdefault(owner, {})[attribute] = (stage, name)
+        if _sink is not None:
+            _install(owner, attribute)
+
+def on_change(callback: Callable[[], None]) -> None:
+    """
+    Call ``callback`` whenever instrumentation is switched on or off.
+    
+    Components that cache bound methods (such as compiled guideline plans) use
+    it to drop them, so they pick up or release the timing wrappers.
+    """
+    _listeners.append(callback)
+
+def mark_output_model(model: type) -> None:
+    """Report constructions of ``model`` as the "output" stage rather than "validate"."""
+    _output_models.add(model)
+
+def model_stage(args: tuple) -> str:
+    """Stage of a model construction: "output" for calculator output models, else "validate"."""
+    return "output" if type(args[0]) in _output_models else "validate"
+
+def get_sink() -> Optional[Sink]:
+    """Get the installed sink, or None if instrumentation is off."""
+    return _sink
+
+def set_sink(sink: Optional[Sink]) -> Optional[Sink]:
+    """
+    Install the sink that receives stage timings, replacing the current one.
+    
+    Args:
+        sink: Callable ``sink(stage, name, elapsed_ns)``, or None to switch
+            instrumentation off and restore the uninstrumented methods
+            
+    Returns:
+        The previously installed sink, or None
+        
+    Raises:
+        TypeError: If sink is neither callable nor None
+    """
+    global _sink
+    if sink is not None and not callable(sink):
+        raise TypeError(f"sink must be callable, got {type(sink).__name__}")
+    with _lock:
+        previous = _sink
+        _sink = sink
+        if (previous is None) == (sink is None):
+            return previous
+        for owner, attributes in list(_probes.items()):
+            for attribute in attributes:
+                if sink is None:
+                    _uninstall(owner, attribute)
+                else:
+                    _install(owner, attribute)
+        for callback in _listeners:
+            callback()
+    return previous
+
+@contextmanager
+def instrument(sink: Sink) -> Iterator[Sink]:
+    """
+    Install a sink for the duration of a ``with`` block.
+    
+    Args:
+        sink: Callable ``sink(stage, name, elapsed_ns)``
+        
+    Yields:
+        The sink; the previous sink is restored on exit
+    """
+    previous = set_sink(sink)
+    try:
+        yield sink
+    finally:
+        set_sink(previous)
+
+class HistogramSink:
+    """In-process sink aggregating the timings of each (stage, name) into a histogram.
+    
+    Durations fall into power-of-two nanosecond buckets, so percentiles are
+    accurate to within a factor of two while recording stays cheap.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], List[Any]] = {}
+
+    def __call__(self, stage: str, name: str, elapsed_ns: int) -> None:
+        bucket = elapsed_ns.bit_length()
+        with self._lock:
+            stats = self._stats.get((stage, name))
+            if stats is None:
+                # count, total, min, max, bucket counts
+                stats = self._stats[(stage, name)] = [0, 0, elapsed_ns, elapsed_ns, [0] * 64]
+            stats[0] += 1
+            stats[1] += elapsed_ns
+            if elapsed_ns < stats[2]:
+                stats[2] = elapsed_ns
+            if elapsed_ns > stats[3]:
+                stats[3] = elapsed_ns
+            stats[4][min(bucket, 63)] += 1
+
+    def reset(self) -> None:
+        """Drop all recorded timings."""
+        with self._lock:
+            self._stats.clear()
+
+    def summary(self, percentiles: Tuple[float, ...] = (50, 90, 99)) -> Dict[Tuple[str, str], Dict[str, float]]:
+        """
+        Summarize the recorded timings.
+        
+        Args:
+            percentiles: Percentiles to estimate, between 0 and 100
+            
+        Returns:
+            Dict mapping (stage, name) to its ``count`` and ``total_ns``, ``mean_ns``,
+            ``min_ns``, ``max_ns`` and ``p<N>_ns`` durations
+        """
+        with self._lock:
+            snapshot = {key: (count, total, low, high, list(buckets))
+                        for key, (count, total, low, high, buckets) in self._stats.items()}
+        summary = {}
+        for key, (count, total, low, high, buckets) in snapshot.items():
+            row = {"count": count, "total_ns": total, "mean_ns": total / count, "min_ns": low, "max_ns": high}
+            for percentile in percentiles:
+                rank = max(1, -(-count * percentile // 100))
+                seen = 0
+                for bucket, bucket_count in enumerate(buckets):
+                    seen += bucket_count
+                    if seen >= rank:
+                        break
+                # Upper bound of the bucket, clamped to the observed range.
+                row[f"p{percentile:g}_ns"] = min(max((1 << bucket) - 1, low), high)
+            summary[key] = row
+        return summary
+
+class LoggingSink:
+    """Sink that logs every stage timing."""
+    def __init__(self, logger: Optional[logging.Logger] = None, level: int = logging.DEBUG):
+        """
+        Initialize the sink.
+        
+        Args:
+            logger: The logger to write to; defaults to the ``mc4llm.instrumentation`` logger
+            level: Level of the log records
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def __call__(self, stage: str, name: str, elapsed_ns: int) -> None:
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, "%s %s took %.1f us", stage, name, elapsed_ns / 1000)
+
+def owner_name(method: str) -> Callable[[tuple], str]:
+    """Namer reporting ``Class.method`` of the instance or class a method is called on."""
+    def name(args: tuple) -> str:
+        owner = args[0]
+        return f"{(owner if isinstance(owner, type) else type(owner)).__name__}.{method}"
+    return name
+
+def component_name(method: Optional[str] = None) -> Callable[[tuple], str]:
+    """Namer reporting the ``name`` attribute of a formula or rule, optionally with the method."""
+    if method is None:
+        return lambda args: args[0].name
+    return lambda args: f"{args[0].name}.{method}"
@@ -1,3 +1,15 @@
-from mc4llm.models.base import IOModel, convert_unit
+from mc4llm.models.base import (
+    IOModel, convert_unit, convert_unit_array, field_units,
+    ConversionPlan, conversion_plan, conversion_cache_info, clear_conversion_cache
+)
+from mc4llm.models.columnar import CategoricalArray, ColumnarBatch, ColumnSpec, ResultBatch, column_schema
+from mc4llm.models.schema import strict_json_schema, strict_json_schema_bytes, clear_schema_cache
+from mc4llm.models.ucum import UcumUnit, parse_ucum, ucum_cache_info, clear_ucum_cache
 
-__all__ = ['IOModel', 'convert_unit']  
+__all__ = [
+    'IOModel', 'convert_unit', 'convert_unit_array', 'field_units',
+    'ConversionPlan', 'conversion_plan', 'conversion_cache_info', 'clear_conversion_cache',
+    'CategoricalArray', 'ColumnarBatch', 'ColumnSpec', 'ResultBatch', 'column_schema',
+    'strict_json_schema', 'strict_json_schema_bytes', 'clear_schema_cache',
+    'UcumUnit', 'parse_ucum', 'ucum_cache_info', 'clear_ucum_cache'
+]
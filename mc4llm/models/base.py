@@ -1,7 +1,123 @@
+import os
+import sys
+import threading
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, Mapping, NamedTuple, Optional, Sequence, Union, TYPE_CHECKING
+
+import numpy as np
 from pydantic import BaseModel, Field, validator, ConfigDict
-from pint import UnitRegistry, Quantity
+from pydantic.json_schema import DEFAULT_REF_TEMPLATE, GenerateJsonSchema, JsonSchemaMode, JsonSchemaValue
+from pydantic_core import core_schema
+from pint import UnitRegistry, Quantity, Unit
+from pint.errors import PintError
+
+from mc4llm import instrumentation
+from mc4llm.models.ucum import parse_ucum
+
+if TYPE_CHECKING:
+    from mc4llm.models.columnar import ColumnarBatch
+
+# The unit registry is built on first use rather than at import time, since
+# parsing pint's definitions dominates the import cost of the package. It is
+# still available as ``mc4llm.models.base.ureg`` through the module __getattr__.
+_registry: Optional[UnitRegistry] = None
+_registry_lock = threading.Lock()
+_registry_cache_folder: Optional[str] = os.environ.get("MC4LLM_UNIT_CACHE") or None
+
+def configure_registry(cache_folder: Optional[str] = None) -> None:
+    """
+    Configure how the shared unit registry is built.
+    
+    Must be called before the registry is first used. The ``MC4LLM_UNIT_CACHE``
+    environment variable sets the same option without code changes.
+    
+    Args:
+        cache_folder: Directory where pint stores its parsed unit definitions,
+            or ":auto:" for pint's per-user cache directory. Later processes
+            load the pre-built registry from there instead of re-parsing.
+            
+    Raises:
+        RuntimeError: If the registry has already been built
+    """
+    global _registry_cache_folder
+    with _registry_lock:
+        if _registry is not None:
+            raise RuntimeError("The unit registry has already been built; configure it before first use")
+        _registry_cache_folder = cache_folder
+
+def _build_registry(cache_folder: Optional[str]) -> UnitRegistry:
+    """Build a unit registry, loading pint's on-disk definition cache when configured."""
+    if cache_folder is None:
+        return UnitRegistry()
+    return UnitRegistry(cache_folder=cache_folder)
 
-ureg = UnitRegistry()
+def get_registry() -> UnitRegistry:
+    """Get the shared unit registry, building it on first use."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = _build_registry(_registry_cache_folder)
+    return _registry
+
+def snapshot_registry(cache_folder: str) -> None:
+    """
+    Pre-build the on-disk registry cache, e.g. while building a container image.
+    
+    Args:
+        cache_folder: Directory to write pint's parsed unit definitions to
+    """
+    _build_registry(cache_folder)
+
+def __getattr__(name: str) -> Any:
+    if name == "ureg":
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# JSON form of a quantity, matching the {"value", "unit"} input accepted by @convert_unit.
+QUANTITY_JSON_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "value": {"type": "number"},
+        "unit": {"type": "string"},
+    },
+    "required": ["value", "unit"],
+}
+
+class QuantityJsonSchema(GenerateJsonSchema):
+    """JSON schema generator that renders pint quantities as value/unit objects."""
+    
+    def is_instance_schema(self, schema: core_schema.IsInstanceSchema) -> JsonSchemaValue:
+        if isinstance(schema["cls"], type) and issubclass(schema["cls"], Quantity):
+            return dict(QUANTITY_JSON_SCHEMA, properties=dict(QUANTITY_JSON_SCHEMA["properties"]))
+        return super().is_instance_schema(schema)
+    
+    # A @convert_unit validator named after its field is picked up by pydantic as
+    # the field's default; it is not a real default, so the field stays required.
+    def default_schema(self, schema: core_schema.WithDefaultSchema) -> JsonSchemaValue:
+        if callable(schema.get("default")):
+            return self.generate_inner(schema["schema"])
+        return super().default_schema(schema)
+    
+    def field_is_required(self, field: Any, total: bool) -> bool:
+        inner = field["schema"]
+        if inner["type"] == "default" and callable(inner.get("default")):
+            return True
+        return super().field_is_required(field, total)
+
+def json_default(value: Any) -> Any:
+    """
+    Encode values that JSON does not know, for ``json.dumps(default=...)`` and pydantic's ``fallback``.
+    
+    Quantities become {"value", "unit"} objects and NumPy scalars plain numbers;
+    anything else is written with str().
+    """
+    if isinstance(value, Quantity):
+        magnitude = value.magnitude
+        return {"value": magnitude.item() if hasattr(magnitude, "item") else magnitude, "unit": str(value.units)}
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
 
 # Define your custom base class.
 class IOModel(BaseModel):
@@ -10,7 +126,173 @@ class IOModel(BaseModel):
     Base class for all medical calculator IO models.
     In the future, common functionality or configuration can be added here.
     """
-    pass
+
+    # Canonical unit of every field declared with @convert_unit, by field name.
+    __field_units__: ClassVar[Dict[str, str]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Runs before pydantic collects the validators, while the class namespace
+        # still holds the decorated functions and their conversion targets.
+        units = dict(cls.__field_units__)
+        for attr in cls.__dict__.values():
+            func = getattr(getattr(attr, "wrapped", None), "__func__", None)
+            conversion = getattr(func, "unit_conversion", None)
+            if conversion is not None:
+                field_name, target_unit = conversion
+                units[field_name] = target_unit
+        cls.__field_units__ = units
+
+    @classmethod
+    def model_json_schema(
+        cls,
+        by_alias: bool = True,
+        ref_template: str = DEFAULT_REF_TEMPLATE,
+        schema_generator: type[GenerateJsonSchema] = QuantityJsonSchema,
+        mode: JsonSchemaMode = "validation",
+        **kwargs: Any
+    ) -> Dict[str, Any]:
+        """Generate the model's JSON schema; quantity fields are {"value", "unit"} objects by default."""
+        return super().model_json_schema(
+            by_alias=by_alias, ref_template=ref_template, schema_generator=schema_generator, mode=mode, **kwargs
+        )
+
+    @classmethod
+    def columnar(cls, **columns: Any) -> "ColumnarBatch":
+        """
+        Build a validated columnar batch of this model from one array per field.
+        
+        Args:
+            **columns: Field name to array-like of values
+            
+        Returns:
+            ColumnarBatch: The batch holding one typed NumPy array per field
+            
+        Raises:
+            ValueError: If a column is missing, has the wrong length or fails a range check
+            TypeError: If a column cannot be stored with the field's dtype
+        """
+        from mc4llm.models.columnar import ColumnarBatch
+        return ColumnarBatch(cls, columns)
+
+instrumentation.probe(IOModel, "__init__", instrumentation.model_stage, instrumentation.owner_name("__init__"))
+for _method in ("model_validate", "model_validate_json"):
+    instrumentation.probe(IOModel, _method, "validate", instrumentation.owner_name(_method))
+
+def field_units(model: type) -> Mapping[str, str]:
+    """Get the canonical unit of each unit-converted field of a model."""
+    return getattr(model, "__field_units__", {})
+
+class ConversionPlan(NamedTuple):
+    """A unit conversion reduced to ``value * factor + offset`` into ``units``."""
+    factor: float
+    offset: float
+    units: Unit
+
+    def apply(self, value: Any) -> Any:
+        """Convert a magnitude (scalar or array) from the source to the target unit."""
+        return value * self.factor + self.offset
+
+# Maximum number of (source unit, target unit) plans kept by conversion_plan.
+CONVERSION_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=CONVERSION_CACHE_SIZE)
+def conversion_plan(source_unit: Union[str, Unit], target_unit: str) -> ConversionPlan:
+    """
+    Get the cached conversion plan between two units.
+    
+    The plan is built once per pair by converting 0 and 1 through pint, which
+    captures both multiplicative units and offset units such as temperatures.
+    Non-affine (logarithmic) units are not supported. Source units that pint
+    cannot parse or convert, such as the UCUM codes "[lb_av]" or "kg/m2", are
+    read with ``parse_ucum`` instead.
+    
+    Args:
+        source_unit: Unit string or pint Unit the value is expressed in
+        target_unit: Unit string to convert to
+        
+    Returns:
+        ConversionPlan: The factor, offset and target unit of the conversion
+        
+    Raises:
+        pint.errors.UndefinedUnitError: If either unit is unknown
+        pint.errors.DimensionalityError: If the units are not compatible
+        ValueError: If a unit expression is malformed, or a UCUM unit is arbitrary (e.g. [IU])
+    """
+    ureg = get_registry()
+    try:
+        return _pint_plan(ureg, source_unit, target_unit)
+    except (PintError, ValueError) as error:
+        if not isinstance(source_unit, str):
+            raise
+        try:
+            source = parse_ucum(source_unit)
+        except ValueError:
+            raise error from None
+    # value -> SI base units (UCUM) -> target unit (pint)
+    base = _pint_plan(ureg, source.base_units(), target_unit)
+    return ConversionPlan(
+        factor=source.scale * base.factor, offset=source.offset * base.factor + base.offset, units=base.units
+    )
+
+def _pint_plan(ureg: UnitRegistry, source_unit: Union[str, Unit], target_unit: str) -> ConversionPlan:
+    offset = ureg.Quantity(0.0, source_unit).to(target_unit).magnitude
+    factor = ureg.Quantity(1.0, source_unit).to(target_unit).magnitude - offset
+    return ConversionPlan(factor=factor, offset=offset, units=ureg.Unit(target_unit))
+
+def conversion_cache_info():
+    """Get the hit/miss counters and size of the conversion plan cache."""
+    return conversion_plan.cache_info()
+
+def clear_conversion_cache() -> None:
+    """Drop all cached conversion plans and reset the counters."""
+    conversion_plan.cache_clear()
+
+def _convert_value(value: Any, unit: Union[str, Unit], target_unit: str) -> Quantity:
+    """Convert a magnitude with the cached plan, falling back to pint for non-numeric values."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        plan = conversion_plan(unit, target_unit)
+        return get_registry().Quantity(plan.apply(value), plan.units)
+    return get_registry().Quantity(value, unit).to(target_unit)
+
+instrumentation.probe(sys.modules[__name__], "_convert_value", "convert", lambda args: str(args[2]))
+
+def convert_unit_array(
+    values: Any, units: Union[str, Unit, Sequence[str], np.ndarray], target_unit: str
+) -> np.ndarray:
+    """
+    Convert a column of magnitudes to a target unit without building per-row Quantities.
+    
+    Rows are grouped by source unit: each distinct unit is resolved once through
+    ``conversion_plan`` and all rows are then converted with one vectorized
+    multiply-add.
+    
+    Args:
+        values: Array-like of magnitudes
+        units: A single unit for every row, or one unit string per row
+        target_unit: Unit string to convert to
+        
+    Returns:
+        np.ndarray: float64 magnitudes in the target unit
+        
+    Raises:
+        ValueError: If ``units`` does not have one entry per value
+        pint.errors.UndefinedUnitError: If a unit is unknown
+        pint.errors.DimensionalityError: If a unit is not compatible with the target
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if isinstance(units, (str, Unit)):
+        return conversion_plan(units, target_unit).apply(values)
+    
+    units = np.asarray(units)
+    if units.shape != values.shape:
+        raise ValueError(f"Expected one unit per value ({values.shape}), got units of shape {units.shape}")
+    distinct, inverse = np.unique(units, return_inverse=True)
+    plans = [conversion_plan(unit, target_unit) for unit in distinct.tolist()]
+    factors = np.array([plan.factor for plan in plans], dtype=np.float64)
+    offsets = np.array([plan.offset for plan in plans], dtype=np.float64)
+    inverse = inverse.reshape(values.shape)
+    return values * factors[inverse] + offsets[inverse]
 
 # Decorator that performs automatic unit conversion.
 def convert_unit(target_unit: str):
@@ -20,23 +302,26 @@ def convert_unit(target_unit: str):
       - a pint.Quantity (which will be converted),
       - a tuple/list (value, unit), or
       - a dict with keys 'value' and 'unit'.
+    Conversions use cached plans from ``conversion_plan``, so pint only parses
+    each (source unit, target unit) pair once.
     """
     def decorator(fn):
         @validator(fn.__name__, pre=True, allow_reuse=True)
         def wrapper(cls, v):
             # If the value is already a pint.Quantity, convert directly.
             if isinstance(v, Quantity):
-                return v.to(target_unit)
+                return _convert_value(v.magnitude, v.units, target_unit)
             # If the value is a tuple or list (value, unit)
             elif isinstance(v, (tuple, list)) and len(v) == 2:
                 value, unit = v
-                return ureg.Quantity(value, unit).to(target_unit)
+                return _convert_value(value, unit, target_unit)
             # If the value is a dict with keys 'value' and 'unit'
             elif isinstance(v, dict) and 'value' in v and 'unit' in v:
-                return ureg.Quantity(v['value'], v['unit']).to(target_unit)
+                return _convert_value(v['value'], v['unit'], target_unit)
             else:
                 raise ValueError(
                     f"Field '{fn.__name__}' must be a pint.Quantity, a tuple/list (value, unit), or a dict with 'value' and 'unit'."
                 )
+        wrapper.__func__.unit_conversion = (fn.__name__, target_unit)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
@@ -0,0 +1,105 @@
+"""Strict JSON schemas for LLM tool definitions.
+
+Strict schemas follow the rules of OpenAI's structured outputs: every object
+lists all of its properties as required and forbids additional properties;
+optional fields are expressed as nullable instead. Quantity fields are
+{"value", "unit"} objects. Schemas are generated once per model and kept as
+serialized bytes, and regenerated when pydantic rebuilds the model.
+"""
+import json
+import threading
+import weakref
+from typing import Any, Dict, Tuple, Type
+
+from pydantic import BaseModel
+
+from mc4llm.models.base import QuantityJsonSchema, field_units
+
+# Keywords that strict mode does not accept.
+_UNSUPPORTED_KEYWORDS = ("default",)
+
+_schema_cache: "weakref.WeakKeyDictionary[type, Tuple[Any, bytes]]" = weakref.WeakKeyDictionary()
+_schema_lock = threading.Lock()
+
+def _strict(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Rewrite a JSON schema node and its children in place to follow strict mode."""
+    for keyword in _UNSUPPORTED_KEYWORDS:
+        node.pop(keyword, None)
+    for key in ("properties", "$defs"):
+        for child in node.get(key, {}).values():
+            _strict(child)
+    for key in ("anyOf", "oneOf", "allOf", "prefixItems"):
+        for child in node.get(key, ()):
+            _strict(child)
+    for key in ("items", "additionalProperties"):
+        if isinstance(node.get(key), dict):
+            _strict(node[key])
+    
+    properties = node.get("properties")
+    if properties is not None:
+        required = set(node.get("required", ()))
+        for name, schema in properties.items():
+            if name not in required:
+                nullable: Dict[str, Any] = {"anyOf": [schema, {"type": "null"}]}
+                for keyword in ("title", "description"):
+                    if keyword in schema:
+                        nullable[keyword] = schema.pop(keyword)
+                properties[name] = nullable
+        node["required"] = list(properties)
+        node["additionalProperties"] = False
+    return node
+
+def strict_json_schema_bytes(model: Type[BaseModel]) -> bytes:
+    """
+    Get the serialized strict JSON schema of a model.
+    
+    The schema is generated on first use and cached until the model's pydantic
+    core schema changes, e.g. after ``model_rebuild``.
+    
+    Args:
+        model: The pydantic model class
+        
+    Returns:
+        bytes: The schema as compact UTF-8 JSON
+        
+    Raises:
+        TypeError: If model is not a pydantic model class
+    """
+    if not (isinstance(model, type) and issubclass(model, BaseModel)):
+        raise TypeError("Expected a pydantic model class")
+    core_schema = model.__pydantic_core_schema__
+    cached = _schema_cache.get(model)
+    if cached is not None and cached[0] is core_schema:
+        return cached[1]
+    with _schema_lock:
+        cached = _schema_cache.get(model)
+        if cached is None or cached[0] is not core_schema:
+            schema = _strict(model.model_json_schema(schema_generator=QuantityJsonSchema))
+            for name, unit in field_units(model).items():
+                unit_schema = schema["properties"].get(name, {}).get("properties", {}).get("unit")
+                if unit_schema is not None:
+                    unit_schema["description"] = f"Unit of the value, convertible to {unit}"
+            cached = _schema_cache[model] = (
+                core_schema, json.dumps(schema, separators=(",", ":")).encode("utf-8")
+            )
+    return cached[1]
+
+def strict_json_schema(model: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Get the strict JSON schema of a model as a new dictionary.
+    
+    Args:
+        model: The pydantic model class
+        
+    Returns:
+        Dict[str, Any]: The schema; safe to modify
+        
+    Raises:
+        TypeError: If model is not a pydantic model class
+    """
+    return json.loads(strict_json_schema_bytes(model))
+
+def clear_schema_cache() -> None:
+    """Drop all cached schemas."""
+    with _schema_lock:
+        _schema_cache.clear()
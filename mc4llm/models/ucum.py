@@ -0,0 +1,341 @@
+"""Parser for UCUM unit expressions (the Unified Code for Units of Measure).
+
+EHR and lab feeds encode units as UCUM codes such as "[lb_av]", "kg/m2" or
+"mg/dL", many of which pint does not understand. ``parse_ucum`` compiles an
+expression once into a scale factor and a canonical dimension vector over the
+SI base units pint uses (kilogram, meter, second, ampere, kelvin, mole,
+candela), and caches the result, so repeated codes are a dictionary hit.
+
+Deviations from the UCUM specification, for interoperability with pint:
+    - mol, eq and osm are amounts of substance, not the dimensionless count
+      6.0221367e23 that UCUM defines.
+    - Arbitrary units such as [IU] get a dimension of their own; they convert
+      among themselves but not to any other unit.
+    - Special units are limited to the affine temperatures Cel and [degF],
+      which cannot be combined with other units.
+"""
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+Dimensions = Tuple[Tuple[str, int], ...]
+
+class UcumUnit(NamedTuple):
+    """
+    A compiled UCUM expression.
+    
+    A value ``v`` in this unit is ``v * scale + offset`` in the SI base units
+    given by ``dimensions``, e.g. (("[length]", -3), ("[mass]", 1)) for kg/m3.
+    """
+    expression: str
+    scale: float
+    dimensions: Dimensions
+    offset: float = 0.0
+
+    @property
+    def is_special(self) -> bool:
+        """Whether the unit has an offset (Cel, [degF]) and so cannot be combined with others."""
+        return self.offset != 0.0
+
+    def base_units(self) -> str:
+        """
+        Get the SI base-unit expression of the dimensions in pint syntax, e.g. "kilogram * meter ** -3".
+        
+        Raises:
+            ValueError: If the unit has arbitrary dimensions, which pint cannot express
+        """
+        parts = []
+        for dimension, exponent in self.dimensions:
+            name = _BASE_UNIT_NAMES.get(dimension)
+            if name is None:
+                raise ValueError(f"UCUM unit '{self.expression}' is arbitrary and has no SI equivalent")
+            parts.append(name if exponent == 1 else f"{name} ** {exponent}")
+        return " * ".join(parts) or "dimensionless"
+
+# pint base unit of each dimension a UCUM expression can compile to.
+_BASE_UNIT_NAMES = {
+    "[current]": "ampere",
+    "[length]": "meter",
+    "[luminosity]": "candela",
+    "[mass]": "kilogram",
+    "[substance]": "mole",
+    "[temperature]": "kelvin",
+    "[time]": "second",
+}
+
+PREFIXES: Dict[str, float] = {
+    "Y": 1e24, "Z": 1e21, "E": 1e18, "P": 1e15, "T": 1e12, "G": 1e9, "M": 1e6, "k": 1e3, "h": 1e2, "da": 1e1,
+    "d": 1e-1, "c": 1e-2, "m": 1e-3, "u": 1e-6, "n": 1e-9, "p": 1e-12, "f": 1e-15, "a": 1e-18, "z": 1e-21, "y": 1e-24,
+}
+
+class _Atom(NamedTuple):
+    """Definition of a unit atom as ``value`` times a UCUM expression, or as base dimensions."""
+    value: float
+    definition: Optional[str] = None
+    dimensions: Dimensions = ()
+    metric: bool = False
+    offset: float = 0.0
+
+ATOMS: Dict[str, _Atom] = {
+    # Base units, scaled to the SI base units pint uses.
+    "m": _Atom(1, dimensions=(("[length]", 1),), metric=True),
+    "g": _Atom(1e-3, dimensions=(("[mass]", 1),), metric=True),
+    "s": _Atom(1, dimensions=(("[time]", 1),), metric=True),
+    "rad": _Atom(1, metric=True),
+    "K": _Atom(1, dimensions=(("[temperature]", 1),), metric=True),
+    "C": _Atom(1, dimensions=(("[current]", 1), ("[time]", 1)), metric=True),
+    "cd": _Atom(1, dimensions=(("[luminosity]", 1),), metric=True),
+    "mol": _Atom(1, dimensions=(("[substance]", 1),), metric=True),
+    # Dimensionless.
+    "10*": _Atom(10),
+    "10^": _Atom(10),
+    "[pi]": _Atom(math.pi),
+    "%": _Atom(1e-2),
+    "[ppth]": _Atom(1e-3),
+    "[ppm]": _Atom(1e-6),
+    "[ppb]": _Atom(1e-9),
+    # SI derived units.
+    "sr": _Atom(1, "rad2", metric=True),
+    "Hz": _Atom(1, "s-1", metric=True),
+    "N": _Atom(1, "kg.m/s2", metric=True),
+    "Pa": _Atom(1, "N/m2", metric=True),
+    "J": _Atom(1, "N.m", metric=True),
+    "W": _Atom(1, "J/s", metric=True),
+    "A": _Atom(1, "C/s", metric=True),
+    "V": _Atom(1, "J/C", metric=True),
+    "F": _Atom(1, "C/V", metric=True),
+    "Ohm": _Atom(1, "V/A", metric=True),
+    "S": _Atom(1, "Ohm-1", metric=True),
+    "Wb": _Atom(1, "V.s", metric=True),
+    "T": _Atom(1, "Wb/m2", metric=True),
+    "H": _Atom(1, "Wb/A", metric=True),
+    "lm": _Atom(1, "cd.sr", metric=True),
+    "lx": _Atom(1, "lm/m2", metric=True),
+    "Bq": _Atom(1, "s-1", metric=True),
+    "Gy": _Atom(1, "J/kg", metric=True),
+    "Sv": _Atom(1, "J/kg", metric=True),
+    "kat": _Atom(1, "mol/s", metric=True),
+    "Cel": _Atom(1, "K", metric=True, offset=273.15),
+    # Units in use with the SI.
+    "l": _Atom(1, "dm3", metric=True),
+    "L": _Atom(1, "l", metric=True),
+    "ar": _Atom(100, "m2", metric=True),
+    "min": _Atom(60, "s"),
+    "h": _Atom(60, "min"),
+    "d": _Atom(24, "h"),
+    "wk": _Atom(7, "d"),
+    "a_t": _Atom(365.24219, "d"),
+    "a_j": _Atom(365.25, "d"),
+    "a_g": _Atom(365.2425, "d"),
+    "a": _Atom(1, "a_j"),
+    "mo_j": _Atom(1, "a_j/12"),
+    "mo_g": _Atom(1, "a_g/12"),
+    "mo": _Atom(1, "mo_j"),
+    "t": _Atom(1e3, "kg", metric=True),
+    "bar": _Atom(1e5, "Pa", metric=True),
+    "u": _Atom(1.6605402e-24, "g", metric=True),
+    "eV": _Atom(1.60217733e-19, "J", metric=True),
+    "deg": _Atom(math.pi / 180, "rad"),
+    "cal": _Atom(4.184, "J", metric=True),
+    "[Cal]": _Atom(1, "kcal"),
+    # Chemical and clinical units.
+    "eq": _Atom(1, "mol", metric=True),
+    "osm": _Atom(1, "mol", metric=True),
+    "g%": _Atom(1, "g/dl", metric=True),
+    "U": _Atom(1, "umol/min", metric=True),
+    "m[Hg]": _Atom(133.322, "kPa", metric=True),
+    "m[H2O]": _Atom(9.80665, "kPa", metric=True),
+    "[in_i'Hg]": _Atom(1, "m[Hg].[in_i]/m"),
+    "[in_i'H2O]": _Atom(1, "m[H2O].[in_i]/m"),
+    "[drp]": _Atom(1, "ml/20"),
+    "[degF]": _Atom(5 / 9, "K", offset=459.67 * 5 / 9),
+    "[degR]": _Atom(5 / 9, "K"),
+    # Customary units.
+    "[in_i]": _Atom(2.54, "cm"),
+    "[ft_i]": _Atom(12, "[in_i]"),
+    "[yd_i]": _Atom(3, "[ft_i]"),
+    "[mi_i]": _Atom(5280, "[ft_i]"),
+    "[lb_av]": _Atom(453.59237, "g"),
+    "[oz_av]": _Atom(1 / 16, "[lb_av]"),
+    "[gr]": _Atom(64.79891, "mg"),
+    "[stone_av]": _Atom(14, "[lb_av]"),
+    "[gal_us]": _Atom(231, "[in_i]3"),
+    "[qt_us]": _Atom(1 / 4, "[gal_us]"),
+    "[pt_us]": _Atom(1 / 2, "[qt_us]"),
+    "[foz_us]": _Atom(1 / 16, "[pt_us]"),
+    "[tbs_us]": _Atom(1 / 2, "[foz_us]"),
+    "[tsp_us]": _Atom(1 / 3, "[tbs_us]"),
+    "[cup_us]": _Atom(16, "[tbs_us]"),
+    "[gal_br]": _Atom(4.54609, "l"),
+    "[pt_br]": _Atom(1 / 8, "[gal_br]"),
+    # Arbitrary units.
+    "[iU]": _Atom(1, dimensions=(("[iU]", 1),), metric=True),
+    "[IU]": _Atom(1, "[iU]", metric=True),
+    "[arb'U]": _Atom(1, dimensions=(("[arb'U]", 1),)),
+    "[USP'U]": _Atom(1, dimensions=(("[USP'U]", 1),)),
+    "[CFU]": _Atom(1, dimensions=(("[CFU]", 1),)),
+}
+
+# Maximum number of expressions kept by parse_ucum.
+UCUM_CACHE_SIZE = 4096
+
+_EXPONENT = re.compile(r"^(?P<symbol>.+?)(?P<exponent>[+-]?\d+)?$")
+
+class _Term(NamedTuple):
+    """A partially combined unit: scale, dimension exponents and offset."""
+    scale: float
+    dimensions: Dict[str, int]
+    offset: float = 0.0
+
+def _tokens(expression: str) -> Iterator[str]:
+    """Split an expression into operators, parentheses, annotations and unit symbols."""
+    i, n = 0, len(expression)
+    while i < n:
+        char = expression[i]
+        if char in "./()":
+            yield char
+            i += 1
+        elif char == "{":
+            end = expression.find("}", i)
+            if end < 0:
+                raise ValueError(f"Unclosed annotation in UCUM expression '{expression}'")
+            yield expression[i:end + 1]
+            i = end + 1
+        else:
+            start = i
+            while i < n and expression[i] not in "./(){":
+                if expression[i] == "[":
+                    end = expression.find("]", i)
+                    if end < 0:
+                        raise ValueError(f"Unclosed bracket in UCUM expression '{expression}'")
+                    i = end
+                elif expression[i] in " }]":
+                    raise ValueError(f"Unexpected '{expression[i]}' in UCUM expression '{expression}'")
+                i += 1
+            yield expression[start:i]
+
+@lru_cache(maxsize=None)
+def _atom(symbol: str) -> _Term:
+    """Resolve a unit symbol, with an optional metric prefix, to its compiled term."""
+    atom = ATOMS.get(symbol)
+    prefix = 1.0
+    if atom is None:
+        for length in (2, 1):
+            factor = PREFIXES.get(symbol[:length])
+            candidate = ATOMS.get(symbol[length:])
+            if factor is not None and candidate is not None and candidate.metric:
+                atom, prefix = candidate, factor
+                break
+        else:
+            raise ValueError(f"Unknown UCUM unit '{symbol}'")
+    if atom.offset and prefix != 1.0:
+        raise ValueError(f"Special unit '{symbol}' cannot take a prefix")
+    if atom.definition is None:
+        return _Term(prefix * atom.value, dict(atom.dimensions))
+    defined = _compile(atom.definition)
+    return _Term(prefix * atom.value * defined.scale, dict(defined.dimensions), atom.offset)
+
+class _Parser:
+    """Recursive descent parser over the tokens of one expression."""
+
+    def __init__(self, expression: str):
+        self.expression = expression
+        self.tokens: List[str] = list(_tokens(expression))
+        self.position = 0
+
+    def peek(self) -> Optional[str]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def take(self) -> str:
+        token = self.peek()
+        if token is None:
+            raise ValueError(f"Unexpected end of UCUM expression '{self.expression}'")
+        self.position += 1
+        return token
+
+    def term(self) -> _Term:
+        if self.peek() == "/":
+            self.take()
+            result = _combine(_Term(1.0, {}), self.component(), -1, self.expression)
+        else:
+            result = self.component()
+        while self.peek() in (".", "/"):
+            operator = self.take()
+            result = _combine(result, self.component(), 1 if operator == "." else -1, self.expression)
+        return result
+
+    def component(self) -> _Term:
+        token = self.take()
+        if token == "(":
+            result = self.term()
+            if self.take() != ")":
+                raise ValueError(f"Unbalanced parentheses in UCUM expression '{self.expression}'")
+        elif token.startswith("{"):
+            return _Term(1.0, {})
+        elif token in ".)/":
+            raise ValueError(f"Unexpected '{token}' in UCUM expression '{self.expression}'")
+        elif token.isdigit():
+            result = _Term(float(token), {})
+        else:
+            match = _EXPONENT.match(token)
+            exponent = int(match.group("exponent") or 1)
+            result = _atom(match.group("symbol"))
+            if exponent != 1:
+                if result.offset:
+                    raise ValueError(f"Special unit in '{self.expression}' cannot have an exponent")
+                result = _Term(
+                    result.scale ** exponent,
+                    {dimension: power * exponent for dimension, power in result.dimensions.items()}
+                )
+        # Annotations directly after a unit, e.g. mg{creat}, are ignored.
+        if self.peek() is not None and self.peek().startswith("{"):
+            self.take()
+        return result
+
+def _combine(left: _Term, right: _Term, sign: int, expression: str) -> _Term:
+    if left.offset or right.offset:
+        raise ValueError(f"Special units such as Cel cannot be combined with other units in '{expression}'")
+    dimensions = dict(left.dimensions)
+    for dimension, power in right.dimensions.items():
+        dimensions[dimension] = dimensions.get(dimension, 0) + sign * power
+    return _Term(left.scale * right.scale ** sign, dimensions)
+
+def _compile(expression: str) -> UcumUnit:
+    if not isinstance(expression, str):
+        raise TypeError("UCUM expression must be a string")
+    if not expression:
+        raise ValueError("UCUM expression must not be empty")
+    parser = _Parser(expression)
+    result = parser.term()
+    if parser.peek() is not None:
+        raise ValueError(f"Unexpected '{parser.peek()}' in UCUM expression '{expression}'")
+    dimensions = tuple(sorted((name, power) for name, power in result.dimensions.items() if power))
+    return UcumUnit(expression, result.scale, dimensions, result.offset)
+
+@lru_cache(maxsize=UCUM_CACHE_SIZE)
+def parse_ucum(expression: str) -> UcumUnit:
+    """
+    Compile a UCUM expression into a scale factor and SI base dimensions.
+    
+    Results are cached, so repeated codes cost a dictionary lookup.
+    
+    Args:
+        expression: UCUM code, e.g. "kg/m2", "[lb_av]", "mg/dL" or "10*9/L"
+        
+    Returns:
+        UcumUnit: The compiled unit
+        
+    Raises:
+        ValueError: If the expression is malformed or uses unknown units
+        TypeError: If expression is not a string
+    """
+    return _compile(expression)
+
+def ucum_cache_info():
+    """Get the hit/miss counters and size of the UCUM expression cache."""
+    return parse_ucum.cache_info()
+
+def clear_ucum_cache() -> None:
+    """Drop all compiled UCUM expressions and reset the counters."""
+    parse_ucum.cache_clear()
@@ -0,0 +1,48 @@
+"""Calculator Registry
+
+Catalog of calculators by id and version, discovered from manifests and the
+``mc4llm.calculators`` entry point group. Calculator modules are imported only
+when a calculator is first requested. The tool-call dispatch helpers are
+imported on first access, since they need pydantic and pint.
+"""
+from typing import TYPE_CHECKING
+
+from mc4llm._lazy import lazy_exports
+from mc4llm.registry.base import (
+    BUILTIN_MANIFEST,
+    ENTRY_POINT_GROUP,
+    CalculatorRegistry,
+    CalculatorSpec,
+    default_registry,
+    get_calculator,
+    list_calculators,
+)
+
+if TYPE_CHECKING:
+    from mc4llm.registry.dispatch import (
+        ToolCall, ToolResult, adispatch_tool_calls, dispatch_tool_calls, tool_messages_bytes
+    )
+
+__all__ = [
+    "BUILTIN_MANIFEST",
+    "ENTRY_POINT_GROUP",
+    "CalculatorRegistry",
+    "CalculatorSpec",
+    "default_registry",
+    "get_calculator",
+    "list_calculators",
+    "ToolCall",
+    "ToolResult",
+    "dispatch_tool_calls",
+    "adispatch_tool_calls",
+    "tool_messages_bytes",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    attributes={
+        name: "mc4llm.registry.dispatch"
+        for name in ("ToolCall", "ToolResult", "dispatch_tool_calls", "adispatch_tool_calls", "tool_messages_bytes")
+    },
+    submodules=["dispatch"]
+)
@@ -0,0 +1,355 @@
+import json
+import os
+import re
+import threading
+from dataclasses import asdict, dataclass, field
+from importlib import metadata
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from mc4llm.calculator import Calculator
+
+# Entry point group under which installed packages publish calculators.
+ENTRY_POINT_GROUP = "mc4llm.calculators"
+
+# Manifest of the calculators shipped with mc4llm.
+BUILTIN_MANIFEST = os.path.join(os.path.dirname(__file__), "calculators.json")
+
+_default_registry: Optional["CalculatorRegistry"] = None
+_default_registry_lock = threading.Lock()
+
+def _version_key(version: str) -> Tuple[Tuple[int, Union[int, str]], ...]:
+    """Order versions numerically part by part, e.g. 1.10 after 1.9; text parts sort before numbers."""
+    return tuple(
+        (1, int(part)) if part.isdigit() else (0, part)
+        for part in re.split(r"[.\-+]", version)
+    )
+
+@dataclass(frozen=True)
+class CalculatorSpec:
+    """
+    Catalog entry of a calculator, available without importing it.
+    
+    Attributes:
+        id: Unique calculator id, e.g. "simple_who_bmi"
+        version: Version string; the highest version is used when none is requested
+        target: Import path of the calculator instance, as "package.module:NAME"
+        title: Human readable name
+        description: What the calculator computes, e.g. for tool descriptions
+        tags: Free-form labels for browsing the catalog
+        parameters: Strict JSON schema of the input model, so tool definitions can be
+            served without importing the calculator; derived from the imported model if None
+    """
+    id: str
+    version: str
+    target: str
+    title: str = ""
+    description: str = ""
+    tags: Tuple[str, ...] = field(default_factory=tuple)
+    parameters: Optional[Dict[str, Any]] = field(default=None, compare=False)
+
+    def __post_init__(self):
+        for name in ("id", "version", "target"):
+            if not isinstance(getattr(self, name), str) or not getattr(self, name):
+                raise ValueError(f"Calculator {name} must be a non-empty string")
+        if self.parameters is not None and not isinstance(self.parameters, dict):
+            raise ValueError("Calculator parameters must be a JSON schema object")
+        object.__setattr__(self, "tags", tuple(self.tags))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CalculatorSpec":
+        """
+        Create a spec from a manifest entry.
+        
+        Args:
+            data: Mapping with the spec's fields; unknown keys are rejected
+            
+        Returns:
+            CalculatorSpec: The spec
+            
+        Raises:
+            ValueError: If required fields are missing or unknown fields are present
+        """
+        unknown = set(data) - set(cls.__dataclass_fields__)
+        if unknown:
+            raise ValueError(f"Unknown calculator manifest fields: {sorted(unknown)}")
+        try:
+            return cls(**data)
+        except TypeError as error:
+            raise ValueError(f"Invalid calculator manifest entry {data!r}: {error}") from error
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the spec as a JSON-compatible dictionary."""
+        data = asdict(self)
+        data["tags"] = list(self.tags)
+        return data
+
+class CalculatorRegistry:
+    """
+    Catalog of calculators indexed by id and version.
+    
+    Only specs are held until a calculator is requested; its module is imported
+    by the first ``get`` and the instance is reused afterwards. Listing the
+    catalog and reading specs never imports calculator code.
+    """
+    
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._specs: Dict[Tuple[str, str], CalculatorSpec] = {}
+        self._latest: Dict[str, str] = {}
+        self._loaded: Dict[Tuple[str, str], "Calculator"] = {}
+        # Serialized tool definitions, with the parameters schema they were built from.
+        self._tools: Dict[Tuple[str, str], Tuple[bytes, bytes]] = {}
+        self._lock = threading.Lock()
+    
+    def register(self, spec: CalculatorSpec, replace: bool = False) -> CalculatorSpec:
+        """
+        Add a calculator spec to the catalog.
+        
+        Args:
+            spec: The spec to add
+            replace: Whether to overwrite an existing spec with the same id and version
+            
+        Returns:
+            CalculatorSpec: The registered spec
+            
+        Raises:
+            TypeError: If spec is not a CalculatorSpec
+            ValueError: If the id and version are already registered and replace is False
+        """
+        if not isinstance(spec, CalculatorSpec):
+            raise TypeError("Calculator spec must be a CalculatorSpec")
+        key = (spec.id, spec.version)
+        with self._lock:
+            if key in self._specs and not replace:
+                raise ValueError(f"Calculator '{spec.id}' version '{spec.version}' is already registered")
+            self._specs[key] = spec
+            self._loaded.pop(key, None)
+            self._tools.pop(key, None)
+            latest = self._latest.get(spec.id)
+            if latest is None or _version_key(spec.version) > _version_key(latest):
+                self._latest[spec.id] = spec.version
+        return spec
+    
+    def load_manifest(self, source: Union[str, os.PathLike, Dict[str, Any]], replace: bool = False) -> List[CalculatorSpec]:
+        """
+        Register the calculators listed in a manifest.
+        
+        A manifest is a JSON object with a "calculators" list of spec mappings,
+        e.g. ``{"calculators": [{"id": "bmi", "version": "1.0", "target": "pkg.bmi:BMI"}]}``.
+        
+        Args:
+            source: Path of a JSON manifest file, or the already parsed manifest
+            replace: Whether entries may overwrite already registered versions
+            
+        Returns:
+            List[CalculatorSpec]: The registered specs
+            
+        Raises:
+            ValueError: If the manifest is malformed or an entry is already registered
+        """
+        if isinstance(source, dict):
+            manifest = source
+        else:
+            with open(source, encoding="utf-8") as f:
+                manifest = json.load(f)
+        entries = manifest.get("calculators") if isinstance(manifest, dict) else None
+        if not isinstance(entries, list):
+            raise ValueError("Calculator manifest must be an object with a 'calculators' list")
+        specs = [CalculatorSpec.from_dict(entry) for entry in entries]
+        return [self.register(spec, replace=replace) for spec in specs]
+    
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP) -> List[CalculatorSpec]:
+        """
+        Register the calculators that installed packages publish as entry points.
+        
+        Each entry point is named after the calculator id and points to the
+        calculator instance; the version is the distribution's version. Entry
+        points are only read, not loaded. Versions that are already registered,
+        e.g. from a manifest with richer metadata, are kept.
+        
+        Args:
+            group: The entry point group to scan
+            
+        Returns:
+            List[CalculatorSpec]: The newly registered specs
+        """
+        entry_points = metadata.entry_points()
+        if hasattr(entry_points, "select"):
+            entry_points = entry_points.select(group=group)
+        else:
+            entry_points = entry_points.get(group, ())
+        specs = []
+        for entry_point in entry_points:
+            distribution = getattr(entry_point, "dist", None)
+            version = distribution.version if distribution is not None else "0"
+            if (entry_point.name, version) in self._specs:
+                continue
+            specs.append(self.register(CalculatorSpec(
+                id=entry_point.name, version=version, target=entry_point.value, title=entry_point.name
+            )))
+        return specs
+    
+    def spec(self, id: str, version: Optional[str] = None) -> CalculatorSpec:
+        """
+        Get the catalog entry of a calculator without importing it.
+        
+        Args:
+            id: Calculator id
+            version: Calculator version, or None for the highest registered version
+            
+        Returns:
+            CalculatorSpec: The spec
+            
+        Raises:
+            ValueError: If the calculator or version is not registered
+        """
+        return self._specs[self._key(id, version)]
+    
+    def get(self, id: str, version: Optional[str] = None) -> "Calculator":
+        """
+        Get a calculator, importing its module on first use.
+        
+        Args:
+            id: Calculator id
+            version: Calculator version, or None for the highest registered version
+            
+        Returns:
+            Calculator: The calculator instance
+            
+        Raises:
+            ValueError: If the calculator or version is not registered, or its target cannot be imported
+            TypeError: If the target is not a Calculator instance
+        """
+        key = self._key(id, version)
+        calculator = self._loaded.get(key)
+        if calculator is None:
+            from mc4llm.calculator.loader import load_calculator
+            calculator = load_calculator(self._specs[key].target)
+            with self._lock:
+                calculator = self._loaded.setdefault(key, calculator)
+        return calculator
+    
+    def tool_definition_bytes(self, id: str, version: Optional[str] = None) -> bytes:
+        """
+        Get the serialized strict function-tool definition of a calculator.
+        
+        The definition is an OpenAI-style ``{"type": "function", "function": {...}}``
+        object whose parameters are the strict JSON schema of the input model.
+        The schema is taken from the spec when the manifest provides it, so no
+        calculator code is imported; otherwise the calculator is imported and
+        the definition is rebuilt only if the input model's schema changes.
+        
+        Args:
+            id: Calculator id
+            version: Calculator version, or None for the highest registered version
+            
+        Returns:
+            bytes: The tool definition as compact UTF-8 JSON
+            
+        Raises:
+            ValueError: If the calculator or version is not registered
+        """
+        key = self._key(id, version)
+        spec = self._specs[key]
+        cached = self._tools.get(key)
+        if spec.parameters is not None:
+            if cached is not None:
+                return cached[1]
+            parameters = json.dumps(spec.parameters, separators=(",", ":")).encode("utf-8")
+        else:
+            from mc4llm.models.schema import strict_json_schema_bytes
+            parameters = strict_json_schema_bytes(self.get(*key).input_model)
+        if cached is None or cached[0] is not parameters:
+            function = {"name": spec.id, "description": spec.description or spec.title, "strict": True}
+            head = json.dumps({"type": "function", "function": function}, separators=(",", ":")).encode("utf-8")
+            # Splice the cached schema bytes in rather than re-serializing them.
+            cached = (parameters, head[:-2] + b',"parameters":' + parameters + b"}}")
+            self._tools[key] = cached
+        return cached[1]
+    
+    def tools_bytes(self, ids: Optional[Iterable[str]] = None) -> bytes:
+        """
+        Get the serialized list of tool definitions, e.g. for an LLM request.
+        
+        Args:
+            ids: Calculator ids to include, at their highest version; defaults to all
+            
+        Returns:
+            bytes: A JSON array of tool definitions
+            
+        Raises:
+            ValueError: If a calculator is not registered
+        """
+        ids = sorted(self._latest) if ids is None else ids
+        return b"[" + b",".join(self.tool_definition_bytes(id) for id in ids) + b"]"
+    
+    def versions(self, id: str) -> List[str]:
+        """Get the registered versions of a calculator, lowest first."""
+        return sorted((version for key, version in self._specs if key == id), key=_version_key)
+    
+    def specs(self) -> List[CalculatorSpec]:
+        """Get the latest spec of every registered calculator, ordered by id."""
+        return [self._specs[(id, self._latest[id])] for id in sorted(self._latest)]
+    
+    def is_loaded(self, id: str, version: Optional[str] = None) -> bool:
+        """Whether the calculator has already been imported by ``get``."""
+        return self._key(id, version) in self._loaded
+    
+    def _key(self, id: str, version: Optional[str]) -> Tuple[str, str]:
+        if version is None:
+            version = self._latest.get(id)
+            if version is None:
+                raise ValueError(f"Calculator '{id}' not found")
+        elif (id, version) not in self._specs:
+            raise ValueError(f"Calculator '{id}' version '{version}' not found")
+        return id, version
+    
+    def __contains__(self, id: str) -> bool:
+        return id in self._latest
+    
+    def __len__(self) -> int:
+        return len(self._latest)
+    
+    def __iter__(self) -> Iterator[CalculatorSpec]:
+        return iter(self.specs())
+
+def default_registry() -> CalculatorRegistry:
+    """
+    Get the shared registry of built-in and installed calculators.
+    
+    Built on first use from the built-in manifest and the ``mc4llm.calculators``
+    entry points; no calculator module is imported.
+    
+    Returns:
+        CalculatorRegistry: The shared registry
+    """
+    global _default_registry
+    if _default_registry is None:
+        with _default_registry_lock:
+            if _default_registry is None:
+                registry = CalculatorRegistry()
+                registry.load_manifest(BUILTIN_MANIFEST)
+                registry.load_entry_points()
+                _default_registry = registry
+    return _default_registry
+
+def get_calculator(id: str, version: Optional[str] = None) -> "Calculator":
+    """
+    Get a calculator from the default registry, importing it on first use.
+    
+    Args:
+        id: Calculator id
+        version: Calculator version, or None for the highest registered version
+        
+    Returns:
+        Calculator: The calculator instance
+        
+    Raises:
+        ValueError: If the calculator or version is not registered
+    """
+    return default_registry().get(id, version)
+
+def list_calculators() -> List[CalculatorSpec]:
+    """Get the latest spec of every calculator in the default registry, ordered by id."""
+    return default_registry().specs()
@@ -0,0 +1,213 @@
+"""Dispatch of LLM tool calls straight from their raw JSON arguments.
+
+Arguments are validated by pydantic's JSON parser without an intermediate
+dict, results are serialized straight to JSON bytes, and calls to the same
+calculator run together through ``calculate_batch``. Each call gets its own
+result; a failing call is reported as a structured tool error and does not
+affect the others.
+"""
+import asyncio
+import json
+import math
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple, Union, TYPE_CHECKING
+
+from pint.errors import PintError
+from pydantic import ValidationError
+from pydantic_core import to_json
+
+from mc4llm.models.base import json_default
+from mc4llm.registry.base import CalculatorRegistry, default_registry
+
+if TYPE_CHECKING:
+    from mc4llm.calculator import Calculator
+
+class ToolCall(NamedTuple):
+    """One tool call of an LLM response; arguments are the raw JSON text, or an already decoded object."""
+    id: str
+    name: str
+    arguments: Union[str, bytes, Mapping[str, Any]]
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "ToolCall":
+        """
+        Read a tool call in one of the common wire formats.
+        
+        Accepts OpenAI ``{"id", "function": {"name", "arguments"}}`` calls,
+        Anthropic ``{"id", "name", "input"}`` tool uses, and flat
+        ``{"id", "name", "arguments"}`` objects.
+        
+        Args:
+            data: The decoded tool call
+            
+        Returns:
+            ToolCall: The tool call
+            
+        Raises:
+            ValueError: If the object has none of the supported shapes
+        """
+        if not isinstance(data, Mapping):
+            raise ValueError("Tool call must be an object")
+        function = data.get("function", data)
+        name = function.get("name") if isinstance(function, Mapping) else None
+        arguments = function.get("arguments", function.get("input")) if isinstance(function, Mapping) else None
+        if not isinstance(name, str) or arguments is None:
+            raise ValueError("Tool call must have a name and arguments")
+        return cls(str(data.get("id", "")), name, arguments)
+
+class ToolResult(NamedTuple):
+    """Result of one tool call; content is the serialized calculator output or error object."""
+    call_id: str
+    name: str
+    content: bytes
+    is_error: bool = False
+
+    def message_bytes(self) -> bytes:
+        """Serialize the result as an OpenAI-style ``{"role": "tool", ...}`` message."""
+        return (
+            b'{"role":"tool","tool_call_id":' + json.dumps(self.call_id).encode("utf-8")
+            + b',"content":' + json.dumps(self.content.decode("utf-8")).encode("utf-8") + b"}"
+        )
+
+def _error(call: ToolCall, kind: str, message: str, details: Optional[bytes] = None) -> ToolResult:
+    content = b'{"error":{"type":' + json.dumps(kind).encode("utf-8") + b',"message":' + json.dumps(message).encode("utf-8")
+    if details is not None:
+        content += b',"details":' + details
+    return ToolResult(call.id, call.name, content + b"}}", is_error=True)
+
+def _non_finite_field(output: Any) -> Optional[str]:
+    """Name the first float field of an output that JSON cannot represent, if any."""
+    for name in type(output).model_fields:
+        value = getattr(output, name)
+        if isinstance(value, float) and not math.isfinite(value):
+            return name
+    return None
+
+def _run_group(calculator: "Calculator", calls: List[Tuple[int, ToolCall]]) -> List[Tuple[int, ToolResult]]:
+    """Validate and calculate the calls of one calculator; returns results with their call positions."""
+    model = calculator.input_model
+    results: List[Tuple[int, ToolResult]] = []
+    valid: List[Tuple[int, ToolCall]] = []
+    rows = []
+    for index, call in calls:
+        try:
+            arguments = call.arguments
+            if isinstance(arguments, Mapping):
+                rows.append(model.model_validate(arguments))
+            else:
+                rows.append(model.model_validate_json(arguments))
+        except ValidationError as error:
+            details = error.json(include_url=False, include_context=False).encode("utf-8")
+            results.append((index, _error(call, "invalid_arguments", "Tool arguments failed validation", details)))
+            continue
+        except (ValueError, TypeError, PintError) as error:
+            results.append((index, _error(call, "invalid_arguments", str(error))))
+            continue
+        valid.append((index, call))
+    if not rows:
+        return results
+    
+    try:
+        outputs = calculator.calculate_batch(rows) if len(rows) > 1 else [calculator.calculate(rows[0])]
+    except Exception:
+        outputs = None
+    for position, (index, call) in enumerate(valid):
+        try:
+            output = outputs[position] if outputs is not None else calculator.calculate(rows[position])
+            if outputs is not None and _non_finite_field(output) is not None:
+                # Only trust a batch row that calculate would have given as well.
+                output = calculator.calculate(rows[position])
+            name = _non_finite_field(output)
+            if name is not None:
+                raise ValueError(f"Calculation produced a non-finite value for '{name}'")
+            results.append((index, ToolResult(call.id, call.name, to_json(output, fallback=json_default))))
+        except Exception as error:
+            # Calls are isolated: one failing calculation is reported, not raised.
+            results.append((index, _error(call, "calculation_error", str(error) or type(error).__name__)))
+    return results
+
+def _plan(
+    calls: Iterable[Union[ToolCall, Mapping[str, Any]]], registry: Optional[CalculatorRegistry]
+) -> Tuple[List[Optional[ToolResult]], List[Tuple["Calculator", List[Tuple[int, ToolCall]]]]]:
+    """Resolve tool names and group the calls by calculator, in first-call order."""
+    registry = registry if registry is not None else default_registry()
+    results: List[Optional[ToolResult]] = []
+    groups: Dict[str, Tuple["Calculator", List[Tuple[int, ToolCall]]]] = {}
+    for index, call in enumerate(calls):
+        results.append(None)
+        if not isinstance(call, ToolCall):
+            try:
+                call = ToolCall.from_dict(call)
+            except ValueError as error:
+                results[index] = _error(ToolCall("", "", b""), "invalid_call", str(error))
+                continue
+        group = groups.get(call.name)
+        if group is None:
+            try:
+                group = groups[call.name] = (registry.get(call.name), [])
+            except (ValueError, TypeError) as error:
+                results[index] = _error(call, "unknown_tool", str(error))
+                continue
+        group[1].append((index, call))
+    return results, list(groups.values())
+
+def dispatch_tool_calls(
+    calls: Iterable[Union[ToolCall, Mapping[str, Any]]],
+    registry: Optional[CalculatorRegistry] = None,
+    executor: Optional[Executor] = None
+) -> List[ToolResult]:
+    """
+    Run the tool calls of an LLM response.
+    
+    Args:
+        calls: Tool calls, or decoded tool-call objects in a format read by ``ToolCall.from_dict``
+        registry: Registry resolving tool names to calculators; defaults to ``default_registry()``
+        executor: Executor running the calls of different calculators concurrently;
+            without one they run in turn on the calling thread
+            
+    Returns:
+        List[ToolResult]: One result per call, in call order
+    """
+    results, groups = _plan(calls, registry)
+    if executor is None or len(groups) < 2:
+        done = [_run_group(calculator, group) for calculator, group in groups]
+    else:
+        futures = [executor.submit(_run_group, calculator, group) for calculator, group in groups]
+        done = [future.result() for future in futures]
+    for group_results in done:
+        for index, result in group_results:
+            results[index] = result
+    return results
+
+async def adispatch_tool_calls(
+    calls: Iterable[Union[ToolCall, Mapping[str, Any]]],
+    registry: Optional[CalculatorRegistry] = None,
+    executor: Optional[Executor] = None
+) -> List[ToolResult]:
+    """
+    Coroutine version of ``dispatch_tool_calls`` that keeps the event loop free.
+    
+    The calls of each calculator run as one job in the executor, concurrently
+    with the other calculators' jobs.
+    
+    Args:
+        calls: Tool calls, or decoded tool-call objects in a format read by ``ToolCall.from_dict``
+        registry: Registry resolving tool names to calculators; defaults to ``default_registry()``
+        executor: Executor for the jobs; None uses the loop's default thread pool
+        
+    Returns:
+        List[ToolResult]: One result per call, in call order
+    """
+    results, groups = _plan(calls, registry)
+    loop = asyncio.get_running_loop()
+    done = await asyncio.gather(*(
+        loop.run_in_executor(executor, _run_group, calculator, group) for calculator, group in groups
+    ))
+    for group_results in done:
+        for index, result in group_results:
+            results[index] = result
+    return results
+
+def tool_messages_bytes(results: Iterable[ToolResult]) -> bytes:
+    """Serialize tool results as a JSON array of OpenAI-style tool messages."""
+    return b"[" + b",".join(result.message_bytes() for result in results) + b"]"
@@ -1,13 +1,70 @@
+import weakref
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from mc4llm import instrumentation
 
 class BaseRule(ABC):
     """Root class for all types of rules in the system."""
     def __init__(self, name: Optional[str] = None):
         self.name = name or "default"
+    
+    @property
+    def name(self) -> str:
+        """Name of the rule, unique within each guideline holding it."""
+        return self._name
+    
+    @name.setter
+    def name(self, name: str) -> None:
+        # Keep the name index of every owning guideline in step with the new name.
+        guidelines = list(self._owners())
+        for guideline in guidelines:
+            guideline.rules._check_rename(self, name)
+        self._modify()
+        self._name = name
+        for guideline in guidelines:
+            guideline.rules._reindex()
+    
+    def _owners(self) -> "weakref.WeakSet":
+        """
+        Get the guidelines holding this rule, kept up to date by their collections.
+        
+        Created on first use, so subclasses that do not call ``__init__`` are tracked too.
+        """
+        return self.__dict__.setdefault("_guidelines", weakref.WeakSet())
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_guidelines"] = list(self._owners())
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        guidelines = state.pop("_guidelines", ())
+        self.__dict__.update(state)
+        self._guidelines = weakref.WeakSet(guidelines)
+    
+    def _modify(self) -> None:
+        """
+        Called by subclasses before a change that alters results: invalidates the
+        compiled plans and cached results of every guideline holding this rule.
+        
+        Raises:
+            TypeError: If one of those guidelines is frozen
+        """
+        guidelines = list(self._owners())
+        if any(guideline.frozen for guideline in guidelines):
+            raise TypeError("Rule belongs to a frozen guideline and cannot be modified")
+        for guideline in guidelines:
+            guideline._modify()
 
 class BaseClassificationRule(BaseRule, ABC):
     """Abstract base class for rules that classify values into categories."""
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _probe_rule_methods(cls)
+
     @abstractmethod
     def categorize(self, value: Any, **kwargs) -> str:
         """
@@ -20,4 +77,42 @@ class BaseClassificationRule(BaseRule, ABC):
         Returns:
             str: The category the value falls into
         """
-        pass 
\ No newline at end of file
+        pass
+
+    def categorize_many(
+        self, values: Iterable[Any], return_codes: bool = False, **kwargs
+    ) -> Union[List[str], Tuple[np.ndarray, Tuple[str, ...]]]:
+        """
+        Categorize a one-dimensional batch of values.
+        
+        The default implementation calls ``categorize`` once per value; subclasses
+        can override it with a vectorized version that gives the same answers.
+        
+        Args:
+            values: Array or sequence of values to categorize
+            return_codes: If True, return integer category codes and a label table
+                instead of a list of labels
+            **kwargs: Additional parameters passed on to ``categorize``
+            
+        Returns:
+            Either the list of categories, or a tuple ``(codes, labels)`` where
+            ``codes`` is an int32 array such that ``labels[codes[i]]`` is the
+            category of ``values[i]``
+        """
+        categories = [self.categorize(value, **kwargs) for value in values]
+        if not return_codes:
+            return categories
+        table: Dict[str, int] = {}
+        codes = np.fromiter(
+            (table.setdefault(category, len(table)) for category in categories),
+            dtype=np.int32,
+            count=len(categories)
+        )
+        return codes, tuple(table)
+
+def _probe_rule_methods(cls: type) -> None:
+    for method in ("categorize", "categorize_many"):
+        if method in cls.__dict__:
+            instrumentation.probe(cls, method, "rule", instrumentation.component_name(method))
+
+_probe_rule_methods(BaseClassificationRule)
@@ -1,14 +1,47 @@
-from typing import Dict, Tuple, Optional
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Tuple, Optional, Union
+
+import numpy as np
+
 from mc4llm.rule.base import BaseClassificationRule
 
 class RangeRule(BaseClassificationRule):
-    """Represents a rule that classifies a value into categories based on numeric ranges."""
+    """Represents a rule that classifies a value into categories based on numeric ranges.
+
+    The thresholds are compiled once into sorted lower/upper boundary lists so that
+    ``categorize`` locates a band by binary search instead of scanning every range,
+    and ``categorize_many`` does the same search over whole NumPy arrays.
+    """
     def __init__(self, thresholds: Dict[str, Tuple[float, float]], default_category: str = "Unknown", name: Optional[str] = None):
         super().__init__(name)
-        self._validate_thresholds(thresholds)
         self.thresholds = thresholds
         self.default_category = default_category
 
+    @property
+    def thresholds(self) -> Mapping[str, Tuple[float, float]]:
+        """The category name to (min, max) range mapping; read-only, assign a new one to change it."""
+        return MappingProxyType(self._thresholds)
+
+    @thresholds.setter
+    def thresholds(self, thresholds: Mapping[str, Tuple[float, float]]) -> None:
+        # Copy so that later changes to the caller's dict cannot bypass the compiled index.
+        thresholds = dict(thresholds)
+        self._validate_thresholds(thresholds)
+        self._modify()
+        self._thresholds = thresholds
+        self._compile_thresholds(thresholds)
+
+    @property
+    def default_category(self) -> str:
+        """The category of values outside every range."""
+        return self._default_category
+
+    @default_category.setter
+    def default_category(self, default_category: str) -> None:
+        self._modify()
+        self._default_category = default_category
+
     def _validate_thresholds(self, thresholds: Dict[str, Tuple[float, float]]) -> None:
         """
         Validate the thresholds dictionary.
@@ -37,9 +70,56 @@ class RangeRule(BaseClassificationRule):
                     f"Overlapping ranges detected between categories '{sorted_ranges[i][2]}' and '{sorted_ranges[i + 1][2]}'"
                 )
 
+    def _compile_thresholds(self, thresholds: Dict[str, Tuple[float, float]]) -> None:
+        """
+        Build the sorted boundary lists used by ``categorize``.
+        
+        Args:
+            thresholds: Validated dictionary of category names to (min, max) range tuples
+        """
+        sorted_ranges = sorted(
+            ((min_val, max_val, category) for category, (min_val, max_val) in thresholds.items()),
+            key=lambda band: band[0]
+        )
+        self._lower_bounds: List[float] = [band[0] for band in sorted_ranges]
+        self._upper_bounds: List[float] = [band[1] for band in sorted_ranges]
+        self._categories: List[str] = [band[2] for band in sorted_ranges]
+        self._lower_array = np.array(self._lower_bounds, dtype=np.float64)
+        self._upper_array = np.array(self._upper_bounds, dtype=np.float64)
+
     def categorize(self, value: float, **kwargs) -> str:
         """Categorize a value based on the defined thresholds."""
-        for category, (min_val, max_val) in self.thresholds.items():
-            if min_val <= value < max_val:
-                return category
-        return self.default_category 
\ No newline at end of file
+        # Ranges are half-open [min, max) and never overlap, so the only candidate
+        # is the last band whose minimum is <= value. NaN never satisfies the
+        # upper bound check and falls through to the default category.
+        i = bisect_right(self._lower_bounds, value) - 1
+        if i >= 0 and value < self._upper_bounds[i]:
+            return self._categories[i]
+        return self._default_category
+
+
+    def categorize_many(
+        self, values: Iterable[float], return_codes: bool = False, **kwargs
+    ) -> Union[List[str], Tuple[np.ndarray, Tuple[str, ...]]]:
+        """
+        Categorize a one-dimensional batch of values with a vectorized binary search.
+        
+        Gives exactly the same categories as calling ``categorize`` on each value.
+        The label table always lists the categories in ascending range order,
+        followed by ``default_category`` for values in gaps, out of range or NaN.
+        
+        Args:
+            values: Array or sequence of numeric values
+            return_codes: If True, return ``(codes, labels)`` instead of a list of labels
+            
+        Returns:
+            The list of categories, or an int32 code array and its label table
+        """
+        values = np.asarray(values, dtype=np.float64)
+        i = np.searchsorted(self._lower_array, values, side="right") - 1
+        in_band = (i >= 0) & (values < self._upper_array[np.maximum(i, 0)])
+        codes = np.where(in_band, i, len(self._categories)).astype(np.int32)
+        labels = tuple(self._categories) + (self._default_category,)
+        if return_codes:
+            return codes, labels
+        return np.array(labels, dtype=object)[codes].tolist()
@@ -0,0 +1,9 @@
+"""Calculator Registry Server
+
+Asyncio HTTP service for listing, describing and running the calculators of a
+registry. Uses only the standard library, so it runs fully offline.
+"""
+from mc4llm.server.app import RegistryServer, serve
+from mc4llm.server.http import HTTPError, HTTPRequest
+
+__all__ = ["RegistryServer", "serve", "HTTPError", "HTTPRequest"]
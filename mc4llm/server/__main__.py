@@ -0,0 +1,26 @@
+"""Run the calculator registry server: ``python -m mc4llm.server [--port 8000]``."""
+import argparse
+import asyncio
+
+from mc4llm.registry import CalculatorRegistry, default_registry
+from mc4llm.server.app import serve
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve a calculator registry over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--manifest", action="append", default=[], help="Extra calculator manifest (repeatable)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker threads for batch requests")
+    parser.add_argument("--max-pending", type=int, default=64, help="Queued jobs before answering 503")
+    args = parser.parse_args()
+    
+    registry: CalculatorRegistry = default_registry()
+    for manifest in args.manifest:
+        registry.load_manifest(manifest, replace=True)
+    try:
+        asyncio.run(serve(registry, args.host, args.port, max_workers=args.workers, max_pending=args.max_pending))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
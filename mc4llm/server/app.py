@@ -0,0 +1,326 @@
+import asyncio
+import math
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from pint.errors import PintError
+from pydantic import BaseModel, ValidationError
+
+from mc4llm.calculator import Calculator
+from mc4llm.models.schema import strict_json_schema_bytes
+from mc4llm.registry import CalculatorRegistry, default_registry
+from mc4llm.registry.dispatch import dispatch_tool_calls, tool_messages_bytes
+from mc4llm.server.http import HTTPError, HTTPRequest, encode_response, json_body, read_request
+
+def _validation_error(error: ValidationError, index: Optional[int] = None) -> HTTPError:
+    details: Dict[str, Any] = {"errors": error.errors(include_url=False, include_context=False)}
+    if index is not None:
+        details["index"] = index
+    return HTTPError(422, "Input validation failed", details)
+
+# Errors of invalid inputs or of calculations that fail on them, answered with 422.
+_INPUT_ERRORS = (ValueError, TypeError, ArithmeticError, PintError)
+
+def _dump(result: BaseModel, index: Optional[int] = None) -> Dict[str, Any]:
+    """Dump a result for a JSON response, rejecting numbers JSON cannot represent."""
+    data = result.model_dump()
+    for name, value in data.items():
+        if isinstance(value, float) and not math.isfinite(value):
+            details = {"index": index} if index is not None else None
+            raise HTTPError(422, f"Calculation produced a non-finite value for '{name}'", details)
+    return data
+
+def _calculate_one(calculator: Calculator, payload: Any) -> Dict[str, Any]:
+    """Validate one JSON input and calculate it; runs inline or in a worker."""
+    try:
+        data = calculator.input_model.model_validate(payload)
+        return _dump(calculator.calculate(data))
+    except ValidationError as error:
+        raise _validation_error(error) from None
+    except _INPUT_ERRORS as error:
+        raise HTTPError(422, str(error)) from None
+
+def _calculate_many(calculator: Calculator, payloads: List[Any]) -> List[Dict[str, Any]]:
+    """Validate a list of JSON inputs and calculate them as one batch; runs in a worker."""
+    rows = []
+    for index, payload in enumerate(payloads):
+        try:
+            rows.append(calculator.input_model.model_validate(payload))
+        except ValidationError as error:
+            raise _validation_error(error, index) from None
+        except _INPUT_ERRORS as error:
+            raise HTTPError(422, str(error), {"index": index}) from None
+    try:
+        results = calculator.calculate_batch(rows)
+    except _INPUT_ERRORS as error:
+        # Name the first row the calculation fails on.
+        for index, row in enumerate(rows):
+            try:
+                calculator.calculate(row)
+            except _INPUT_ERRORS as row_error:
+                raise HTTPError(422, str(row_error), {"index": index}) from None
+        raise HTTPError(422, str(error)) from None
+    return [_dump(result, index) for index, result in enumerate(results)]
+
+class RegistryServer:
+    """
+    Asyncio HTTP service exposing the calculators of a registry as JSON endpoints.
+    
+    Endpoints:
+        GET  /health                              liveness check
+        GET  /calculators                         catalog of calculator specs
+        GET  /calculators/{id}[?version=]         spec plus strict input/output JSON schemas
+        GET  /calculators/{id}/tool[?version=]    strict function-tool definition
+        GET  /tools                               tool definitions of all calculators
+        POST /tool-calls                          LLM tool calls -> tool messages
+        POST /calculators/{id}/calculate          one input object -> one result
+        POST /calculators/{id}/batch              {"inputs": [...]} -> {"results": [...]}
+        
+    Schema and tool responses are served from pre-serialized bytes.
+    Connections are kept alive between requests. Batches run on a bounded
+    worker pool; when ``max_pending`` jobs are already queued the server
+    answers 503 with Retry-After instead of queueing more work, and at most
+    ``max_connections`` connections are served at once.
+    """
+    
+    def __init__(
+        self,
+        registry: Optional[CalculatorRegistry] = None,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        max_pending: int = 64,
+        max_connections: int = 1024,
+        max_batch_size: int = 10_000,
+        max_body_bytes: int = 10_485_760,
+        keep_alive_timeout: float = 5.0,
+        offload_single: bool = False
+    ):
+        """
+        Initialize the server.
+        
+        Args:
+            registry: Registry of the served calculators; defaults to ``default_registry()``
+            host: Interface to bind
+            port: Port to bind; 0 picks a free port, available as ``port`` after ``start``
+            max_workers: Size of the worker thread pool; defaults to the number of CPUs
+            executor: Executor for CPU work instead of the built-in thread pool; it is
+                not shut down by the server. Process pools require picklable calculators.
+            max_pending: Maximum number of jobs queued or running on the workers
+            max_connections: Maximum number of connections served at once
+            max_batch_size: Maximum number of inputs in one batch request
+            max_body_bytes: Maximum request body size
+            keep_alive_timeout: Seconds an idle connection is kept open
+            offload_single: Also run single calculations on the workers instead of inline
+            
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        for name, value in (
+            ("max_pending", max_pending), ("max_connections", max_connections),
+            ("max_batch_size", max_batch_size), ("max_body_bytes", max_body_bytes),
+            ("keep_alive_timeout", keep_alive_timeout),
+        ):
+            if value <= 0:
+                raise ValueError(f"{name} must be positive")
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError("max_workers must be positive")
+        self.registry = registry if registry is not None else default_registry()
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending
+        self.max_connections = max_connections
+        self.max_batch_size = max_batch_size
+        self.max_body_bytes = max_body_bytes
+        self.keep_alive_timeout = keep_alive_timeout
+        self.offload_single = offload_single
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._pending = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Optional[asyncio.Semaphore] = None
+        # Serialized descriptions, with the input and output schemas they were built from.
+        self._descriptions: Dict[Tuple[str, str], Tuple[bytes, bytes, bytes]] = {}
+    
+    @property
+    def url(self) -> str:
+        """Base URL of the server."""
+        return f"http://{self.host}:{self.port}"
+    
+    async def start(self) -> None:
+        """Bind the socket and start accepting connections."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="mc4llm-server")
+        self._connections = asyncio.Semaphore(self.max_connections)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def serve_forever(self) -> None:
+        """Start the server if needed and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+    
+    async def close(self) -> None:
+        """Stop accepting connections and release the worker pool."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    async def __aenter__(self) -> "RegistryServer":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            async with self._connections:
+                while True:
+                    keep_alive = False
+                    try:
+                        request = await asyncio.wait_for(
+                            read_request(reader, max_body_bytes=self.max_body_bytes), self.keep_alive_timeout
+                        )
+                        if request is None:
+                            break
+                        keep_alive = request.keep_alive
+                        status, payload, headers = 200, await self._dispatch(request), {}
+                        body = payload if isinstance(payload, bytes) else json_body(payload)
+                    except HTTPError as error:
+                        # keep_alive is still False when the request itself could not be read.
+                        status, headers, body = error.status, error.headers, json_body(error.to_dict())
+                    except asyncio.TimeoutError:
+                        break
+                    except Exception as error:
+                        internal = HTTPError(500, f"Internal error: {type(error).__name__}")
+                        status, headers, body = internal.status, {}, json_body(internal.to_dict())
+                    writer.write(encode_response(status, body, keep_alive, headers))
+                    await writer.drain()
+                    if not keep_alive:
+                        break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+    
+    async def _dispatch(self, request: HTTPRequest) -> Any:
+        """Route a request; returns a JSON-compatible payload, or bytes that are already JSON."""
+        parts = [part for part in request.path.split("/") if part]
+        if parts == ["health"]:
+            self._require_method(request, "GET")
+            return {"status": "ok", "pending": self._pending, "max_pending": self.max_pending}
+        if parts == ["tools"]:
+            self._require_method(request, "GET")
+            return self.registry.tools_bytes()
+        if parts == ["tool-calls"]:
+            self._require_method(request, "POST")
+            payload = request.json()
+            calls = payload.get("tool_calls") if isinstance(payload, dict) else payload
+            if not isinstance(calls, list):
+                raise HTTPError(400, "Body must be a list of tool calls or an object with a 'tool_calls' list")
+            if len(calls) > self.max_batch_size:
+                raise HTTPError(413, f"Request exceeds {self.max_batch_size} tool calls")
+            results = await self._run(dispatch_tool_calls, calls, self.registry)
+            return tool_messages_bytes(results)
+        if not parts or parts[0] != "calculators" or len(parts) > 3:
+            raise HTTPError(404, f"No route for {request.path}")
+        if len(parts) == 1:
+            self._require_method(request, "GET")
+            return {"calculators": [spec.to_dict() for spec in self.registry.specs()]}
+        
+        calculator_id, version = parts[1], request.query.get("version")
+        if len(parts) == 2:
+            self._require_method(request, "GET")
+            return self._describe(calculator_id, version)
+        
+        action = parts[2]
+        if action == "tool":
+            self._require_method(request, "GET")
+            self._calculator(calculator_id, version)
+            return self.registry.tool_definition_bytes(calculator_id, version)
+        if action not in ("calculate", "batch"):
+            raise HTTPError(404, f"No route for {request.path}")
+        self._require_method(request, "POST")
+        calculator = self._calculator(calculator_id, version)
+        payload = request.json()
+        if action == "calculate":
+            if not self.offload_single:
+                return _calculate_one(calculator, payload)
+            return await self._run(_calculate_one, calculator, payload)
+        
+        inputs = payload.get("inputs") if isinstance(payload, dict) else payload
+        if not isinstance(inputs, list):
+            raise HTTPError(400, "Batch body must be a list of inputs or an object with an 'inputs' list")
+        if len(inputs) > self.max_batch_size:
+            raise HTTPError(413, f"Batch exceeds {self.max_batch_size} inputs")
+        return {"results": await self._run(_calculate_many, calculator, inputs)}
+    
+    async def _run(self, fn: Any, *args: Any) -> Any:
+        """Run a job on the worker pool, or refuse it if too many are pending."""
+        if self._pending >= self.max_pending:
+            raise HTTPError(503, "Server is busy, retry later", headers={"Retry-After": "1"})
+        self._pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self._pending -= 1
+    
+    def _calculator(self, calculator_id: str, version: Optional[str]) -> Calculator:
+        try:
+            return self.registry.get(calculator_id, version)
+        except ValueError as error:
+            raise HTTPError(404, str(error)) from None
+    
+    def _describe(self, calculator_id: str, version: Optional[str]) -> bytes:
+        try:
+            spec = self.registry.spec(calculator_id, version)
+        except ValueError as error:
+            raise HTTPError(404, str(error)) from None
+        key = (spec.id, spec.version)
+        calculator = self._calculator(spec.id, spec.version)
+        input_schema = strict_json_schema_bytes(calculator.input_model)
+        output_schema = strict_json_schema_bytes(calculator.output_model)
+        cached = self._descriptions.get(key)
+        if cached is None or cached[0] is not input_schema or cached[1] is not output_schema:
+            description = (
+                json_body(spec.to_dict())[:-1]
+                + b',"input_schema":' + input_schema
+                + b',"output_schema":' + output_schema + b"}"
+            )
+            cached = self._descriptions[key] = (input_schema, output_schema, description)
+        return cached[2]
+    
+    @staticmethod
+    def _require_method(request: HTTPRequest, method: str) -> None:
+        if request.method != method:
+            raise HTTPError(405, f"Method {request.method} not allowed", headers={"Allow": method})
+
+async def serve(registry: Optional[CalculatorRegistry] = None, host: str = "127.0.0.1", port: int = 8000, **options: Any) -> None:
+    """
+    Run a registry server until cancelled.
+    
+    Args:
+        registry: Registry of the served calculators; defaults to ``default_registry()``
+        host: Interface to bind
+        port: Port to bind
+        **options: Further ``RegistryServer`` options
+    """
+    server = RegistryServer(registry, host=host, port=port, **options)
+    await server.start()
+    await server.serve_forever()
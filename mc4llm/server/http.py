@@ -0,0 +1,181 @@
+"""Minimal HTTP/1.1 over asyncio streams, enough for a JSON API.
+
+Supports keep-alive and Content-Length bodies; chunked request bodies are rejected.
+"""
+import asyncio
+import json
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+from mc4llm.models.base import json_default
+
+class HTTPError(Exception):
+    """An error that is sent to the client as a JSON response."""
+    
+    def __init__(self, status: int, message: str, details: Any = None, headers: Optional[Dict[str, str]] = None):
+        """
+        Initialize the error.
+        
+        Args:
+            status: HTTP status code
+            message: Human readable error message
+            details: Optional JSON-compatible details, e.g. validation errors
+            headers: Extra response headers
+        """
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.details = details
+        self.headers = headers or {}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the JSON error body."""
+        error: Dict[str, Any] = {"status": self.status, "message": self.message}
+        if self.details is not None:
+            error["details"] = self.details
+        return {"error": error}
+
+@dataclass
+class HTTPRequest:
+    """A parsed request; header names are lower case."""
+    method: str
+    path: str
+    query: Dict[str, str]
+    version: str
+    headers: Dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    
+    @property
+    def keep_alive(self) -> bool:
+        """Whether the client wants the connection kept open after the response."""
+        connection = self.headers.get("connection", "").lower()
+        if self.version == "HTTP/1.0":
+            return connection == "keep-alive"
+        return connection != "close"
+    
+    def json(self) -> Any:
+        """
+        Decode the body as JSON.
+        
+        Raises:
+            HTTPError: 400 if the body is missing or not valid JSON
+        """
+        if not self.body:
+            raise HTTPError(400, "Request body must be JSON")
+        try:
+            return json.loads(self.body)
+        except ValueError as error:
+            raise HTTPError(400, f"Invalid JSON: {error}") from error
+
+async def read_request(
+    reader: asyncio.StreamReader, max_header_bytes: int = 16_384, max_body_bytes: int = 10_485_760
+) -> Optional[HTTPRequest]:
+    """
+    Read one request from a connection.
+    
+    Args:
+        reader: The connection's stream reader
+        max_header_bytes: Size limit of the request line and headers
+        max_body_bytes: Size limit of the body
+        
+    Returns:
+        Optional[HTTPRequest]: The request, or None if the client closed the connection
+        
+    Raises:
+        HTTPError: 400/413/431/501 for malformed or oversized requests
+    """
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as error:
+        if not error.partial.strip():
+            return None
+        raise HTTPError(400, "Incomplete request") from error
+    except asyncio.LimitOverrunError as error:
+        raise HTTPError(431, "Request headers too large") from error
+    if len(head) > max_header_bytes:
+        raise HTTPError(431, "Request headers too large")
+    
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = request_line.split(" ")
+    except ValueError as error:
+        raise HTTPError(400, "Malformed request line") from error
+    if version not in ("HTTP/1.0", "HTTP/1.1"):
+        raise HTTPError(505, f"Unsupported HTTP version {version}")
+    headers = {}
+    for line in header_lines:
+        if not line:
+            continue
+        name, separator, value = line.partition(":")
+        if not separator:
+            raise HTTPError(400, "Malformed header line")
+        headers[name.strip().lower()] = value.strip()
+    
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HTTPError(501, "Chunked request bodies are not supported")
+    try:
+        length = int(headers.get("content-length", "0"))
+    except ValueError as error:
+        raise HTTPError(400, "Invalid Content-Length") from error
+    if length < 0:
+        raise HTTPError(400, "Invalid Content-Length")
+    if length > max_body_bytes:
+        raise HTTPError(413, f"Request body exceeds {max_body_bytes} bytes")
+    try:
+        body = await reader.readexactly(length) if length else b""
+    except asyncio.IncompleteReadError as error:
+        raise HTTPError(400, "Incomplete request body") from error
+    
+    url = urlsplit(target)
+    return HTTPRequest(
+        method=method.upper(),
+        path=unquote(url.path),
+        query=dict(parse_qsl(url.query)),
+        version=version,
+        headers=headers,
+        body=body,
+    )
+
+def encode_response(
+    status: int, body: bytes, keep_alive: bool, headers: Optional[Dict[str, str]] = None,
+    content_type: str = "application/json"
+) -> bytes:
+    """
+    Serialize a response.
+    
+    Args:
+        status: HTTP status code
+        body: Response body
+        keep_alive: Whether the connection stays open after the response
+        headers: Extra response headers
+        content_type: Content-Type of the body
+        
+    Returns:
+        bytes: The status line, headers and body
+    """
+    lines = [
+        f"HTTP/1.1 {status} {_reason(status)}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+def _reason(status: int) -> str:
+    try:
+        return HTTPStatus(status).phrase
+    except ValueError:
+        return ""
+
+def json_body(payload: Any) -> bytes:
+    """
+    Encode a JSON response body.
+    
+    Raises:
+        ValueError: If the payload holds NaN or infinity, which standard JSON cannot represent
+    """
+    return json.dumps(payload, separators=(",", ":"), default=json_default, allow_nan=False).encode("utf-8")
+
@@ -3,10 +3,15 @@ from setuptools import setup, find_packages
 setup(
     name="medical_calculators",
     version="0.1.0",
-    packages=find_packages(),
+    packages=find_packages(exclude=["benchmarks", "benchmarks.*"]),
+    package_data={"mc4llm.registry": ["calculators.json"]},
+    entry_points={
+        "console_scripts": ["mc4llm-score = mc4llm.cli:main"],
+    },
     install_requires=[
         "pydantic>=1.8.2",
         "pint>=0.17",
+        "numpy>=1.20",
         "pytest>=6.0.0",
     ],
 ) 
\ No newline at end of file
@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mc4llm.calculator import Calculator
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput, SIMPLE_WHO_BMI_CALCULATOR, WHO_BMI_GUIDELINE
+from mc4llm.models import ColumnarBatch
+
+class SlowCalculator(Calculator[BMIInput, BMIOutput]):
+    """Records how many batches run at once and how many chunks were started."""
+    def __init__(self, delay: float):
+        super().__init__(input_model=BMIInput, output_model=BMIOutput, guideline=WHO_BMI_GUIDELINE)
+        self.delay = delay
+        self.chunks = 0
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+    
+    def calculate(self, data: BMIInput) -> BMIOutput:
+        return SIMPLE_WHO_BMI_CALCULATOR.calculate(data)
+    
+    def calculate_batch(self, data):
+        with self._lock:
+            self.chunks += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.delay)
+        with self._lock:
+            self.running -= 1
+        return super().calculate_batch(data)
+
+INPUTS = [BMIInput(weight=weight, height=1.75) for weight in range(50, 60)]
+
+def test_acalculate_matches_calculate():
+    async def main():
+        return await SIMPLE_WHO_BMI_CALCULATOR.acalculate(INPUTS[0])
+    assert asyncio.run(main()) == SIMPLE_WHO_BMI_CALCULATOR.calculate(INPUTS[0])
+
+def test_acalculate_batch_in_chunks():
+    calculator = SlowCalculator(delay=0)
+    calculator.configure_async(chunk_size=3, offload_single=True)
+    expected = SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(INPUTS)
+    
+    async def main():
+        rows = await calculator.acalculate_batch(INPUTS)
+        columns = await calculator.acalculate_batch(ColumnarBatch.from_rows(BMIInput, INPUTS))
+        single = await calculator.acalculate(INPUTS[0])
+        return rows, columns, single
+    
+    rows, columns, single = asyncio.run(main())
+    assert rows == expected
+    assert columns == expected
+    assert single == expected[0]
+    assert calculator.chunks == 8  # 4 chunks per batch
+
+def test_async_concurrency_limit():
+    calculator = SlowCalculator(delay=0.02)
+    calculator.configure_async(executor=ThreadPoolExecutor(max_workers=8), max_concurrency=2)
+    
+    async def main():
+        await asyncio.gather(*(calculator.acalculate_batch(INPUTS) for _ in range(6)))
+    
+    asyncio.run(main())
+    assert calculator.chunks == 6
+    assert calculator.max_running == 2
+
+def test_acalculate_batch_cancellation():
+    calculator = SlowCalculator(delay=0.05)
+    calculator.configure_async(chunk_size=1)
+    
+    async def main():
+        task = asyncio.create_task(calculator.acalculate_batch(INPUTS))
+        await asyncio.sleep(0.08)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0.1)
+    
+    asyncio.run(main())
+    assert calculator.chunks < len(INPUTS)
+
+def test_configure_async_validation():
+    calculator = SlowCalculator(delay=0)
+    with pytest.raises(ValueError):
+        calculator.configure_async(max_concurrency=0)
+    with pytest.raises(ValueError):
+        calculator.configure_async(chunk_size=0)
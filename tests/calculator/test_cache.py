@@ -0,0 +1,127 @@
+import pytest
+
+from mc4llm.calculator import ResultCache
+from mc4llm.calculator.cache import canonical_key
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, WHO_BMI_GUIDELINE
+from mc4llm.example_calculators.bmi.bmi_with_units import (
+    BMIInputWithUnits, BMIOutputWithUnits, BMICalculatorWithUnits, WHO_BMI_GUIDELINE as WHO_BMI_UNITS_GUIDELINE
+)
+from mc4llm.guideline import BaseGuideline
+from mc4llm.rule import RangeRule
+from mc4llm.example_calculators.bmi.simple_bmi import StandardBMIFormula
+from tests.helpers.calculator import make_bmi_calculator
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self) -> float:
+        return self.now
+
+def test_cache_hits_and_misses():
+    calculator = make_bmi_calculator()
+    assert calculator.cache_stats is None
+    calculator.enable_cache(maxsize=8)
+    
+    first = calculator.calculate(BMIInput(weight=70, height=1.75))
+    second = calculator.calculate(BMIInput(weight=70, height=1.75))
+    calculator.calculate(BMIInput(weight=80, height=1.75))
+    
+    assert second is first
+    assert calculator.cache_stats.hits == 1
+    assert calculator.cache_stats.misses == 2
+    assert len(calculator.cache) == 2
+    
+    calculator.disable_cache()
+    assert calculator.cache is None
+    assert calculator.calculate(BMIInput(weight=70, height=1.75)) is not first
+
+def test_cache_keys_after_unit_normalization():
+    calculator = BMICalculatorWithUnits(
+        input_model=BMIInputWithUnits, output_model=BMIOutputWithUnits, guideline=WHO_BMI_UNITS_GUIDELINE
+    )
+    calculator.enable_cache(precision=6)
+    
+    calculator.calculate(BMIInputWithUnits(weight=(150, "pound"), height=(67, "inch")))
+    calculator.calculate(BMIInputWithUnits(weight=(68.0389, "kilogram"), height=(170.18, "centimeter")))
+    assert calculator.cache_stats.hits == 1
+    assert calculator.cache_stats.misses == 1
+
+def test_cache_lru_eviction():
+    calculator = make_bmi_calculator()
+    calculator.enable_cache(maxsize=2)
+    
+    for weight in (60, 70, 60, 80):
+        calculator.calculate(BMIInput(weight=weight, height=1.75))
+    # 70 was the least recently used entry when 80 was added
+    assert calculator.cache_stats.evictions == 1
+    
+    calculator.calculate(BMIInput(weight=60, height=1.75))
+    assert calculator.cache_stats.hits == 2
+    calculator.calculate(BMIInput(weight=70, height=1.75))
+    assert calculator.cache_stats.misses == 4
+
+def test_cache_ttl():
+    clock = FakeClock()
+    cache = ResultCache(maxsize=4, ttl=10, clock=clock)
+    cache.put("key", "value")
+    
+    clock.now = 9.9
+    assert cache.get("key") == (True, "value")
+    clock.now = 10
+    assert cache.get("key") == (False, None)
+    assert cache.stats.expirations == 1
+    assert len(cache) == 0
+    
+    with pytest.raises(ValueError):
+        ResultCache(maxsize=0)
+    with pytest.raises(ValueError):
+        ResultCache(ttl=0)
+
+def test_cache_invalidated_by_guideline_changes():
+    guideline = BaseGuideline(
+        rules=RangeRule(thresholds={"Low": (0, 25), "High": (25, float("inf"))}, name="bmi"),
+        formulas=StandardBMIFormula(name="standard")
+    )
+    calculator = make_bmi_calculator(guideline=guideline)
+    calculator.enable_cache()
+    
+    data = BMIInput(weight=70, height=1.75)
+    assert calculator.calculate(data).category == "Low"
+    
+    guideline.rules[0] = RangeRule(thresholds={"Normal": (0, 30)}, name="bmi")
+    assert calculator.calculate(data).category == "Normal"
+    assert calculator.cache_stats.invalidations == 1
+    assert calculator.cache_stats.hits == 0
+
+def test_cache_invalidated_by_rule_changes():
+    rule = RangeRule(thresholds={"Low": (0, 25), "High": (25, float("inf"))}, name="bmi")
+    guideline = BaseGuideline(rules=rule, formulas=StandardBMIFormula(name="standard"))
+    calculator = make_bmi_calculator(guideline=guideline)
+    calculator.enable_cache()
+    
+    data = BMIInput(weight=70, height=1.75)
+    assert calculator.calculate(data).category == "Low"
+    rule.thresholds = {"Low": (0, 20), "High": (20, float("inf"))}
+    assert calculator.calculate(data).category == "High"
+    rule.default_category = "Outside"
+    assert calculator.calculate(BMIInput(weight=-70, height=1.75)).category == "Outside"
+    assert calculator.cache_stats.invalidations == 2
+    
+    # Rules removed from the guideline no longer invalidate it; frozen guidelines reject changes.
+    version = guideline.version
+    del guideline.rules[0]
+    rule.thresholds = {"Any": (0, 100)}
+    assert guideline.version == version + 1
+    frozen = BaseGuideline(rules=rule).freeze()
+    with pytest.raises(TypeError):
+        rule.thresholds = {"Low": (0, 20)}
+    assert rule.thresholds == {"Any": (0, 100)} and frozen.rules.get("bmi") is rule
+
+def test_canonical_key():
+    assert canonical_key(1.0000000000001) == canonical_key(1.0)
+    assert canonical_key(1.0000000000001, precision=None) != canonical_key(1.0, precision=None)
+    assert canonical_key(BMIInput(weight=70, height=1.75)) != canonical_key(BMIInput(weight=70, height=1.76))
+    assert canonical_key({"b": [1.0, 2.0], "a": 0.0}) == canonical_key({"a": 0.0, "b": (1.0, 2.0)})
+    with pytest.raises(TypeError):
+        canonical_key(object.__new__(type("Unhashable", (), {"__hash__": None})))
@@ -0,0 +1,39 @@
+import pytest
+from pydantic import ValidationError
+
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput
+from mc4llm.example_calculators.bmi.bmi_with_units import BMI_CALCULATOR_WITH_UNITS, BMIInputWithUnits
+from tests.helpers.calculator import make_bmi_calculator
+
+def test_outputs_are_validated_unless_trusted():
+    calculator = make_bmi_calculator()
+    assert calculator.trust_outputs is False
+    output = calculator.build_output(bmi="22.9", category="Normal weight")
+    assert isinstance(output, BMIOutput) and output.bmi == 22.9
+    with pytest.raises(ValidationError):
+        calculator.build_output(bmi="heavy", category="Normal weight")
+
+    calculator.trust_outputs = True
+    # Trusted values are stored as given.
+    assert calculator.build_output(bmi="22.9", category="Normal weight").bmi == "22.9"
+    assert make_bmi_calculator().trust_outputs is False
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_trusted_and_validated_outputs_match(trusted):
+    calculator = make_bmi_calculator()
+    calculator.trust_outputs = trusted
+    rows = [BMIInput(weight=weight, height=1.75) for weight in (50, 70, 85, 120)]
+
+    single = [calculator.calculate(row) for row in rows]
+    batch = calculator.calculate_batch(rows)
+    assert [type(output) for output in batch] == [BMIOutput] * 4
+    assert batch == single
+    assert [output.category for output in single] == ["Underweight", "Normal weight", "Overweight", "Obese"]
+    assert single[1].model_fields_set == {"bmi", "category"}
+    assert single[1].model_dump_json() == BMIOutput(bmi=70 / 1.75 ** 2, category="Normal weight").model_dump_json()
+
+def test_unit_calculator_builds_outputs():
+    data = BMIInputWithUnits(weight=(150, "pound"), height=(170, "centimeter"))
+    output = BMI_CALCULATOR_WITH_UNITS.calculate(data)
+    assert output == BMI_CALCULATOR_WITH_UNITS.output_model(bmi=output.bmi, category=output.category)
+    assert BMI_CALCULATOR_WITH_UNITS.calculate_batch([data]) == [output]
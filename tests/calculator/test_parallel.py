@@ -0,0 +1,65 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from mc4llm.calculator import load_calculator
+from mc4llm.calculator.parallel import parallel_calculate_columns
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput, SIMPLE_WHO_BMI_CALCULATOR
+from mc4llm.models import CategoricalArray, ColumnarBatch
+
+CALCULATOR_PATH = "mc4llm.example_calculators.bmi.simple_bmi:SIMPLE_WHO_BMI_CALCULATOR"
+
+def make_batch(rows: int) -> ColumnarBatch:
+    rng = np.random.default_rng(0)
+    return BMIInput.columnar(weight=rng.uniform(30, 150, rows), height=rng.uniform(1.4, 2.1, rows))
+
+def test_load_calculator():
+    assert load_calculator(CALCULATOR_PATH) is SIMPLE_WHO_BMI_CALCULATOR
+    assert load_calculator(CALCULATOR_PATH.replace(":", ".")) is SIMPLE_WHO_BMI_CALCULATOR
+    assert load_calculator(SIMPLE_WHO_BMI_CALCULATOR) is SIMPLE_WHO_BMI_CALCULATOR
+    assert load_calculator("simple_who_bmi") is SIMPLE_WHO_BMI_CALCULATOR
+    with pytest.raises(ValueError):
+        load_calculator("not_a_calculator")
+    with pytest.raises(ValueError):
+        load_calculator("mc4llm.example_calculators.bmi.simple_bmi:MISSING")
+    with pytest.raises(TypeError):
+        load_calculator("mc4llm.example_calculators.bmi.simple_bmi:BMIInput")
+
+def test_calculator_pickles_without_cache():
+    calculator = load_calculator(CALCULATOR_PATH)
+    calculator.enable_cache()
+    try:
+        restored = pickle.loads(pickle.dumps(calculator))
+    finally:
+        calculator.disable_cache()
+    assert restored.cache is None
+    data = BMIInput(weight=70, height=1.75)
+    assert restored.calculate(data) == calculator.calculate(data)
+
+@pytest.mark.parametrize("reference", [SIMPLE_WHO_BMI_CALCULATOR, CALCULATOR_PATH, "simple_who_bmi"])
+def test_parallel_matches_serial(reference):
+    batch = make_batch(1000)
+    expected = SIMPLE_WHO_BMI_CALCULATOR.calculate_columns(batch)
+    result = parallel_calculate_columns(reference, batch, workers=2, chunk_size=128)
+    assert result.model is BMIOutput
+    assert np.array_equal(result["bmi"], expected["bmi"])
+    assert isinstance(result["category"], CategoricalArray)
+    assert result["category"].tolist() == expected["category"].tolist()
+
+def test_parallel_accepts_rows_and_empty_input():
+    rows = [BMIInput(weight=weight, height=1.75) for weight in (50, 70, 90, 120)]
+    result = SIMPLE_WHO_BMI_CALCULATOR.calculate_parallel(rows, workers=1, chunk_size=1)
+    assert result.to_rows() == SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(rows)
+    assert len(SIMPLE_WHO_BMI_CALCULATOR.calculate_parallel([], workers=1)) == 0
+
+def test_parallel_validates_arguments():
+    with pytest.raises(ValueError):
+        parallel_calculate_columns(SIMPLE_WHO_BMI_CALCULATOR, make_batch(4), workers=0)
+    with pytest.raises(ValueError):
+        parallel_calculate_columns(SIMPLE_WHO_BMI_CALCULATOR, make_batch(4), chunk_size=0)
+
+def test_parallel_resolves_registry_ids_in_fresh_workers():
+    batch = make_batch(64)
+    result = parallel_calculate_columns("simple_who_bmi", batch, workers=1, start_method="spawn")
+    assert result.to_rows() == SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(batch)
@@ -0,0 +1,89 @@
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from mc4llm.calculator import RowError
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput, BMICalculator
+from tests.helpers.calculator import make_bmi_calculator
+
+class FlakyBMICalculator(BMICalculator):
+    """Fails whole batches, and single rows with a height of exactly 1."""
+    
+    def calculate_batch(self, data):
+        raise RuntimeError("batch path unavailable")
+    
+    def calculate(self, data):
+        if data.height == 1:
+            raise ZeroDivisionError("bad row")
+        return super().calculate(data)
+
+def generate_rows(count: int):
+    for i in range(count):
+        yield {"weight": 50 + i % 50, "height": 1.75}
+
+def test_stream_matches_batch_for_mixed_inputs():
+    calculator = make_bmi_calculator()
+    rows = [
+        BMIInput(weight=50, height=1.75),
+        {"weight": 70, "height": 1.75},
+        json.dumps({"weight": 85, "height": 1.75}),
+        b'{"weight": 120, "height": 1.75}',
+    ]
+    outputs = list(calculator.calculate_stream(rows, batch_size=3))
+    assert [output.category for output in outputs] == ["Underweight", "Normal weight", "Overweight", "Obese"]
+    assert outputs == calculator.calculate_batch([BMIInput(weight=w, height=1.75) for w in (50, 70, 85, 120)])
+
+def test_stream_is_lazy_and_bounded():
+    calculator = make_bmi_calculator()
+    consumed = []
+    
+    def source():
+        for row in generate_rows(10_000):
+            consumed.append(row)
+            yield row
+    
+    stream = calculator.calculate_stream(source(), batch_size=100)
+    first = next(stream)
+    assert isinstance(first, BMIOutput)
+    assert len(consumed) == 100
+    assert sum(1 for _ in stream) == 9_999
+
+def test_invalid_rows_go_to_the_error_stream():
+    calculator = make_bmi_calculator()
+    rows = [{"weight": 70, "height": 1.75}, {"weight": "heavy"}, "{not json", {"weight": 85, "height": 1.75}]
+    errors = []
+    results = list(calculator.calculate_stream(rows, batch_size=2, on_error=errors.append, with_index=True))
+    
+    assert [index for index, _ in results] == [0, 3]
+    assert [(error.index, error.stage) for error in errors] == [(1, "validation"), (2, "validation")]
+    assert errors[1].data == "{not json" and isinstance(errors[1].error, ValidationError)
+    
+    with pytest.raises(ValidationError):
+        list(calculator.calculate_stream(rows))
+
+def test_failed_batches_are_retried_per_row():
+    calculator = make_bmi_calculator(FlakyBMICalculator)
+    rows = [{"weight": 70, "height": 1.75}, {"weight": 70, "height": 1}, {"weight": 85, "height": 1.75}]
+    errors = []
+    results = list(calculator.calculate_stream(rows, on_error=errors.append))
+    assert [output.category for output in results] == ["Normal weight", "Overweight"]
+    assert errors == [RowError(1, rows[1], errors[0].error, "calculation")]
+    assert isinstance(errors[0].error, ZeroDivisionError)
+    
+    with pytest.raises(ValueError):
+        next(calculator.calculate_stream(rows, batch_size=0))
+
+def test_stream_yields_result_batches():
+    calculator = make_bmi_calculator()
+    rows = list(generate_rows(250))
+    rows[120] = {"weight": "heavy", "height": 1.75}
+    errors = []
+    stream = calculator.calculate_stream(rows, batch_size=100, on_error=errors.append, with_index=True, batches=True)
+    pairs = list(stream)
+    
+    assert [len(batch) for _, batch in pairs] == [100, 99, 50]
+    assert [error.index for error in errors] == [120]
+    assert 120 not in pairs[1][0] and pairs[1][0][20] == 121
+    expected = calculator.calculate_batch([BMIInput(**row) for i, row in enumerate(rows) if i != 120])
+    assert [output for _, batch in pairs for output in batch] == expected
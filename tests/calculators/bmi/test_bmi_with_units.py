@@ -43,3 +43,21 @@ def test_bmi_calculator_with_quantity():
     assert result.bmi == pytest.approx(34.60, rel=1e-2)
     assert result.category == "Obese"
 
+def test_bmi_calculator_batch_matches_scalar():
+    """Test that the vectorized batch path gives the same results as calculate."""
+    inputs = [
+        BMIInputWithUnits(weight=(154, "pound"), height=(5.74, "feet")),
+        BMIInputWithUnits(weight=(70000, "gram"), height=(175, "centimeter")),
+        BMIInputWithUnits(weight=(198, "pound"), height=(180, "centimeter")),
+        BMIInputWithUnits(weight=ureg.Quantity(220, "pound"), height=ureg.Quantity(67, "inch")),
+    ]
+    results = BMI_CALCULATOR_WITH_UNITS.calculate_batch(inputs)
+    assert results == [BMI_CALCULATOR_WITH_UNITS.calculate(data=row) for row in inputs]
+    assert [r.category for r in results] == ["Normal weight", "Normal weight", "Overweight", "Obese"]
+
+def test_bmi_calculator_batch_zero_height_matches_scalar():
+    row = BMIInputWithUnits(weight=(70, "kilogram"), height=(0, "meter"))
+    with pytest.raises(ZeroDivisionError):
+        BMI_CALCULATOR_WITH_UNITS.calculate(row)
+    with pytest.raises(ZeroDivisionError):
+        BMI_CALCULATOR_WITH_UNITS.calculate_batch([row])
@@ -44,3 +44,21 @@ def test_bmi_calculator_boundary_cases():
     assert result.bmi == pytest.approx(29.97, rel=1e-2)
     assert result.category == "Overweight"
 
+
+def test_bmi_calculator_batch_matches_scalar():
+    inputs = [
+        BMIInput(weight=weight, height=height)
+        for weight, height in [(70, 1.75), (45, 1.70), (85, 1.75), (100, 1.70), (56.6, 1.75), (76.5, 1.75), (91.8, 1.75)]
+    ]
+    results = SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(inputs)
+    assert results == [SIMPLE_WHO_BMI_CALCULATOR.calculate(row) for row in inputs]
+    assert SIMPLE_WHO_BMI_CALCULATOR.calculate_batch([]) == []
+
+def test_bmi_calculator_batch_zero_height_matches_scalar():
+    rows = [BMIInput(weight=70, height=1.75), BMIInput(weight=70, height=0)]
+    with pytest.raises(ZeroDivisionError):
+        SIMPLE_WHO_BMI_CALCULATOR.calculate(rows[1])
+    with pytest.raises(ZeroDivisionError):
+        SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(rows)
+    with pytest.raises(ZeroDivisionError):
+        SIMPLE_WHO_BMI_CALCULATOR.calculate_results([BMIInput(weight=0, height=0)])
@@ -178,4 +178,119 @@ def test_collection_sequence_interface():
     # Test deleting a formula
     del guideline.formulas[0]
     assert len(guideline.formulas) == 1
-    assert guideline.formulas[0].name == "another"
\ No newline at end of file
+    assert guideline.formulas[0].name == "another"
+
+def test_collection_name_index():
+    guideline = BaseGuideline(description="Test name index")
+    formulas = guideline.formulas
+    formulas.add([HelperFormula(name=f"f{i}") for i in range(5)])
+    
+    def assert_consistent():
+        for i, formula in enumerate(formulas):
+            assert formulas.get(formula.name) is formula
+            assert guideline.get_formula(formula.name) is formula
+            assert formulas[i] is formula
+    
+    # Insert in the middle shifts later positions
+    formulas.insert(0, HelperFormula(name="first"))
+    assert formulas.names() == ["first", "f0", "f1", "f2", "f3", "f4"]
+    assert_consistent()
+    
+    # Negative index replacement
+    formulas[-1] = HelperFormula(name="last")
+    assert formulas.names()[-1] == "last"
+    with pytest.raises(ValueError):
+        formulas.get("f4")
+    assert_consistent()
+    
+    # Replacing an item with one of the same name is allowed
+    formulas[1] = HelperFormula(name="f0")
+    assert_consistent()
+    
+    # Slice assignment and deletion
+    formulas[1:3] = [HelperFormula(name="a"), HelperFormula(name="b"), HelperFormula(name="c")]
+    assert formulas.names() == ["first", "a", "b", "c", "f2", "f3", "last"]
+    assert_consistent()
+    del formulas[::2]
+    assert formulas.names() == ["a", "c", "f3"]
+    assert_consistent()
+    with pytest.raises(ValueError):
+        formulas.get("first")
+    
+    # Rejected slice assignments leave the collection unchanged
+    with pytest.raises(ValueError):
+        formulas[0:1] = [HelperFormula(name="c")]
+    with pytest.raises(TypeError):
+        formulas[0:1] = ["not a formula"]  # type: ignore
+    assert formulas.names() == ["a", "c", "f3"]
+    assert_consistent()
+    
+    # Slicing reads return plain lists
+    assert [f.name for f in formulas[1:]] == ["c", "f3"]
+    
+    # Same behaviour for rules
+    guideline.rules.add([age_rule, height_rule])
+    guideline.rules.insert(0, RangeRule(thresholds={"Test": (0, 1)}, name="first_rule"))
+    assert guideline.get_rule("height") is height_rule
+    del guideline.rules[0]
+    assert guideline.get_rule("age") is age_rule
+    with pytest.raises(ValueError):
+        guideline.get_rule("first_rule")
+    with pytest.raises(TypeError):
+        guideline.get_rule(1)  # type: ignore
+
+def test_renaming_updates_the_name_index():
+    guideline = BaseGuideline(description="Test renaming")
+    formula, other = HelperFormula(name="old"), HelperFormula(name="other")
+    guideline.formulas.add([formula, other])
+    version = guideline.version
+    formula.name = "new"
+    assert guideline.get_formula("new") is formula
+    with pytest.raises(ValueError):
+        guideline.get_formula("old")
+    assert guideline.version > version
+    
+    # Renamed names are free again, and taken ones are rejected
+    guideline.formulas.add(HelperFormula(name="old"))
+    with pytest.raises(ValueError):
+        guideline.formulas.add(HelperFormula(name="new"))
+    with pytest.raises(ValueError):
+        other.name = "new"
+    assert other.name == "other" and guideline.get_formula("other") is other
+    
+    rule = RangeRule(thresholds={"Test": (0, 1)}, name="before")
+    guideline.rules.add(rule)
+    rule.name = "after"
+    assert guideline.get_rule("after") is rule
+    
+    # Removed items no longer hold on to the collection's names
+    del guideline.formulas[0]
+    other.name = "new"
+    assert guideline.get_formula("new") is other and formula.name == "new"
+    
+    guideline.freeze()
+    with pytest.raises(TypeError):
+        rule.name = "frozen"
+
+def test_collections_track_items_without_base_init():
+    class NamedFormula(HelperFormula):
+        def __init__(self, name):
+            self.name = name
+    
+    class NamedRule(RangeRule):
+        def __init__(self, name):
+            self.name = name
+    
+    guideline = BaseGuideline(description="Test owner tracking")
+    formula, rule = NamedFormula("a"), NamedRule("r")
+    guideline.formulas.add(formula)
+    guideline.rules.add(rule)
+    assert guideline.get_formula("a") is formula and guideline.get_rule("r") is rule
+    
+    version = guideline.version
+    formula._modify()
+    rule._modify()
+    assert guideline.version == version + 2
+    guideline.freeze()
+    with pytest.raises(TypeError):
+        formula._modify()
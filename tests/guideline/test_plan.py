@@ -0,0 +1,113 @@
+import pytest
+from pydantic import BaseModel
+
+from mc4llm.formula.base import BaseFormula
+from mc4llm.guideline import BaseGuideline, GuidelinePlan
+from mc4llm.rule import RangeRule
+from mc4llm.calculator import Calculator
+from tests.helpers.formula import HelperFormula, SimpleAdditionFormula
+
+class ValueInput(BaseModel):
+    value: float
+
+class PairInput(BaseModel):
+    a: float
+    b: float
+    note: str = ""
+
+class ScaledFormula(BaseFormula):
+    def calculate(self, value: float, scale: float = 10.0, *, offset: float = 0.0) -> float:
+        return value * scale + offset
+
+level_rule = RangeRule(thresholds={"Low": (0, 10), "High": (10, 100)}, name="level")
+
+def make_guideline() -> BaseGuideline:
+    return BaseGuideline(rules=level_rule, formulas=[HelperFormula(name="double"), SimpleAdditionFormula(name="add")])
+
+def test_plan_binds_fields_by_signature():
+    guideline = make_guideline()
+    
+    plan = guideline.compile(ValueInput, formula="double", rule="level")
+    assert plan.positional_fields == ("value",)
+    assert plan.keyword_fields == ()
+    assert plan(ValueInput(value=3)) == (6, "Low")
+    assert plan(ValueInput(value=7)) == (14, "High")
+    assert plan.evaluate(ValueInput(value=1)) == 2
+    
+    # **kwargs formulas receive every input field by keyword
+    plan = guideline.compile(PairInput, formula="add")
+    assert plan.keyword_fields == ("a", "b", "note")
+    assert plan(PairInput(a=1, b=2)) == (3, None)
+    
+    # Skipped defaults and keyword-only parameters are bound by keyword
+    class OffsetInput(BaseModel):
+        value: float
+        offset: float
+    
+    guideline.formulas.add(ScaledFormula(name="scaled"))
+    plan = guideline.compile(OffsetInput, formula="scaled")
+    assert plan.positional_fields == ("value",)
+    assert plan.keyword_fields == ("offset",)
+    assert plan.evaluate(OffsetInput(value=2, offset=1)) == 21
+
+def test_plan_compile_errors():
+    guideline = make_guideline()
+    with pytest.raises(ValueError):
+        guideline.compile(ValueInput, formula="missing")
+    with pytest.raises(ValueError):
+        guideline.compile(ValueInput, formula="double", rule="missing")
+    with pytest.raises(ValueError):
+        guideline.compile(PairInput, formula="double")  # No 'value' field
+
+def test_plan_is_immutable_and_invalidated():
+    guideline = make_guideline()
+    plan = guideline.compile(ValueInput, formula="double", rule="level")
+    
+    with pytest.raises(AttributeError):
+        plan.formula = HelperFormula(name="other")  # type: ignore
+    
+    assert plan.is_current
+    guideline.formulas.add(HelperFormula(name="other"))
+    assert not plan.is_current
+    
+    plan = guideline.compile(ValueInput, formula="double", rule="level")
+    del guideline.rules[0]
+    assert not plan.is_current
+
+def test_frozen_guideline_rejects_changes():
+    guideline = make_guideline().freeze()
+    assert guideline.frozen
+    version = guideline.version
+    
+    with pytest.raises(TypeError):
+        guideline.formulas.add(HelperFormula(name="other"))
+    with pytest.raises(TypeError):
+        guideline.rules[0] = RangeRule(thresholds={"A": (0, 1)}, name="other")
+    with pytest.raises(TypeError):
+        del guideline.formulas[0]
+    assert guideline.version == version
+    assert guideline.get_available_formulas() == ["double", "add"]
+
+def test_calculator_recompiles_plan():
+    class DoubleCalculator(Calculator[ValueInput, ValueInput]):
+        formula_name = "double"
+        rule_name = "level"
+        
+        def calculate(self, data: ValueInput) -> ValueInput:
+            value, _ = self.plan(data)
+            return ValueInput(value=value)
+    
+    guideline = make_guideline()
+    calculator = DoubleCalculator(input_model=ValueInput, output_model=ValueInput, guideline=guideline)
+    plan = calculator.plan
+    assert isinstance(plan, GuidelinePlan)
+    assert calculator.plan is plan  # Cached while the guideline is unchanged
+    assert calculator.calculate(ValueInput(value=2)).value == 4
+    
+    class TripleFormula(BaseFormula):
+        def calculate(self, value: float) -> float:
+            return value * 3
+    
+    guideline.formulas[0] = TripleFormula(name="double")
+    assert calculator.plan is not plan
+    assert calculator.calculate(ValueInput(value=2)).value == 6
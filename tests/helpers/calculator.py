@@ -0,0 +1,9 @@
+"""Calculator test helper builders."""
+from typing import Type
+
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput, BMICalculator, WHO_BMI_GUIDELINE
+from mc4llm.guideline import BaseGuideline
+
+def make_bmi_calculator(cls: Type[BMICalculator] = BMICalculator, guideline: BaseGuideline = WHO_BMI_GUIDELINE) -> BMICalculator:
+    """Build a separate simple BMI calculator, so a test can change its settings without touching the shared one."""
+    return cls(input_model=BMIInput, output_model=BMIOutput, guideline=guideline)
@@ -0,0 +1,215 @@
+import json
+
+import numpy as np
+import pytest
+from pydantic import Field
+
+from mc4llm.models import IOModel, CategoricalArray, ColumnarBatch, ResultBatch, column_schema
+from mc4llm.models.base import ureg
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, BMIOutput, SIMPLE_WHO_BMI_CALCULATOR
+from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits, BMI_CALCULATOR_WITH_UNITS
+
+class PatientInput(IOModel):
+    age: int = Field(..., ge=0, lt=150)
+    weight: float = Field(..., gt=0)
+    sex: str
+    smoker: bool
+
+def test_column_schema():
+    schema = column_schema(PatientInput)
+    assert list(schema) == ["age", "weight", "sex", "smoker"]
+    assert schema["age"].dtype == np.int64
+    assert (schema["age"].ge, schema["age"].lt) == (0, 150)
+    assert schema["weight"].gt == 0
+    assert schema["sex"].dtype.kind == "U"
+    assert schema["smoker"].dtype == np.bool_
+    
+    units_schema = column_schema(BMIInputWithUnits)
+    assert units_schema["weight"].unit == "kilogram"
+    assert units_schema["height"].unit == "meter"
+    
+    class Unsupported(IOModel):
+        values: list
+    
+    with pytest.raises(TypeError):
+        column_schema(Unsupported)
+
+def test_columnar_batch_validation():
+    batch = PatientInput.columnar(
+        age=[30, 45], weight=np.array([70.5, 80.0]), sex=["F", "M"], smoker=[False, True]
+    )
+    assert len(batch) == 2
+    assert batch["age"].dtype == np.int64
+    assert batch["sex"].tolist() == ["F", "M"]
+    
+    # Columns already of the right dtype are not copied
+    weight = np.array([70.5, 80.0])
+    batch = PatientInput.columnar(age=[30, 45], weight=weight, sex=["F", "M"], smoker=[False, True])
+    assert np.shares_memory(batch["weight"], weight)
+    
+    with pytest.raises(ValueError, match="Missing"):
+        PatientInput.columnar(age=[30], weight=[70.0], sex=["F"])
+    with pytest.raises(ValueError, match="Unknown"):
+        PatientInput.columnar(age=[30], weight=[70.0], sex=["F"], smoker=[True], height=[1.7])
+    with pytest.raises(ValueError, match="rows"):
+        PatientInput.columnar(age=[30, 40], weight=[70.0], sex=["F"], smoker=[True])
+    with pytest.raises(TypeError):
+        PatientInput.columnar(age=[30.5], weight=[70.0], sex=["F"], smoker=[True])
+    with pytest.raises(ValueError, match="index 1"):
+        PatientInput.columnar(age=[30, 200], weight=[70.0, 80.0], sex=["F", "M"], smoker=[True, False])
+    with pytest.raises(ValueError, match=">"):
+        PatientInput.columnar(age=[30], weight=[0.0], sex=["F"], smoker=[True])
+
+def test_columnar_batch_quantities():
+    batch = BMIInputWithUnits.columnar(
+        weight=ureg.Quantity(np.array([154.0, 70000.0 / 453.59237]), "pound"),
+        height=np.array([1.75, 1.75])
+    )
+    np.testing.assert_allclose(batch["weight"], [154 * 0.45359237, 70.0])
+    assert batch.quantity("weight").units == ureg.kilogram
+    
+    rows = batch.to_rows()
+    assert rows[1].weight.magnitude == pytest.approx(70.0)
+    assert rows[1].height.units == ureg.meter
+
+def test_columnar_batch_rows_and_slice():
+    inputs = [BMIInput(weight=w, height=h) for w, h in [(70, 1.75), (45, 1.70), (85, 1.75)]]
+    batch = ColumnarBatch.from_rows(BMIInput, inputs)
+    assert batch.to_rows() == inputs
+    
+    part = batch.slice(1, 3)
+    assert len(part) == 2
+    assert np.shares_memory(part["weight"], batch["weight"])
+    assert part.to_rows() == inputs[1:]
+
+def test_calculate_batch_accepts_columns():
+    weight = np.array([70, 45, 85, 100], dtype=float)
+    height = np.array([1.75, 1.70, 1.75, 1.70])
+    
+    rows = [BMIInput(weight=w, height=h) for w, h in zip(weight, height)]
+    expected = SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(rows)
+    assert SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(BMIInput.columnar(weight=weight, height=height)) == expected
+    
+    unit_results = BMI_CALCULATOR_WITH_UNITS.calculate_batch(
+        BMIInputWithUnits.columnar(weight=weight, height=height)
+    )
+    assert [r.category for r in unit_results] == [r.category for r in expected]
+    
+    with pytest.raises(TypeError):
+        SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(BMIInputWithUnits.columnar(weight=weight, height=height))
+
+def test_result_batch_from_calculator():
+    batch = BMIInput.columnar(weight=[50, 70, 85, 120], height=[1.75] * 4)
+    results = SIMPLE_WHO_BMI_CALCULATOR.calculate_results(batch)
+    assert isinstance(results, ResultBatch) and len(results) == 4
+    
+    arrays = results.to_numpy()
+    assert arrays["bmi"] is results["bmi"]
+    assert arrays["category"].dtype == np.int8
+    labels = results.labels("category")
+    assert [labels[code] for code in arrays["category"]] == ["Underweight", "Normal weight", "Overweight", "Obese"]
+    with pytest.raises(ValueError):
+        results.labels("bmi")
+    
+    row = results[1]
+    assert isinstance(row, BMIOutput) and type(row.bmi) is float
+    assert row == SIMPLE_WHO_BMI_CALCULATOR.calculate(BMIInput(weight=70, height=1.75))
+    assert results[-1].category == "Obese"
+    with pytest.raises(IndexError):
+        results[4]
+    assert list(results) == SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(batch)
+
+def test_result_batch_slices_share_memory():
+    results = ResultBatch(BMIOutput, {"bmi": np.array([17.0, 22.0, 27.0, 33.0]),
+                                      "category": ["Underweight", "Normal weight", "Overweight", "Obese"]})
+    assert isinstance(results["category"], CategoricalArray)
+    assert results.nbytes == 4 * 8 + 4
+    
+    tail = results[2:]
+    assert isinstance(tail, ResultBatch) and len(tail) == 2
+    assert np.shares_memory(tail["bmi"], results["bmi"])
+    assert [row.category for row in tail] == ["Overweight", "Obese"]
+    assert results.slice(0, 1)[0].bmi == 17.0
+    assert ResultBatch.from_batch(results) is results
+    
+    plain = ColumnarBatch.from_rows(BMIOutput, list(results))
+    assert plain["category"].dtype.kind == "U"
+    converted = ResultBatch.from_batch(plain)
+    assert converted["bmi"] is plain["bmi"] and converted.labels("category") == tuple(sorted(results.labels("category")))
+
+def test_result_batch_with_units():
+    results = ResultBatch(BMIInputWithUnits, {"weight": ([150, 70], ["pound", "kilogram"]), "height": [1.7, 1.8]})
+    assert results["weight"][1] == 70.0
+    assert results[0].weight.to("kilogram").magnitude == pytest.approx(150 * 0.45359237)
+    assert results[1].height.units == ureg.meter
+
+def is_mapped(array: np.ndarray) -> bool:
+    return isinstance(array, np.memmap) or isinstance(array.base, np.memmap)
+
+def test_saved_batches_are_memory_mapped(tmp_path):
+    batch = PatientInput.columnar(
+        age=np.array([30, 70]), weight=np.array([60.5, 82.0]), sex=np.array(["F", "M"]), smoker=np.array([False, True])
+    )
+    batch.save(tmp_path / "patients")
+    loaded = ColumnarBatch.load(tmp_path / "patients", PatientInput)
+    assert all(is_mapped(loaded[name]) for name in column_schema(PatientInput))
+    assert loaded.to_rows() == batch.to_rows()
+    
+    inputs = BMIInput.columnar(weight=np.array([50.0, 70.0, 120.0]), height=np.array([1.75, 1.75, 1.75]))
+    inputs.save(tmp_path / "cohort")
+    cohort = ColumnarBatch.load(tmp_path / "cohort", BMIInput)
+    assert cohort.model is BMIInput and not cohort["weight"].flags.writeable
+    
+    SIMPLE_WHO_BMI_CALCULATOR.calculate_results(cohort).save(tmp_path / "scores")
+    scores = ResultBatch.load(tmp_path / "scores", SIMPLE_WHO_BMI_CALCULATOR.output_model)
+    assert isinstance(scores, ResultBatch) and is_mapped(scores["category"].codes)
+    assert scores.to_rows() == SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(inputs)
+
+def test_loading_converts_units_and_checks_the_header(tmp_path):
+    batch = BMIInputWithUnits.columnar(weight=(np.array([150.0, 70.0]), "pound"), height=np.array([1.7, 1.8]))
+    batch.save(tmp_path)
+    header_path = tmp_path / "columns.json"
+    header = json.loads(header_path.read_text())
+    assert header["columns"]["weight"]["unit"] == "kilogram"
+    
+    np.save(tmp_path / "weight.npy", np.array([150.0, 70.0]))
+    header["columns"]["weight"]["unit"] = "pound"
+    header_path.write_text(json.dumps(header))
+    assert ColumnarBatch.load(tmp_path, BMIInputWithUnits)["weight"] == pytest.approx(batch["weight"])
+    
+    with pytest.raises(ValueError, match="do not match"):
+        ColumnarBatch.load(tmp_path, PatientInput)
+    header_path.unlink()
+    with pytest.raises(ValueError, match="Cannot read column header"):
+        ColumnarBatch.load(tmp_path, BMIInputWithUnits)
+
+@pytest.mark.parametrize("edit", [
+    lambda header: header.pop("rows"),
+    lambda header: header.update(rows="2"),
+    lambda header: header.update(columns=[]),
+    lambda header: header["columns"].update(weight="weight.npy"),
+    lambda header: header["columns"]["weight"].pop("file"),
+    lambda header: header["columns"]["weight"].update(file="../weight.npy"),
+    lambda header: header["columns"]["weight"].update(file="missing.npy"),
+    lambda header: header["columns"]["weight"].update(labels="abc"),
+])
+def test_loading_rejects_invalid_headers(tmp_path, edit):
+    BMIInput.columnar(weight=np.array([60.0, 70.0]), height=np.array([1.7, 1.8])).save(tmp_path)
+    header_path = tmp_path / "columns.json"
+    header = json.loads(header_path.read_text())
+    edit(header)
+    header_path.write_text(json.dumps(header))
+    with pytest.raises(ValueError):
+        ColumnarBatch.load(tmp_path, BMIInput)
+
+def test_saving_a_loaded_batch_into_its_own_directory(tmp_path):
+    inputs = BMIInput.columnar(weight=np.linspace(40, 150, 1000), height=np.full(1000, 1.75))
+    inputs.save(tmp_path)
+    ColumnarBatch.load(tmp_path, BMIInput).save(tmp_path)
+    loaded = ColumnarBatch.load(tmp_path, BMIInput)
+    assert loaded.to_rows() == inputs.to_rows()
+    
+    # A shorter batch replaces the mapped columns and the header together.
+    loaded.slice(0, 10).save(tmp_path)
+    assert ColumnarBatch.load(tmp_path, BMIInput).to_rows() == inputs.to_rows()[:10]
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["columns.json", "height.npy", "weight.npy"]
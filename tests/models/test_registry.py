@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import mc4llm.models.base as models_base
+from mc4llm.models.base import configure_registry, get_registry, snapshot_registry
+
+def _run(code: str, **env) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, **env}
+    )
+    return result.stdout.strip()
+
+def test_import_does_not_build_registry():
+    output = _run(
+        "import mc4llm, mc4llm.models.base as b; "
+        "from mc4llm.example_calculators.bmi import bmi_with_units; "
+        "print(b._registry is None)"
+    )
+    assert output == "True"
+
+def test_registry_is_shared():
+    assert models_base.ureg is get_registry()
+    with pytest.raises(RuntimeError):
+        configure_registry(cache_folder=None)
+
+def test_registry_cache_folder(tmp_path):
+    snapshot_registry(str(tmp_path))
+    assert any(tmp_path.iterdir())
+    
+    output = _run(
+        "from mc4llm.models.base import get_registry; "
+        "print(get_registry().Quantity(1, 'pound').to('gram').magnitude)",
+        MC4LLM_UNIT_CACHE=str(tmp_path)
+    )
+    assert float(output) == pytest.approx(453.59237)
@@ -0,0 +1,54 @@
+import json
+from typing import List, Optional
+
+import pytest
+from pydantic import Field
+
+from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits
+from mc4llm.models import IOModel, clear_schema_cache, strict_json_schema, strict_json_schema_bytes
+
+class Dose(IOModel):
+    amount: float = Field(..., description="Dose amount")
+
+class Prescription(IOModel):
+    drug: str
+    doses: List[Dose]
+    note: Optional[str] = Field(None, description="Free text")
+
+def test_quantity_fields_are_value_unit_objects():
+    schema = strict_json_schema(BMIInputWithUnits)
+    assert schema["required"] == ["weight", "height"]
+    assert schema["additionalProperties"] is False
+    weight = schema["properties"]["weight"]
+    assert weight["type"] == "object" and weight["additionalProperties"] is False
+    assert weight["required"] == ["value", "unit"]
+    assert weight["properties"]["value"] == {"type": "number"}
+    assert "kilogram" in weight["properties"]["unit"]["description"]
+
+def test_nested_and_optional_fields():
+    schema = strict_json_schema(Prescription)
+    assert schema["required"] == ["drug", "doses", "note"]
+    note = schema["properties"]["note"]
+    assert note["description"] == "Free text"
+    assert {"type": "null"} in note["anyOf"] and "default" not in json.dumps(schema)
+    dose = schema["$defs"]["Dose"]
+    assert dose["additionalProperties"] is False and dose["required"] == ["amount"]
+
+def test_schema_bytes_are_cached_until_rebuild():
+    clear_schema_cache()
+    first = strict_json_schema_bytes(Prescription)
+    assert strict_json_schema_bytes(Prescription) is first
+    assert json.loads(first) == strict_json_schema(Prescription)
+    
+    strict_json_schema(Prescription)["title"] = "changed"
+    assert json.loads(strict_json_schema_bytes(Prescription))["title"] == "Prescription"
+    
+    Prescription.model_rebuild(force=True)
+    assert strict_json_schema_bytes(Prescription) is not first
+    assert strict_json_schema_bytes(Prescription) == first
+
+def test_rejects_non_models():
+    with pytest.raises(TypeError):
+        strict_json_schema_bytes(dict)
+    with pytest.raises(TypeError):
+        strict_json_schema_bytes(Dose(amount=1))
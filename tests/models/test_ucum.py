@@ -0,0 +1,96 @@
+import math
+
+import numpy as np
+import pytest
+from pint.errors import DimensionalityError
+
+from mc4llm.models import conversion_plan, convert_unit_array, parse_ucum, ucum_cache_info
+from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits
+
+LENGTH, MASS, TIME = "[length]", "[mass]", "[time]"
+
+# (expression, scale to SI base units, dimensions)
+CONFORMANCE = [
+    ("m", 1, {LENGTH: 1}),
+    ("kg", 1, {MASS: 1}),
+    ("mg", 1e-6, {MASS: 1}),
+    ("ug", 1e-9, {MASS: 1}),
+    ("kg/m2", 1, {LENGTH: -2, MASS: 1}),
+    ("kg.m-2", 1, {LENGTH: -2, MASS: 1}),
+    ("[lb_av]", 0.45359237, {MASS: 1}),
+    ("[oz_av]", 0.45359237 / 16, {MASS: 1}),
+    ("[in_i]", 0.0254, {LENGTH: 1}),
+    ("[ft_i]", 0.3048, {LENGTH: 1}),
+    ("[gal_us]", 0.003785411784, {LENGTH: 3}),
+    ("mg/dL", 0.01, {LENGTH: -3, MASS: 1}),
+    ("g/L", 1, {LENGTH: -3, MASS: 1}),
+    ("mmol/L", 1, {LENGTH: -3, "[substance]": 1}),
+    ("meq/L", 1, {LENGTH: -3, "[substance]": 1}),
+    ("10*9/L", 1e12, {LENGTH: -3}),
+    ("10*3/uL", 1e12, {LENGTH: -3}),
+    ("{cells}/uL", 1e9, {LENGTH: -3}),
+    ("%", 0.01, {}),
+    ("mg{creat}/g", 1e-3, {}),
+    ("/min", 1 / 60, {TIME: -1}),
+    ("{beats}/min", 1 / 60, {TIME: -1}),
+    ("h", 3600, {TIME: 1}),
+    ("a", 365.25 * 86400, {TIME: 1}),
+    ("mo", 365.25 * 86400 / 12, {TIME: 1}),
+    ("mm[Hg]", 133.322, {LENGTH: -1, MASS: 1, TIME: -2}),
+    ("cm[H2O]", 98.0665, {LENGTH: -1, MASS: 1, TIME: -2}),
+    ("kPa", 1000, {LENGTH: -1, MASS: 1, TIME: -2}),
+    ("(kg.m)/s2", 1, {LENGTH: 1, MASS: 1, TIME: -2}),
+    ("U/L", 1e-6 / 60 / 1e-3, {LENGTH: -3, "[substance]": 1, TIME: -1}),
+    ("mL/min/{1.73_m2}", 1e-6 / 60, {LENGTH: 3, TIME: -1}),
+    ("[IU]/L", 1e3, {LENGTH: -3, "[iU]": 1}),
+    ("m[IU]/mL", 1e3, {LENGTH: -3, "[iU]": 1}),
+    ("10*-3", 1e-3, {}),
+    ("deg", math.pi / 180, {}),
+    ("kcal", 4184, {LENGTH: 2, MASS: 1, TIME: -2}),
+]
+
+@pytest.mark.parametrize("expression,scale,dimensions", CONFORMANCE)
+def test_conformance(expression, scale, dimensions):
+    unit = parse_ucum(expression)
+    assert unit.scale == pytest.approx(scale, rel=1e-12)
+    assert dict(unit.dimensions) == dimensions
+    assert unit.offset == 0
+
+def test_special_units():
+    assert parse_ucum("Cel").offset == pytest.approx(273.15)
+    fahrenheit = parse_ucum("[degF]")
+    assert 98.6 * fahrenheit.scale + fahrenheit.offset == pytest.approx(310.15)
+
+@pytest.mark.parametrize("expression", [
+    "", "kg/", "/", "m[", "{x", "foo", "(m", "m)", "kg//m", "k g", "Cel2", "Cel/s", "mCel", "m.", "xg",
+])
+def test_invalid_expressions(expression):
+    with pytest.raises(ValueError):
+        parse_ucum(expression)
+
+def test_compiled_expressions_are_cached():
+    parse_ucum("mg/dL")
+    hits = ucum_cache_info().hits
+    assert parse_ucum("mg/dL") is parse_ucum("mg/dL")
+    assert ucum_cache_info().hits == hits + 2
+
+def test_conversion_plan_falls_back_to_ucum():
+    assert conversion_plan("[lb_av]", "kilogram").factor == pytest.approx(0.45359237)
+    assert conversion_plan("mg/dL", "g/L").factor == pytest.approx(0.01)
+    assert conversion_plan("Cel", "degF").apply(37) == pytest.approx(98.6)
+    assert conversion_plan("[degF]", "degC").apply(98.6) == pytest.approx(37)
+    # pint reads "h" as the Planck constant; as a duration it is UCUM's hour.
+    assert conversion_plan("h", "minute").factor == pytest.approx(60)
+    
+    with pytest.raises(DimensionalityError):
+        conversion_plan("[lb_av]", "meter")
+    with pytest.raises(ValueError):
+        conversion_plan("[IU]/L", "1/liter")
+
+def test_convert_unit_accepts_ucum():
+    data = BMIInputWithUnits(weight={"value": 154, "unit": "[lb_av]"}, height=(69, "[in_i]"))
+    assert data.weight.magnitude == pytest.approx(154 * 0.45359237)
+    assert data.height.magnitude == pytest.approx(69 * 0.0254)
+    
+    converted = convert_unit_array([1, 16, 1], ["[lb_av]", "[oz_av]", "kg"], "kilogram")
+    assert np.allclose(converted, [0.45359237, 0.45359237, 1])
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from pint import Quantity
+from pint.errors import DimensionalityError, UndefinedUnitError
+
+from mc4llm.models import IOModel, convert_unit, convert_unit_array, conversion_plan, conversion_cache_info, clear_conversion_cache
+from mc4llm.models.base import ureg
+from mc4llm.example_calculators.bmi.bmi_with_units import BMIInputWithUnits
+
+class TemperatureInput(IOModel):
+    temperature: Quantity
+
+    @convert_unit("degF")
+    def temperature(cls, v):
+        return v
+
+def test_conversion_plan_factors():
+    plan = conversion_plan("pound", "kilogram")
+    assert plan.offset == 0
+    assert plan.factor == pytest.approx(0.45359237)
+    assert plan.units == ureg.kilogram
+    
+    # Offset units
+    plan = conversion_plan("degC", "degF")
+    assert plan.apply(0) == pytest.approx(32)
+    assert plan.apply(100) == pytest.approx(212)
+    assert plan.apply(-40) == pytest.approx(-40)
+
+def test_conversion_plan_matches_pint():
+    for value, unit, target in [(154, "pound", "kilogram"), (5.74, "feet", "meter"),
+                                (175, "centimeter", "meter"), (37.5, "degC", "kelvin")]:
+        expected = ureg.Quantity(value, unit).to(target).magnitude
+        assert conversion_plan(unit, target).apply(value) == pytest.approx(expected, rel=1e-12)
+
+def test_conversion_cache_counters():
+    clear_conversion_cache()
+    for weight in (150, 160, 170):
+        BMIInputWithUnits(weight=(weight, "pound"), height={"value": 67, "unit": "inch"})
+    BMIInputWithUnits(weight=ureg.Quantity(70, "kilogram"), height=(170, "centimeter"))
+    
+    info = conversion_cache_info()
+    assert info.misses == 4  # pound, inch, kilogram, centimeter
+    assert info.hits == 4
+    assert info.currsize == 4
+
+def test_convert_unit_offset_fields():
+    result = TemperatureInput(temperature=(37, "degC"))
+    assert result.temperature.magnitude == pytest.approx(98.6)
+    assert result.temperature.units == ureg.degF
+
+def test_convert_unit_invalid_unit():
+    with pytest.raises(UndefinedUnitError):
+        BMIInputWithUnits(weight=(150, "not_a_unit"), height=(170, "centimeter"))
+    with pytest.raises(DimensionalityError):
+        BMIInputWithUnits(weight=(150, "meter"), height=(170, "centimeter"))
+    with pytest.raises(UndefinedUnitError):
+        conversion_plan("not_a_unit", "kilogram")
+    with pytest.raises(DimensionalityError):
+        conversion_plan("meter", "kilogram")
+
+def test_convert_unit_array():
+    values = np.array([154.0, 70.0, 220.0, 80.0])
+    units = np.array(["pound", "kilogram", "pound", "kilogram"])
+    converted = convert_unit_array(values, units, "kilogram")
+    expected = [ureg.Quantity(v, u).to("kilogram").magnitude for v, u in zip(values, units)]
+    np.testing.assert_allclose(converted, expected, rtol=1e-12)
+    
+    # One unit for the whole column
+    np.testing.assert_allclose(convert_unit_array([0, 100], "degC", "degF"), [32, 212])
+    
+    with pytest.raises(ValueError):
+        convert_unit_array(values, ["pound", "kilogram"], "kilogram")
+
+def test_columnar_unit_columns():
+    weights = np.array([154.0, 70000.0, 70.0])
+    weight_units = ["pound", "gram", "kilogram"]
+    heights = np.array([5.74, 175.0, 1.75])
+    height_units = np.array(["feet", "centimeter", "meter"])
+    
+    batch = BMIInputWithUnits.columnar(
+        weight=(weights, weight_units),
+        height={"value": heights, "unit": height_units}
+    )
+    rows = [
+        BMIInputWithUnits(weight=(w, wu), height=(h, hu))
+        for w, wu, h, hu in zip(weights, weight_units, heights, height_units)
+    ]
+    np.testing.assert_allclose(batch["weight"], [row.weight.magnitude for row in rows], rtol=1e-12)
+    np.testing.assert_allclose(batch["height"], [row.height.magnitude for row in rows], rtol=1e-12)
@@ -0,0 +1,105 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from mc4llm.example_calculators.bmi.simple_bmi import SIMPLE_WHO_BMI_CALCULATOR
+from mc4llm.registry import CalculatorRegistry, CalculatorSpec, default_registry, get_calculator, list_calculators
+
+TARGET = "mc4llm.example_calculators.bmi.simple_bmi:SIMPLE_WHO_BMI_CALCULATOR"
+
+def test_register_and_versions():
+    registry = CalculatorRegistry()
+    for version in ("1.9", "1.10", "1.2"):
+        registry.register(CalculatorSpec(id="bmi", version=version, target=TARGET))
+    assert "bmi" in registry and len(registry) == 1
+    assert registry.versions("bmi") == ["1.2", "1.9", "1.10"]
+    assert registry.spec("bmi").version == "1.10"
+    assert registry.spec("bmi", "1.2").version == "1.2"
+    
+    with pytest.raises(ValueError):
+        registry.register(CalculatorSpec(id="bmi", version="1.9", target=TARGET))
+    registry.register(CalculatorSpec(id="bmi", version="1.9", target=TARGET, title="BMI"), replace=True)
+    assert registry.spec("bmi", "1.9").title == "BMI"
+    
+    with pytest.raises(ValueError):
+        registry.spec("bmi", "2.0")
+    with pytest.raises(ValueError):
+        registry.get("missing")
+    with pytest.raises(ValueError):
+        CalculatorSpec(id="", version="1", target=TARGET)
+
+def test_get_imports_once():
+    registry = CalculatorRegistry()
+    registry.register(CalculatorSpec(id="bmi", version="1", target=TARGET))
+    assert not registry.is_loaded("bmi")
+    assert registry.get("bmi") is SIMPLE_WHO_BMI_CALCULATOR
+    assert registry.is_loaded("bmi")
+    assert registry.get("bmi", "1") is SIMPLE_WHO_BMI_CALCULATOR
+
+def test_load_manifest(tmp_path):
+    manifest = {"calculators": [{"id": "bmi", "version": "2", "target": TARGET, "tags": ["bmi"]}]}
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest))
+    registry = CalculatorRegistry()
+    specs = registry.load_manifest(path)
+    assert specs[0].tags == ("bmi",)
+    assert specs[0].to_dict()["tags"] == ["bmi"]
+    assert registry.specs() == specs
+    
+    with pytest.raises(ValueError):
+        CalculatorRegistry().load_manifest({"calculators": [{"id": "bmi", "version": "2", "target": TARGET, "foo": 1}]})
+    with pytest.raises(ValueError):
+        CalculatorRegistry().load_manifest({"calculators": [{"id": "bmi"}]})
+    with pytest.raises(ValueError):
+        CalculatorRegistry().load_manifest({"calculators": {}})
+
+def test_default_registry():
+    assert default_registry() is default_registry()
+    ids = [spec.id for spec in list_calculators()]
+    assert "simple_who_bmi" in ids and "who_bmi_with_units" in ids
+    assert get_calculator("simple_who_bmi") is SIMPLE_WHO_BMI_CALCULATOR
+
+def test_tool_definitions_are_cached():
+    registry = CalculatorRegistry()
+    registry.register(CalculatorSpec(id="bmi", version="1", target=TARGET, description="Body mass index"))
+    tool = registry.tool_definition_bytes("bmi")
+    assert registry.tool_definition_bytes("bmi", "1") is tool
+    definition = json.loads(tool)
+    assert definition["type"] == "function"
+    assert definition["function"]["name"] == "bmi"
+    assert definition["function"]["description"] == "Body mass index"
+    assert definition["function"]["strict"] is True
+    assert definition["function"]["parameters"]["additionalProperties"] is False
+    assert json.loads(registry.tools_bytes()) == [definition]
+    
+    registry.register(CalculatorSpec(id="bmi", version="1", target=TARGET, description="BMI"), replace=True)
+    assert json.loads(registry.tool_definition_bytes("bmi"))["function"]["description"] == "BMI"
+
+def test_tool_definitions_from_manifest_parameters():
+    parameters = {"type": "object", "properties": {}, "required": [], "additionalProperties": False}
+    registry = CalculatorRegistry()
+    registry.register(CalculatorSpec(id="bmi", version="1", target=TARGET, parameters=parameters))
+    tool = registry.tool_definition_bytes("bmi")
+    assert json.loads(tool)["function"]["parameters"] == parameters
+    assert registry.tool_definition_bytes("bmi") is tool
+    assert not registry.is_loaded("bmi")
+    with pytest.raises(ValueError):
+        CalculatorSpec(id="bmi", version="1", target=TARGET, parameters="{}")
+
+def test_builtin_manifest_parameters_match_models():
+    from mc4llm.models import strict_json_schema
+    
+    registry = default_registry()
+    for spec in registry.specs():
+        assert spec.parameters == strict_json_schema(registry.get(spec.id).input_model)
+
+def test_listing_does_not_import_calculators():
+    statement = (
+        "import sys; from mc4llm.registry import default_registry, list_calculators; "
+        "specs = list_calculators(); default_registry().tools_bytes(); "
+        "assert specs and not any(m.startswith('mc4llm.example_calculators') or m in ('pint', 'numpy') "
+        "for m in sys.modules), sorted(sys.modules)"
+    )
+    subprocess.run([sys.executable, "-c", statement], check=True)
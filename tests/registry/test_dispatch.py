@@ -0,0 +1,59 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+from mc4llm.registry import ToolCall, adispatch_tool_calls, default_registry, dispatch_tool_calls, tool_messages_bytes
+
+EXPECTED = SIMPLE_WHO_BMI_CALCULATOR.calculate(BMIInput(weight=70, height=1.75)).model_dump()
+
+CALLS = [
+    ToolCall("a", "simple_who_bmi", b'{"weight": 70, "height": 1.75}'),
+    {"id": "b", "type": "function", "function": {"name": "simple_who_bmi", "arguments": '{"weight": "heavy", "height": 1.75}'}},
+    {"id": "c", "name": "who_bmi_with_units", "input": {"weight": {"value": 70, "unit": "kg"}, "height": [175, "cm"]}},
+    ToolCall("d", "missing_tool", "{}"),
+    ToolCall("e", "simple_who_bmi", "{not json"),
+    {"id": "f", "name": "simple_who_bmi", "arguments": '{"weight": 70, "height": 1.75}'},
+    ToolCall("g", "who_bmi_with_units", '{"weight": {"value": 70, "unit": "parsec"}, "height": [175, "cm"]}'),
+]
+
+def check(results):
+    assert [result.call_id for result in results] == list("abcdefg")
+    assert [result.is_error for result in results] == [False, True, False, True, True, False, True]
+    assert json.loads(results[0].content) == EXPECTED
+    assert json.loads(results[5].content) == EXPECTED
+    assert json.loads(results[2].content)["category"] == EXPECTED["category"]
+    
+    error = json.loads(results[1].content)["error"]
+    assert error["type"] == "invalid_arguments"
+    assert error["details"][0]["loc"] == ["weight"]
+    assert json.loads(results[3].content)["error"]["type"] == "unknown_tool"
+    assert json.loads(results[4].content)["error"]["details"][0]["type"] == "json_invalid"
+    assert json.loads(results[6].content)["error"]["type"] == "invalid_arguments"
+
+def test_dispatch_isolates_errors():
+    check(dispatch_tool_calls(CALLS))
+    with ThreadPoolExecutor(2) as executor:
+        check(dispatch_tool_calls(CALLS, default_registry(), executor))
+
+def test_adispatch():
+    check(asyncio.run(adispatch_tool_calls(CALLS)))
+
+def test_failing_call_does_not_depend_on_its_group():
+    failing = ToolCall("z", "simple_who_bmi", '{"weight": 70, "height": 0}')
+    alone = dispatch_tool_calls([failing])[0]
+    grouped = dispatch_tool_calls([CALLS[0], failing])
+    assert alone.is_error and grouped[1].is_error
+    assert grouped[1].content == alone.content
+    assert json.loads(alone.content)["error"]["type"] == "calculation_error"
+    assert not grouped[0].is_error and json.loads(grouped[0].content) == EXPECTED
+
+def test_tool_messages():
+    results = dispatch_tool_calls(CALLS[:2])
+    messages = json.loads(tool_messages_bytes(results))
+    assert messages[0] == {"role": "tool", "tool_call_id": "a", "content": results[0].content.decode()}
+    assert json.loads(messages[0]["content"]) == EXPECTED
+    
+def test_malformed_call():
+    results = dispatch_tool_calls([{"id": "x"}])
+    assert results[0].is_error and json.loads(results[0].content)["error"]["type"] == "invalid_call"
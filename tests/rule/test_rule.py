@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 from mc4llm.rule.base import BaseRule, BaseClassificationRule
 from mc4llm.rule.range import RangeRule
@@ -84,4 +85,102 @@ def test_classification_rule_interface():
         pass
     
     with pytest.raises(TypeError):
-        IncompleteRule() 
\ No newline at end of file
+        IncompleteRule() 
+
+def _linear_categorize(thresholds, default_category, value):
+    for category, (min_val, max_val) in thresholds.items():
+        if min_val <= value < max_val:
+            return category
+    return default_category
+
+def test_range_rule_gaps_and_infinite_bounds():
+    rule = RangeRule(
+        thresholds={
+            "High": (30, float("inf")),
+            "Low": (float("-inf"), 10),
+            "Mid": (20, 30),
+        },
+        default_category="Gap"
+    )
+    
+    assert rule.categorize(float("-inf")) == "Low"
+    assert rule.categorize(9.999) == "Low"
+    assert rule.categorize(10) == "Gap"  # Upper bounds are exclusive
+    assert rule.categorize(15) == "Gap"
+    assert rule.categorize(20) == "Mid"
+    assert rule.categorize(30) == "High"
+    assert rule.categorize(1e300) == "High"
+    assert rule.categorize(float("inf")) == "Gap"  # inf is not < inf
+    assert rule.categorize(float("nan")) == "Gap"
+
+def test_range_rule_matches_linear_scan():
+    # Many bands with every other interval left as a gap
+    thresholds = {f"band_{i}": (i * 2.0, i * 2.0 + 1.0) for i in range(200)}
+    rule = RangeRule(thresholds=thresholds, default_category="None")
+    
+    values = [x / 4 for x in range(-8, 1610)] + [float("nan"), float("inf"), float("-inf")]
+    for value in values:
+        assert rule.categorize(value) == _linear_categorize(thresholds, "None", value)
+
+def test_range_rule_threshold_reassignment():
+    rule = RangeRule(thresholds={"A": (0, 1)})
+    assert rule.categorize(1.5) == "Unknown"
+    
+    rule.thresholds = {"A": (0, 1), "B": (1, 2)}
+    assert rule.categorize(1.5) == "B"
+    
+    # Invalid thresholds are rejected and the previous ones kept
+    with pytest.raises(ValueError):
+        rule.thresholds = {"A": (0, 2), "B": (1, 3)}
+    assert rule.categorize(1.5) == "B"
+
+def test_range_rule_thresholds_cannot_be_mutated_in_place():
+    thresholds = {"A": (0, 1)}
+    rule = RangeRule(thresholds=thresholds)
+    with pytest.raises(TypeError):
+        rule.thresholds["B"] = (1, 2)  # type: ignore
+    
+    # The rule keeps its own copy of the caller's dict
+    thresholds["B"] = (1, 2)
+    assert rule.thresholds == {"A": (0, 1)}
+    assert rule.categorize(1.5) == "Unknown"
+
+def test_range_rule_categorize_many_matches_scalar():
+    rule = RangeRule(
+        thresholds={
+            "Low": (float("-inf"), 10),
+            "Mid": (20, 30),
+            "High": (30, float("inf")),
+        },
+        default_category="Gap"
+    )
+    values = [float("-inf"), -5, 9.999, 10, 15, 20, 29.99, 30, 1e300, float("inf"), float("nan")]
+    
+    assert rule.categorize_many(values) == [rule.categorize(v) for v in values]
+    
+    codes, labels = rule.categorize_many(np.array(values), return_codes=True)
+    assert codes.dtype == np.int32
+    assert labels == ("Low", "Mid", "High", "Gap")
+    assert [labels[c] for c in codes] == [rule.categorize(v) for v in values]
+    
+    # Empty input
+    assert rule.categorize_many([]) == []
+
+def test_range_rule_categorize_many_random():
+    thresholds = {f"band_{i}": (i * 2.0, i * 2.0 + 1.0) for i in range(100)}
+    rule = RangeRule(thresholds=thresholds, default_category="None")
+    values = np.random.default_rng(0).uniform(-10, 210, size=5000)
+    
+    assert rule.categorize_many(values) == [rule.categorize(v) for v in values.tolist()]
+
+def test_classification_rule_default_categorize_many():
+    class ParityRule(BaseClassificationRule):
+        def categorize(self, value, **kwargs):
+            return "even" if value % 2 == 0 else "odd"
+    
+    rule = ParityRule()
+    assert rule.categorize_many([1, 2, 3]) == ["odd", "even", "odd"]
+    
+    codes, labels = rule.categorize_many([1, 2, 3], return_codes=True)
+    assert labels == ("odd", "even")
+    assert codes.tolist() == [0, 1, 0]
@@ -0,0 +1,159 @@
+import asyncio
+import json
+import threading
+from typing import Any, Dict, Tuple
+
+import pytest
+
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+from mc4llm.registry import default_registry
+from mc4llm.server import RegistryServer
+
+async def send(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, method: str, path: str,
+    payload: Any = None, headers: str = ""
+) -> Tuple[int, Dict[str, str], Any]:
+    body = b"" if payload is None else json.dumps(payload).encode()
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Length: {len(body)}\r\n{headers}\r\n".encode() + body
+    )
+    await writer.drain()
+    head = (await reader.readuntil(b"\r\n\r\n")).decode()
+    status_line, *lines = head.strip().split("\r\n")
+    response_headers = {k.lower(): v.strip() for k, _, v in (line.partition(":") for line in lines)}
+    data = await reader.readexactly(int(response_headers["content-length"]))
+    return int(status_line.split()[1]), response_headers, json.loads(data)
+
+def run_with_server(test, **options):
+    async def main():
+        async with RegistryServer(default_registry(), port=0, **options) as server:
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            try:
+                await test(server, reader, writer)
+            finally:
+                writer.close()
+    asyncio.run(main())
+
+def test_catalog_and_schema():
+    async def test(server, reader, writer):
+        status, _, body = await send(reader, writer, "GET", "/calculators")
+        assert status == 200
+        assert "simple_who_bmi" in [spec["id"] for spec in body["calculators"]]
+        
+        status, headers, body = await send(reader, writer, "GET", "/calculators/who_bmi_with_units")
+        assert status == 200 and headers["connection"] == "keep-alive"
+        assert body["input_schema"]["properties"]["weight"]["required"] == ["value", "unit"]
+        assert body["input_schema"]["additionalProperties"] is False
+        assert body["output_schema"]["required"] == ["bmi", "category"]
+        
+        status, _, body = await send(reader, writer, "GET", "/tools")
+        assert status == 200 and {tool["function"]["name"] for tool in body} >= {"simple_who_bmi", "who_bmi_with_units"}
+        status, _, body = await send(reader, writer, "GET", "/calculators/simple_who_bmi/tool")
+        assert status == 200 and body["function"]["strict"] is True
+        
+        status, _, body = await send(reader, writer, "GET", "/calculators/missing")
+        assert status == 404 and "missing" in body["error"]["message"]
+        status, headers, _ = await send(reader, writer, "POST", "/calculators")
+        assert status == 405 and headers["allow"] == "GET"
+    run_with_server(test)
+
+def test_calculate_and_batch():
+    expected = SIMPLE_WHO_BMI_CALCULATOR.calculate(BMIInput(weight=70, height=1.75)).model_dump()
+    
+    async def test(server, reader, writer):
+        status, _, body = await send(
+            reader, writer, "POST", "/calculators/simple_who_bmi/calculate", {"weight": 70, "height": 1.75}
+        )
+        assert status == 200 and body == expected
+        
+        inputs = [{"weight": 70, "height": 1.75}, {"weight": {"value": 154.32, "unit": "pound"}, "height": [175, "cm"]}]
+        status, _, body = await send(reader, writer, "POST", "/calculators/who_bmi_with_units/batch", {"inputs": inputs[1:]})
+        assert status == 200 and body["results"][0]["category"] == expected["category"]
+        status, _, body = await send(reader, writer, "POST", "/calculators/simple_who_bmi/batch", inputs[:1] * 3)
+        assert status == 200 and body["results"] == [expected] * 3
+        
+        status, _, body = await send(
+            reader, writer, "POST", "/calculators/simple_who_bmi/batch", [{"weight": 70, "height": 1.75}, {"weight": "x"}]
+        )
+        assert status == 422 and body["error"]["details"]["index"] == 1
+        status, _, body = await send(reader, writer, "POST", "/calculators/simple_who_bmi/batch", inputs[:1] * 4)
+        assert status == 413
+    run_with_server(test, max_batch_size=3, offload_single=True)
+
+def test_calculation_errors_are_unprocessable():
+    async def test(server, reader, writer):
+        status, _, body = await send(
+            reader, writer, "POST", "/calculators/simple_who_bmi/calculate", {"weight": 70, "height": 0}
+        )
+        assert status == 422 and "division by zero" in body["error"]["message"]
+        status, _, body = await send(
+            reader, writer, "POST", "/calculators/simple_who_bmi/batch", [{"weight": 70, "height": 1.75}, {"weight": 70, "height": 0}]
+        )
+        assert status == 422 and body["error"]["details"]["index"] == 1
+    run_with_server(test)
+
+def test_tool_calls():
+    calls = [
+        {"id": "a", "type": "function", "function": {"name": "simple_who_bmi", "arguments": '{"weight": 70, "height": 1.75}'}},
+        {"id": "b", "type": "function", "function": {"name": "simple_who_bmi", "arguments": '{"weight": 70}'}},
+    ]
+    
+    async def test(server, reader, writer):
+        status, _, body = await send(reader, writer, "POST", "/tool-calls", {"tool_calls": calls})
+        assert status == 200
+        assert [message["tool_call_id"] for message in body] == ["a", "b"]
+        assert json.loads(body[0]["content"])["category"] == "Normal weight"
+        assert json.loads(body[1]["content"])["error"]["type"] == "invalid_arguments"
+    run_with_server(test)
+
+def test_invalid_json_keeps_connection_open():
+    async def test(server, reader, writer):
+        writer.write(b"POST /calculators/simple_who_bmi/calculate HTTP/1.1\r\nContent-Length: 3\r\n\r\n{x}")
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        assert head.startswith(b"HTTP/1.1 400")
+        await reader.readexactly(int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0]))
+        status, _, _ = await send(reader, writer, "GET", "/health")
+        assert status == 200
+    run_with_server(test)
+
+def test_connection_close():
+    async def test(server, reader, writer):
+        status, headers, _ = await send(reader, writer, "GET", "/health", headers="Connection: close\r\n")
+        assert status == 200 and headers["connection"] == "close"
+        assert await reader.read() == b""
+    run_with_server(test)
+
+def test_back_pressure():
+    release = threading.Event()
+    
+    class BlockingExecutor:
+        """Executor whose jobs wait until the test releases them."""
+        def submit(self, fn, *args):
+            from concurrent.futures import Future
+            future = Future()
+            def run():
+                release.wait()
+                future.set_result(fn(*args))
+            threading.Thread(target=run).start()
+            return future
+    
+    async def test(server, reader, writer):
+        blocked = asyncio.ensure_future(
+            send(reader, writer, "POST", "/calculators/simple_who_bmi/batch", [{"weight": 70, "height": 1.75}])
+        )
+        while server._pending == 0:
+            await asyncio.sleep(0.01)
+        other = await asyncio.open_connection(server.host, server.port)
+        status, headers, _ = await send(*other, "POST", "/calculators/simple_who_bmi/batch", [{"weight": 70, "height": 1.75}])
+        assert status == 503 and headers["retry-after"] == "1"
+        other[1].close()
+        release.set()
+        status, _, _ = await blocked
+        assert status == 200
+    
+    run_with_server(test, executor=BlockingExecutor(), max_pending=1)
+
+def test_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        RegistryServer(default_registry(), max_pending=0)
@@ -0,0 +1,34 @@
+import json
+
+from benchmarks import suite
+
+def make_document(**times):
+    return {"results": {name: {"min_ns": ns, "median_ns": ns, "mean_ns": ns} for name, ns in times.items()}}
+
+def test_compare_flags_regressions():
+    baseline = make_document(fast=100.0, slow=100.0, same=100.0, removed=100.0)
+    current = make_document(fast=80.0, slow=120.0, same=105.0, added=50.0)
+    rows = {row[0]: row for row in suite.compare(current, baseline, threshold=0.10)}
+    assert set(rows) == {"fast", "slow", "same"}
+    assert rows["slow"][4] == "regression" and rows["slow"][3] == 1.2
+    assert rows["fast"][4] == "improvement"
+    assert rows["same"][4] == "ok"
+    assert suite.compare(current, baseline, threshold=0.25)[1][4] == "ok"
+
+def test_suite_covers_hot_paths():
+    prefixes = {name.split(".")[0] for name in suite.CASES}
+    assert {"models", "units", "formula", "rule", "guideline", "calculator"} <= prefixes
+
+def test_run_and_compare_against_baseline(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    options = ["--filter", r"^formula\.standard_bmi$", "--repeats", "2", "--min-time", "0.001"]
+    assert suite.main(options + ["--save-baseline", str(baseline)]) == 0
+    document = json.loads(baseline.read_text())
+    assert list(document["results"]) == ["formula.standard_bmi"]
+    assert document["results"]["formula.standard_bmi"]["min_ns"] > 0
+    
+    # A baseline 1000x faster than reality must be reported as a regression.
+    document["results"]["formula.standard_bmi"]["min_ns"] /= 1000
+    baseline.write_text(json.dumps(document))
+    assert suite.main(options + ["--baseline", str(baseline)]) == 1
+    assert "regression" in capsys.readouterr().out
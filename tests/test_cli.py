@@ -0,0 +1,80 @@
+import io
+import json
+
+import numpy as np
+import pytest
+
+from mc4llm.cli import main, read_rows, score_stream
+from mc4llm.example_calculators.bmi.simple_bmi import BMIInput, SIMPLE_WHO_BMI_CALCULATOR
+from mc4llm.models import ColumnarBatch, ResultBatch
+
+CSV_INPUT = "weight,height,note\n70,1.75,a\nheavy,1.75,b\n85,,c\n120,1.75,\n"
+
+def jsonl_input(count: int) -> bytes:
+    lines = [
+        json.dumps({"weight": 40 + i % 110, "height": 1.5 + (i % 60) / 100}) if i % 50 else '{"weight": "x"}'
+        for i in range(count)
+    ]
+    return ("\n".join(lines) + "\n\n").encode()
+
+def test_read_rows_nests_dotted_csv_columns():
+    rows = list(read_rows(io.StringIO("weight.value,weight.unit,height\n150,pound,1.7\n,,1.8\n"), "csv"))
+    assert rows == [{"weight": {"value": 150.0, "unit": "pound"}, "height": "1.7"}, {"height": "1.8"}]
+    assert list(read_rows(io.BytesIO(b'{"a": 1}\n\n{"a": 2}\n'), "jsonl")) == [b'{"a": 1}\n', b'{"a": 2}\n']
+
+def test_score_csv_to_csv_with_errors():
+    output, errors = io.StringIO(), io.StringIO()
+    report = score_stream("simple_who_bmi", io.StringIO(CSV_INPUT), output, "csv", "csv", chunk_size=2, errors=errors)
+    
+    assert (report.rows, report.scored, report.errors) == (4, 2, 2)
+    lines = output.getvalue().splitlines()
+    assert lines[0] == "bmi,category"
+    assert [line.split(",")[1] for line in lines[1:]] == ["Normal weight", "Obese"]
+    rejected = [json.loads(line) for line in errors.getvalue().splitlines()]
+    assert [(error["row"], error["stage"]) for error in rejected] == [(1, "validation"), (2, "validation")]
+
+def test_workers_match_in_process_scoring():
+    data = jsonl_input(1_000)
+    serial, parallel = io.StringIO(), io.StringIO()
+    reference = "mc4llm.example_calculators.bmi.simple_bmi:SIMPLE_WHO_BMI_CALCULATOR"
+    report = score_stream(reference, io.BytesIO(data), serial, "jsonl", chunk_size=64)
+    parallel_report = score_stream(reference, io.BytesIO(data), parallel, "jsonl", chunk_size=64, workers=2)
+    
+    assert (report.rows, report.scored, report.errors) == (1_000, 980, 20)
+    assert parallel_report.scored == report.scored and parallel_report.errors == report.errors
+    assert parallel.getvalue() == serial.getvalue()
+
+def test_main_writes_files_and_reports(tmp_path, capsys):
+    source = tmp_path / "cohort.jsonl"
+    source.write_bytes(jsonl_input(200))
+    output, errors = tmp_path / "scores.csv", tmp_path / "errors.jsonl"
+    
+    assert main(["simple_who_bmi", str(source), "-o", str(output), "--errors", str(errors), "--chunk-size", "64"]) == 0
+    assert len(output.read_text().splitlines()) == 1 + 196
+    assert len(errors.read_text().splitlines()) == 4
+    assert "200 rows, 196 scored, 4 errors" in capsys.readouterr().err
+    
+    with pytest.raises(SystemExit):
+        main(["not_a_calculator", str(source)])
+    with pytest.raises(SystemExit):
+        main(["simple_who_bmi", str(tmp_path / "cohort.txt")])
+
+def test_main_scores_column_directories(tmp_path, capsys):
+    inputs = BMIInput.columnar(weight=np.linspace(40, 150, 500), height=np.full(500, 1.75))
+    inputs.save(tmp_path / "cohort")
+    
+    assert main(["simple_who_bmi", str(tmp_path / "cohort"), "-o", str(tmp_path / "scores")]) == 0
+    assert "500 rows, 500 scored, 0 errors" in capsys.readouterr().err
+    scores = ResultBatch.load(tmp_path / "scores", SIMPLE_WHO_BMI_CALCULATOR.output_model)
+    assert scores.to_rows() == SIMPLE_WHO_BMI_CALCULATOR.calculate_batch(inputs)
+    
+    with pytest.raises(SystemExit):
+        main(["simple_who_bmi", str(tmp_path / "cohort")])
+    with pytest.raises(SystemExit):
+        main(["simple_who_bmi", str(tmp_path / "cohort"), "-o", str(tmp_path / "cohort")])
+    assert ColumnarBatch.load(tmp_path / "cohort", BMIInput).to_rows() == inputs.to_rows()
+    
+    # A damaged header is reported as a usage error, not a traceback
+    (tmp_path / "cohort" / "columns.json").write_text("[]")
+    with pytest.raises(SystemExit):
+        main(["simple_who_bmi", str(tmp_path / "cohort"), "-o", str(tmp_path / "rescored")])
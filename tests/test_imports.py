@@ -0,0 +1,41 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+import mc4llm
+
+# Upper bound for the cumulative time of a bare `import mc4llm`, in microseconds.
+# Loading pint, numpy or any calculator eagerly takes several times longer.
+IMPORT_TIME_CAP_US = 200_000
+
+def _import_time_report(statement: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    )
+    return result.stderr
+
+def test_bare_import_time():
+    report = _import_time_report("import mc4llm")
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| mc4llm$", report, re.MULTILINE)
+    assert match is not None, report
+    assert int(match.group(1)) < IMPORT_TIME_CAP_US
+    
+    imported = set(re.findall(r"\|\s+([\w.]+)$", report, re.MULTILINE))
+    for heavy in ("pint", "numpy", "pydantic", "mc4llm.example_calculators"):
+        assert heavy not in imported
+
+def test_lazy_exports():
+    assert mc4llm.__all__ == ['Calculator', 'BaseFormula', 'BaseGuideline', 'SIMPLE_WHO_BMI_CALCULATOR']
+    for name in mc4llm.__all__:
+        assert getattr(mc4llm, name) is not None
+        assert name in dir(mc4llm)
+    
+    from mc4llm.example_calculators.bmi.simple_bmi import SIMPLE_WHO_BMI_CALCULATOR
+    assert mc4llm.SIMPLE_WHO_BMI_CALCULATOR is SIMPLE_WHO_BMI_CALCULATOR
+    assert mc4llm.example_calculators.bmi.BMIInput is not None
+    
+    with pytest.raises(AttributeError):
+        mc4llm.not_a_module
@@ -0,0 +1,103 @@
+import logging
+
+import pytest
+from pydantic import Field
+
+from mc4llm import instrumentation
+from mc4llm.instrumentation import HistogramSink, LoggingSink, get_sink, instrument, set_sink
+from mc4llm.models import IOModel
+from mc4llm.example_calculators.bmi.simple_bmi import SIMPLE_WHO_BMI_CALCULATOR, BMICalculator, BMIInput, BMIOutput
+from mc4llm.example_calculators.bmi.bmi_with_units import (
+    BMI_CALCULATOR_WITH_UNITS, BMIInputWithUnits, StandardBMIFormula
+)
+
+def test_stages_are_reported():
+    sink = HistogramSink()
+    with instrument(sink):
+        data = BMIInputWithUnits(weight=(150, "pound"), height=(170, "centimeter"))
+        BMI_CALCULATOR_WITH_UNITS.calculate(data)
+        SIMPLE_WHO_BMI_CALCULATOR.calculate(BMIInput.model_validate_json('{"weight": 70, "height": 1.75}'))
+        SIMPLE_WHO_BMI_CALCULATOR.calculate_columns(BMIInput.columnar(weight=[70, 90], height=[1.75, 1.8]))
+    summary = sink.summary()
+
+    assert set(summary) == {
+        ("validate", "BMIInputWithUnits.__init__"),
+        ("convert", "kilogram"),
+        ("convert", "meter"),
+        ("formula", "standard"),
+        ("rule", "bmi.categorize"),
+        ("rule", "bmi.categorize_many"),
+        ("output", "BMICalculatorWithUnits.build_output"),
+        ("calculate", "BMICalculatorWithUnits.calculate"),
+        ("validate", "BMIInput.model_validate_json"),
+        ("output", "BMICalculator.build_output"),
+        ("calculate", "BMICalculator.calculate"),
+        ("calculate_columns", "BMICalculator.calculate_columns"),
+    }
+    assert summary[("formula", "standard")]["count"] == 3
+    row = summary[("calculate", "BMICalculatorWithUnits.calculate")]
+    assert row["count"] == 1 and row["min_ns"] == row["max_ns"] == row["p50_ns"] > 0
+
+def test_originals_are_restored():
+    calculate = BMICalculator.__dict__["calculate"]
+    formula = StandardBMIFormula.__dict__["calculate"]
+    with instrument(HistogramSink()):
+        assert BMICalculator.__dict__["calculate"] is not calculate
+        assert "__init__" in IOModel.__dict__
+
+        class LateInput(IOModel):
+            value: float = Field(..., description="Value")
+
+        # Models defined while instrumented keep pydantic's fast init path.
+        assert not LateInput.__pydantic_custom_init__
+    assert get_sink() is None
+    assert BMICalculator.__dict__["calculate"] is calculate
+    assert StandardBMIFormula.__dict__["calculate"] is formula
+    assert "__init__" not in IOModel.__dict__
+    assert LateInput(value=1).value == 1
+
+def test_plans_and_caches_pick_up_instrumentation():
+    calculator = BMICalculator(BMIInput, BMIOutput, SIMPLE_WHO_BMI_CALCULATOR.guideline)
+    calculator.enable_cache()
+    calculator.calculate(BMIInput(weight=70, height=1.75))
+    sink = HistogramSink()
+    with instrument(sink):
+        calculator.calculate(BMIInput(weight=80, height=1.75))
+    assert ("formula", "standard") in sink.summary()
+    assert ("calculate", "BMICalculator.calculate") in sink.summary()
+
+def test_nested_sinks_and_errors():
+    outer, inner = HistogramSink(), HistogramSink()
+    with instrument(outer):
+        with instrument(inner):
+            SIMPLE_WHO_BMI_CALCULATOR.calculate(BMIInput(weight=70, height=1.75))
+        assert get_sink() is outer
+        with pytest.raises(ZeroDivisionError):
+            SIMPLE_WHO_BMI_CALCULATOR.guideline.get_formula("standard").calculate(70, 0)
+    assert ("calculate", "BMICalculator.calculate") in inner.summary()
+    assert ("calculate", "BMICalculator.calculate") not in outer.summary()
+    # Failing calls are timed as well.
+    assert outer.summary()[("formula", "standard")]["count"] == 1
+    with pytest.raises(TypeError):
+        set_sink("histogram")
+
+def test_custom_probe_and_logging_sink(caplog):
+    class Service:
+        def run(self, value):
+            return value * 2
+
+    instrumentation.probe(Service, "run", "service")
+    with caplog.at_level(logging.DEBUG, logger="mc4llm.instrumentation"):
+        with instrument(LoggingSink()):
+            assert Service().run(2) == 4
+    assert "service Service.run took" in caplog.text
+
+def test_histogram_percentiles():
+    sink = HistogramSink()
+    for elapsed in [100] * 98 + [5_000, 1_000_000]:
+        sink("stage", "name", elapsed)
+    row = sink.summary()[("stage", "name")]
+    assert row["count"] == 100 and row["min_ns"] == 100 and row["max_ns"] == 1_000_000
+    assert row["p50_ns"] == 127 and row["p99_ns"] == 8191
+    sink.reset()
+    assert sink.summary() == {}